@@ -0,0 +1,70 @@
+import json
+import threading
+from typing import Dict, List
+
+from core.canonical import MoveSignature, ViewKey, resolve_move, view_key
+from core.fileio import save_atomic
+from core.game_view import GameView
+from core.models import Move
+from agents.player_agent import DeadlineAware, PlayerAgent
+
+Book = Dict[ViewKey, MoveSignature]
+
+BOOK_FORMAT = 1
+
+
+def _tuples(value):
+    return tuple(_tuples(v) for v in value) if isinstance(value, list) else value
+
+
+def save_book(path: str, book: Book) -> None:
+    """
+    Write an opening book as compact JSON: one [view key, move signature]
+    pair per entry. Replaced atomically, so readers never see half a file.
+    """
+    data = {"format": BOOK_FORMAT, "entries": [[key, sig] for key, sig in book.items()]}
+    save_atomic(path, data, compact=True)
+
+
+def load_book(path: str) -> Book:
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("format") != BOOK_FORMAT:
+        raise ValueError(f"Unsupported book format: {data.get('format')}")
+    return {_tuples(key): _tuples(sig) for key, sig in data["entries"]}
+
+
+class BookAgent(PlayerAgent):
+    """
+    Plays straight from an opening book (view_key -> move signature, built by
+    sim.opening_book) when the position is in it: one dict lookup, no
+    search. Anything else, or a book move that doesn't fit this view, goes
+    to the fallback agent. Deadlines are passed through to the fallback.
+    """
+
+    def __init__(self, book: Book, fallback: PlayerAgent):
+        self.book = book
+        self.fallback = fallback
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, fallback: PlayerAgent) -> "BookAgent":
+        return cls(load_book(path), fallback)
+
+    def set_deadline(self, deadline: float) -> None:
+        if isinstance(self.fallback, DeadlineAware):
+            self.fallback.set_deadline(deadline)
+
+    def choose_move(self, view: GameView, valid_moves: List[Move]) -> Move:
+        signature = self.book.get(view_key(view))
+        if signature is not None:
+            move = resolve_move(view, valid_moves, signature)
+            if move is not None:
+                with self._lock:
+                    self.hits += 1
+                return move
+        with self._lock:
+            self.misses += 1
+        return self.fallback.choose_move(view, valid_moves)
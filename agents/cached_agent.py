@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import List, NamedTuple
+
+from core.canonical import MoveSignature, ViewKey, move_signature, resolve_move, view_key
+from core.game_view import GameView
+from core.models import Move
+from agents.player_agent import PlayerAgent
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CachedAgent(PlayerAgent):
+    """
+    Bounded LRU memo around another agent's choose_move.
+
+    Only worth it for deterministic agents: decisions are keyed by
+    core.canonical.view_key (suit-insensitive) and stored as move signatures,
+    so a cached decision is replayed onto whichever card of that rank the
+    new view holds. Safe to share between threads; the wrapped agent is
+    called outside the lock.
+    """
+
+    def __init__(self, agent: PlayerAgent, maxsize: int = 65536):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.agent = agent
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[ViewKey, MoveSignature]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def choose_move(self, view: GameView, valid_moves: List[Move]) -> Move:
+        key = view_key(view)
+
+        with self._lock:
+            signature = self._cache.get(key)
+            if signature is not None:
+                self._cache.move_to_end(key)
+
+        if signature is not None:
+            move = resolve_move(view, valid_moves, signature)
+            if move is not None:
+                with self._lock:
+                    self._hits += 1
+                return move
+
+        move = self.agent.choose_move(view, valid_moves)
+        signature = move_signature(view, move)
+
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = signature
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return move
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
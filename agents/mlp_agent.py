@@ -0,0 +1,165 @@
+import threading
+import time
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from core.encoding import ACTION_SIZE, OBS_SIZE, encode_view, move_to_action
+from core.game_view import GameView
+from core.models import Move
+from agents.player_agent import PlayerAgent
+
+
+def save_mlp(path: str, weights: Sequence[np.ndarray], biases: Sequence[np.ndarray]) -> None:
+    """
+    Write MLP parameters in the layout MlpAgent.load expects:
+    W0, b0, W1, b1, ... with W{i} shaped (in, out).
+    """
+    arrays = {}
+    for i, (w, b) in enumerate(zip(weights, biases)):
+        arrays[f"W{i}"] = np.asarray(w, dtype=np.float32)
+        arrays[f"b{i}"] = np.asarray(b, dtype=np.float32)
+    np.savez(path, **arrays)
+
+
+class _Request:
+    __slots__ = ("view", "valid_moves", "move", "error", "done")
+
+    def __init__(self, view: GameView, valid_moves: List[Move]):
+        self.view = view
+        self.valid_moves = valid_moves
+        self.move: Optional[Move] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class MlpAgent(PlayerAgent):
+    """
+    Plays the legal action with the highest value from a small MLP
+    (ReLU hidden layers, linear output over core.encoding's ACTION_SIZE).
+    Inference is plain NumPy, no ML framework needed at serving time.
+
+    choose_moves() evaluates many games in one forward pass. With
+    max_batch > 1, concurrent choose_move() calls from different table
+    threads are also coalesced: callers wait up to batch_timeout seconds for
+    company, then one of them runs the whole batch for everyone.
+    """
+
+    def __init__(
+        self,
+        weights: Sequence[np.ndarray],
+        biases: Sequence[np.ndarray],
+        max_batch: int = 1,
+        batch_timeout: float = 0.002,
+    ):
+        if not weights or len(weights) != len(biases):
+            raise ValueError("Need one bias vector per weight matrix")
+        if weights[0].shape[0] != OBS_SIZE:
+            raise ValueError(
+                f"First layer expects {weights[0].shape[0]} inputs, encoding has {OBS_SIZE}")
+        if weights[-1].shape[1] != ACTION_SIZE:
+            raise ValueError(
+                f"Last layer has {weights[-1].shape[1]} outputs, action space has {ACTION_SIZE}")
+
+        self.weights = [np.asarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.max_batch = max_batch
+        self.batch_timeout = batch_timeout
+
+        self._cond = threading.Condition()
+        self._pending: List[_Request] = []
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "MlpAgent":
+        """Load parameters written by save_mlp (W0, b0, W1, b1, ...)."""
+        with np.load(path) as data:
+            weights: List[np.ndarray] = []
+            biases: List[np.ndarray] = []
+            i = 0
+            while f"W{i}" in data:
+                weights.append(data[f"W{i}"])
+                biases.append(data[f"b{i}"])
+                i += 1
+        return cls(weights, biases, **kwargs)
+
+    # ---------- PlayerAgent ----------
+
+    def choose_move(self, view: GameView, valid_moves: List[Move]) -> Move:
+        if self.max_batch <= 1:
+            return self.choose_moves([view], [valid_moves])[0]
+        return self._choose_move_batched(_Request(view, valid_moves))
+
+    # ---------- batched inference ----------
+
+    def choose_moves(self, views: List[GameView], valid_moves_list: List[List[Move]]) -> List[Move]:
+        """Pick a move for each (view, valid_moves) pair with a single forward pass."""
+        if not views:
+            return []
+
+        x = np.array([encode_view(view) for view in views], dtype=np.float32)
+        values = self.action_values(x)
+
+        chosen: List[Move] = []
+        for row, view, valid_moves in zip(values, views, valid_moves_list):
+            best_move = valid_moves[0]
+            best_value = -np.inf
+            for move in valid_moves:
+                value = row[move_to_action(view, move)]
+                if value > best_value:
+                    best_move, best_value = move, value
+            chosen.append(best_move)
+        return chosen
+
+    def action_values(self, x: np.ndarray) -> np.ndarray:
+        """Forward pass: (batch, OBS_SIZE) features -> (batch, ACTION_SIZE) values."""
+        h = x
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            h = h @ w + b
+            if i < last:
+                np.maximum(h, 0.0, out=h)
+        return h
+
+    def _choose_move_batched(self, request: _Request) -> Move:
+        with self._cond:
+            self._pending.append(request)
+            if len(self._pending) >= self.max_batch:
+                self._cond.notify_all()
+            deadline = time.monotonic() + self.batch_timeout
+
+            while not request.done:
+                still_pending = any(r is request for r in self._pending)
+                if still_pending and (
+                    len(self._pending) >= self.max_batch or time.monotonic() >= deadline
+                ):
+                    # Become the leader: evaluate the oldest batch for everyone
+                    batch = self._pending[: self.max_batch]
+                    del self._pending[: len(batch)]
+                    self._cond.release()
+                    try:
+                        self._run_batch(batch)
+                    finally:
+                        self._cond.acquire()
+                    self._cond.notify_all()
+                    continue
+
+                timeout = max(deadline - time.monotonic(), 0.0) if still_pending else None
+                self._cond.wait(timeout=timeout)
+
+        if request.error is not None:
+            raise request.error
+        return request.move
+
+    def _run_batch(self, batch: List[_Request]) -> None:
+        try:
+            moves = self.choose_moves(
+                [r.view for r in batch], [r.valid_moves for r in batch]
+            )
+            for r, move in zip(batch, moves):
+                r.move = move
+        except BaseException as e:
+            for r in batch:
+                r.error = e
+        finally:
+            for r in batch:
+                r.done = True
@@ -0,0 +1,173 @@
+import math
+import random
+import time
+from typing import List, Optional, Tuple
+
+from core.game import Game
+from core.game_view import GameView
+from core.knowledge import PublicKnowledge
+from core.models import Move
+from agents.player_agent import PlayerAgent
+from agents.search import AnytimeSearch, SearchStats
+
+
+def _cards_left(game: Game, player_index: int) -> int:
+    p = game.players[player_index]
+    return len(p.hand) + len(p.face_up_cards) + len(p.face_down_cards)
+
+
+def rollout_reward(game: Game, player_index: int) -> float:
+    """
+    1.0 for a win, 0.0 for a loss. Playouts cut off before the end score by
+    cards left: mine against the best-placed opponent's.
+    """
+    winner = game._winner_index
+    if winner is not None:
+        return 1.0 if winner == player_index else 0.0
+    mine = _cards_left(game, player_index)
+    best_other = min(
+        _cards_left(game, i) for i in range(len(game.players)) if i != player_index
+    )
+    return best_other / (mine + best_other)
+
+
+class RootSearch:
+    """
+    Determinized flat Monte Carlo search with UCB1 at the root.
+
+    Every iteration re-deals the cards hidden from the searching player
+    (Game.resample_hidden, or PublicKnowledge.resample when a tracker is
+    given, so opponents keep the cards they were seen picking up), plays
+    one root move plus a random playout with push_move(), scores it and
+    unwinds with pop_move(). The private copy of the game is reused for the
+    whole decision; nothing is cloned per iteration.
+    """
+
+    def __init__(self, game: Game, player_index: int, moves: List[Move],
+                 rng: random.Random, exploration: float = 1.4, rollout_limit: int = 200,
+                 knowledge: Optional[PublicKnowledge] = None):
+        self.game = game
+        self.player_index = player_index
+        self.moves = moves
+        self.rng = rng
+        self.exploration = exploration
+        self.rollout_limit = rollout_limit
+        self.knowledge = knowledge
+        self.visits = [0] * len(moves)
+        self.rewards = [0.0] * len(moves)
+        self.total_visits = 0
+        self.depth = 0
+
+    def _select(self) -> int:
+        best_i = 0
+        best_score = -1.0
+        log_total = math.log(self.total_visits) if self.total_visits else 0.0
+        for i, n in enumerate(self.visits):
+            if n == 0:
+                return i
+            score = self.rewards[i] / n + self.exploration * math.sqrt(log_total / n)
+            if score > best_score:
+                best_i, best_score = i, score
+        return best_i
+
+    def iterate(self) -> int:
+        game = self.game
+        rng = self.rng
+        if self.knowledge is not None:
+            self.knowledge.resample(game, self.player_index, rng)
+        else:
+            game.resample_hidden(self.player_index, rng)
+
+        i = self._select()
+        game.push_move(self.moves[i])
+        plies = 1
+        while game._winner_index is None and plies < self.rollout_limit:
+            moves = game.get_valid_moves(game.current_player_index)
+            if not moves:
+                break
+            game.push_move(rng.choice(moves))
+            plies += 1
+
+        reward = rollout_reward(game, self.player_index)
+        while game.undo_depth:
+            game.pop_move()
+
+        self.visits[i] += 1
+        self.rewards[i] += reward
+        self.total_visits += 1
+        self.depth = max(self.depth, plies)
+        return plies
+
+    def best_move(self) -> Move:
+        # Most-visited root move: the robust choice under a time cutoff
+        best = max(range(len(self.moves)), key=lambda i: (self.visits[i], self.rewards[i]))
+        return self.moves[best]
+
+
+class MonteCarloAgent(PlayerAgent):
+    """
+    Search-based agent: runs RootSearch against a per-move deadline and
+    plays the best move found so far.
+
+    It needs the live Game to sample from, but only through
+    resample_hidden(), so cards it can't see are re-dealt on every playout.
+    The controller sets the deadline through set_deadline(); without one,
+    each decision gets move_time seconds. Cumulative statistics (nodes/sec,
+    depth reached, deadline misses) are kept in `stats`, the latest
+    decision's in `last_stats`. Pass a PublicKnowledge tracker attached to
+    the same game to sample opponents' hands consistently with what was
+    seen.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        player_index: int,
+        move_time: float = 0.05,
+        rollout_limit: int = 200,
+        exploration: float = 1.4,
+        rng: Optional[random.Random] = None,
+        search: Optional[AnytimeSearch] = None,
+        knowledge: Optional[PublicKnowledge] = None,
+    ):
+        self.game = game
+        self.player_index = player_index
+        self.move_time = move_time
+        self.rollout_limit = rollout_limit
+        self.exploration = exploration
+        self.rng = rng if rng is not None else random.Random()
+        self.search = search if search is not None else AnytimeSearch()
+        self.knowledge = knowledge
+        self.stats = SearchStats()
+        self.last_stats: Optional[SearchStats] = None
+        self._deadline: Optional[float] = None
+
+    def set_deadline(self, deadline: float) -> None:
+        self._deadline = deadline
+
+    def choose_move(self, view: GameView, valid_moves: List[Move]) -> Move:
+        deadline = self._deadline
+        self._deadline = None
+        if deadline is None:
+            deadline = time.perf_counter() + self.move_time
+
+        if len(valid_moves) == 1:
+            self.last_stats = SearchStats(decisions=1)
+            return valid_moves[0]
+
+        move, stats = self._search(valid_moves, deadline)
+        self.last_stats = stats
+        self.stats.add(stats)
+        return move
+
+    def _search(self, valid_moves: List[Move], deadline: float) -> Tuple[Move, SearchStats]:
+        problem = RootSearch(
+            self.game.clone(rng=self.rng),
+            self.player_index,
+            valid_moves,
+            self.rng,
+            exploration=self.exploration,
+            rollout_limit=self.rollout_limit,
+            knowledge=self.knowledge,
+        )
+        return self.search.run(problem, deadline)
@@ -0,0 +1,130 @@
+import os
+import random
+import time
+from multiprocessing import Pool
+from typing import List, Optional, Tuple
+
+from core.game import Game
+from core.knowledge import PublicKnowledge
+from core.models import Move
+from core.rules import RuleSet
+from core.state_codec import SharedStateBuffer, attached_buffer
+from agents.monte_carlo_agent import MonteCarloAgent, RootSearch
+from agents.search import AnytimeSearch, SearchStats
+
+# (shared buffer layout, slot, rules, knowledge, player_index, root moves, seed,
+#  seconds, exploration, rollout_limit, max_iterations)
+_BufferLayout = Tuple[str, int, int, int]
+_WorkerTask = Tuple[_BufferLayout, int, RuleSet, Optional[PublicKnowledge], int, List[Move],
+                    int, float, float, int, Optional[int]]
+_WorkerResult = Tuple[List[int], List[float], SearchStats]
+
+
+def _search_worker(task: _WorkerTask) -> _WorkerResult:
+    """
+    Runs in a pool process: decode the game straight out of the shared
+    state buffer and search it with an independent RNG stream (so each
+    worker samples its own determinizations) until the time budget runs
+    out.
+    """
+    (layout, slot, rules, knowledge, player_index, moves, seed, budget, exploration,
+     rollout_limit, max_iterations) = task
+    rng = random.Random(seed)
+    problem = RootSearch(
+        attached_buffer(*layout).read(slot, rng=rng, rules=rules),
+        player_index,
+        moves,
+        rng,
+        exploration=exploration,
+        rollout_limit=rollout_limit,
+        knowledge=knowledge,
+    )
+    search = AnytimeSearch(max_iterations=max_iterations)
+    _, stats = search.run(problem, time.perf_counter() + budget)
+    return problem.visits, problem.rewards, stats
+
+
+class RootParallelMonteCarloAgent(MonteCarloAgent):
+    """
+    MonteCarloAgent with root parallelization: every worker process runs
+    RootSearch on the same position with its own determinizations, and the
+    root visit counts and rewards are summed before picking the
+    most-visited move.
+
+    The position is written once per decision into a core.state_codec
+    shared-memory slot that the workers decode in place, so only the slot's
+    name and a handful of scalars are pickled per task. The process pool and
+    the buffer are created with the agent, so process startup never eats
+    into a move budget, and reused for every decision; call close() (or use
+    the agent as a context manager) when the game is done. `ipc_margin`
+    seconds of the move budget are kept back for handing the work out and
+    collecting the counts.
+    """
+
+    def __init__(self, game: Game, player_index: int, workers: Optional[int] = None,
+                 ipc_margin: float = 0.005, max_iterations: Optional[int] = None, **kwargs):
+        super().__init__(game, player_index, **kwargs)
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.ipc_margin = ipc_margin
+        # Per-worker iteration cap; mainly for reproducible tests
+        self.max_iterations = max_iterations
+        self.last_visits: List[int] = []
+        self._pool: Optional[Pool] = None
+        self._states: Optional[SharedStateBuffer] = None
+        self.start()
+
+    def start(self) -> None:
+        """Start the worker pool and the shared state buffer (again, after close())."""
+        if self._pool is None:
+            self._pool = Pool(self.workers)
+        if self._states is None:
+            self._states = SharedStateBuffer.for_game(self.game)
+
+    def _search(self, valid_moves: List[Move], deadline: float) -> Tuple[Move, SearchStats]:
+        self.start()
+        start = time.perf_counter()
+        budget = max(deadline - start - self.ipc_margin, 0.0)
+        self._states.write(0, self.game)
+        layout = self._states.layout
+        tasks = [
+            (layout, 0, self.game.rules, self.knowledge, self.player_index, valid_moves,
+             self.rng.getrandbits(64), budget, self.exploration, self.rollout_limit,
+             self.max_iterations)
+            for _ in range(self.workers)
+        ]
+
+        visits = [0] * len(valid_moves)
+        rewards = [0.0] * len(valid_moves)
+        merged = SearchStats(decisions=1)
+        for worker_visits, worker_rewards, stats in self._pool.map(_search_worker, tasks):
+            for i in range(len(valid_moves)):
+                visits[i] += worker_visits[i]
+                rewards[i] += worker_rewards[i]
+            merged.iterations += stats.iterations
+            merged.nodes += stats.nodes
+            merged.max_depth = max(merged.max_depth, stats.max_depth)
+
+        best = max(range(len(valid_moves)), key=lambda i: (visits[i], rewards[i]))
+        self.last_visits = visits
+
+        finished = time.perf_counter()
+        merged.seconds = finished - start
+        if finished > deadline:
+            merged.deadline_misses = 1
+            merged.worst_overrun = finished - deadline
+        return valid_moves[best], merged
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._states is not None:
+            self._states.close()
+            self._states = None
+
+    def __enter__(self) -> "RootParallelMonteCarloAgent":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
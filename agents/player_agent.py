@@ -1,4 +1,4 @@
-from typing import Protocol, List
+from typing import Protocol, List, runtime_checkable
 from core.game_view import GameView
 from core.models import Move
 
@@ -11,3 +11,26 @@ class PlayerAgent(Protocol):
 
     def choose_move(self, view: GameView, valid_moves: List[Move]) -> Move:
         ...
+
+
+@runtime_checkable
+class DeadlineAware(Protocol):
+    """
+    Agents that search against the clock. The controller calls set_deadline()
+    with an absolute time.perf_counter() value just before choose_move().
+    """
+
+    def set_deadline(self, deadline: float) -> None:
+        ...
+
+
+@runtime_checkable
+class ViewObserver(Protocol):
+    """
+    Agents that want to see every turn, not just their own (remote players,
+    UIs). The controller calls observe() with each such agent's own view
+    after every move.
+    """
+
+    def observe(self, view: GameView) -> None:
+        ...
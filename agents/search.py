@@ -0,0 +1,93 @@
+import time
+from dataclasses import dataclass
+from typing import Optional, Protocol, Tuple
+
+from core.models import Move
+
+
+class SearchProblem(Protocol):
+    """
+    One decision's worth of anytime search. iterate() does a small, bounded
+    amount of work and returns how many nodes (plies) it visited;
+    best_move() must be answerable after any number of iterations.
+    """
+
+    def iterate(self) -> int:
+        ...
+
+    def best_move(self) -> Move:
+        ...
+
+    @property
+    def depth(self) -> int:
+        ...
+
+
+@dataclass
+class SearchStats:
+    decisions: int = 0
+    iterations: int = 0
+    nodes: int = 0
+    seconds: float = 0.0
+    max_depth: int = 0
+    deadline_misses: int = 0
+    worst_overrun: float = 0.0   # seconds past the deadline, worst case
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    def add(self, other: "SearchStats") -> None:
+        self.decisions += other.decisions
+        self.iterations += other.iterations
+        self.nodes += other.nodes
+        self.seconds += other.seconds
+        self.max_depth = max(self.max_depth, other.max_depth)
+        self.deadline_misses += other.deadline_misses
+        self.worst_overrun = max(self.worst_overrun, other.worst_overrun)
+
+
+class AnytimeSearch:
+    """
+    Drives a SearchProblem until a wall-clock deadline (time.perf_counter()
+    seconds) and returns the best move found so far.
+
+    Iterations are never interrupted, so the driver stops early when the
+    slowest iteration seen so far would not fit before the deadline; `margin`
+    is held back on top of that for returning the move. At least
+    `min_iterations` always run, even if the deadline has already passed.
+    """
+
+    def __init__(self, margin: float = 0.001, min_iterations: int = 1,
+                 max_iterations: Optional[int] = None):
+        self.margin = margin
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+
+    def run(self, problem: SearchProblem, deadline: float) -> Tuple[Move, SearchStats]:
+        stats = SearchStats(decisions=1)
+        start = time.perf_counter()
+        now = start
+        slowest = 0.0
+
+        while True:
+            if stats.iterations >= self.min_iterations:
+                if now + slowest + self.margin >= deadline:
+                    break
+                if self.max_iterations is not None and stats.iterations >= self.max_iterations:
+                    break
+
+            stats.nodes += problem.iterate()
+            stats.iterations += 1
+            after = time.perf_counter()
+            slowest = max(slowest, after - now)
+            now = after
+
+        move = problem.best_move()
+        finished = time.perf_counter()
+        stats.seconds = finished - start
+        stats.max_depth = problem.depth
+        if finished > deadline:
+            stats.deadline_misses = 1
+            stats.worst_overrun = finished - deadline
+        return move, stats
@@ -12,12 +12,26 @@ class SimpleAIAgent(PlayerAgent):
     You can improve this later (e.g. prefer not picking up, avoid burning good cards, etc.)
     """
 
-    def __init__(self, output_fn=print, name: str = "AI"):
+    def __init__(self, output_fn=print, name: str = "AI", rng=None):
         self.output_fn = output_fn
         self.name = name
+        # Pass a seeded random.Random for reproducible games
+        self.rng = rng if rng is not None else random
+
+    def __getstate__(self) -> dict:
+        # Same as Deck: the random module itself can't be pickled
+        state = self.__dict__.copy()
+        if state["rng"] is random:
+            state["rng"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self.rng is None:
+            self.rng = random
 
     def choose_move(self, view: GameView, valid_moves: List[Move]) -> Move:
-        move = random.choice(valid_moves)
+        move = self.rng.choice(valid_moves)
         self.output_fn(f"{self.name} chooses: {self._describe(view, move)}")
         return move
 
@@ -0,0 +1,393 @@
+"""
+Browser/remote players over plain HTTP/1.1 long-polling (stdlib only).
+
+Each remote player is a client session, identified by a client id of its
+choosing, that lives on the WebAgentServer across any number of games. The
+server keeps two copies of what the client should see, as small JSON-ready
+dicts: what the client already has and the latest state. A poll is answered
+with the diff between them, so bursts of updates inside `frame_window`
+seconds go out as one small message instead of one full view per change.
+Connections are keep-alive, so a client polls, posts moves and moves on to
+the next game over the same socket.
+
+Protocol (all JSON):
+    GET  /poll?client=ID&since=SEQ   -> {"seq": n, "diff": {...}} or
+                                        {"seq": n, "full": {...}}; a full
+                                        state is sent whenever SEQ is not the
+                                        last seq the server sent this client
+    POST /move  {"client", "turn", "move"}  -> {"ok": true}; "move" indexes
+                                        the state's "moves" list
+
+The state carries the player's GameView fields plus "game" (a counter that
+bumps per game), "turn" and "moves" (descriptions of the valid moves, empty
+while it is not this player's turn). Hand and face-up changes are sent as
+{"add": [...], "remove": [...]} card multisets.
+"""
+import http.client
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from core.game_view import GameView
+from core.models import Card, Move
+from agents.player_agent import PlayerAgent
+
+State = Dict[str, Any]
+
+# Keys sent as multiset deltas rather than whole values
+_CARD_LIST_KEYS = ("hand", "face_up")
+
+
+def _card(card: Optional[Card]) -> Optional[List[str]]:
+    return None if card is None else [card.rank, card.suit]
+
+
+def view_to_dict(view: GameView) -> State:
+    pv = view.player_view
+    return {
+        "name": pv.name,
+        "current": view.current_player_name,
+        "deck": view.deck_remaining,
+        "pile": view.discard_pile_size,
+        "top": _card(view.discard_top_effective),
+        "reversed": view.is_reversed,
+        "hand": [_card(c) for c in pv.hand],
+        "face_up": [_card(c) for c in pv.face_up],
+        "face_down": pv.face_down_count,
+    }
+
+
+def describe_move(view: GameView, move: Move) -> str:
+    if move.kind == "pickup":
+        return "pick up the pile"
+    if move.source == "hand":
+        return f"play {view.player_view.hand[move.index]} from hand"
+    if move.source == "face_up":
+        return f"play {view.player_view.face_up[move.index]} from face-up cards"
+    return f"play face-down card {move.index}"
+
+
+def _cards_delta(before: List[List[str]], after: List[List[str]]) -> Dict[str, List[List[str]]]:
+    old = Counter(map(tuple, before))
+    new = Counter(map(tuple, after))
+    return {
+        "add": [list(c) for c in (new - old).elements()],
+        "remove": [list(c) for c in (old - new).elements()],
+    }
+
+
+def view_diff(old: State, new: State) -> State:
+    """Keys of `new` that differ from `old`; card lists as add/remove deltas."""
+    diff: State = {}
+    for key, value in new.items():
+        before = old.get(key)
+        if value == before:
+            continue
+        if key in _CARD_LIST_KEYS and before is not None:
+            diff[key] = _cards_delta(before, value)
+        else:
+            diff[key] = value
+    return diff
+
+
+def apply_diff(state: State, diff: State) -> State:
+    """Client side of view_diff(): return the updated state."""
+    out = dict(state)
+    for key, value in diff.items():
+        if key in _CARD_LIST_KEYS and isinstance(value, dict):
+            cards = list(out.get(key, []))
+            for card in value["remove"]:
+                cards.remove(card)
+            cards.extend(value["add"])
+            out[key] = cards
+        else:
+            out[key] = value
+    return out
+
+
+class _Session:
+    """One client's delivery state. Every field is guarded by `cond`."""
+
+    def __init__(self, frame_window: float):
+        self.frame_window = frame_window
+        self.cond = threading.Condition()
+        self.sent: State = {}
+        self.latest: State = {"game": 0, "turn": 0, "moves": []}
+        self.seq = 0
+        self.dirty_at: Optional[float] = None   # when the oldest unsent change arrived
+        self.answer: Optional[Tuple[int, int]] = None
+
+    def update(self, **fields: Any) -> None:
+        with self.cond:
+            self.latest = {**self.latest, **fields}
+            if self.dirty_at is None:
+                self.dirty_at = time.monotonic()
+            self.cond.notify_all()
+
+    def poll(self, since: int, timeout: float) -> Dict[str, Any]:
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            resync = since != self.seq
+            while self.dirty_at is None and not resync:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return {"seq": self.seq, "diff": {}}
+                self.cond.wait(remaining)
+
+            # Hold the first change for the rest of the frame window so
+            # anything else arriving meanwhile rides in the same message
+            if self.dirty_at is not None:
+                flush_at = min(self.dirty_at + self.frame_window, deadline)
+                while (remaining := flush_at - time.monotonic()) > 0:
+                    self.cond.wait(remaining)
+
+            self.seq += 1
+            if resync:
+                message = {"seq": self.seq, "full": self.latest}
+            else:
+                message = {"seq": self.seq, "diff": view_diff(self.sent, self.latest)}
+            self.sent = self.latest
+            self.dirty_at = None
+            return message
+
+    def post_move(self, turn: int, index: int) -> bool:
+        with self.cond:
+            moves = self.latest["moves"]
+            stale = turn != self.latest["turn"] or self.answer is not None
+            if stale or not 0 <= index < len(moves):
+                return False
+            self.answer = (turn, index)
+            self.cond.notify_all()
+            return True
+
+    def wait_move(self, turn: int, timeout: Optional[float]) -> Optional[int]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.cond:
+            while self.answer is None or self.answer[0] != turn:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.cond.wait(remaining)
+            _, index = self.answer
+            self.answer = None
+            return index
+
+
+class WebAgent(PlayerAgent):
+    """
+    PlayerAgent for a remote client session. choose_move() publishes the
+    view and the move list, then blocks until the client posts a choice.
+    After `move_timeout` seconds without an answer (None waits forever) the
+    first valid move is played so one absent player can't stall a table.
+    """
+
+    def __init__(self, session: _Session, move_timeout: Optional[float] = None):
+        self.session = session
+        self.move_timeout = move_timeout
+        self.timeouts = 0
+        with session.cond:
+            game = session.latest["game"] + 1
+        session.update(game=game, moves=[])
+
+    def observe(self, view: GameView) -> None:
+        self.session.update(**view_to_dict(view))
+
+    def choose_move(self, view: GameView, valid_moves: List[Move]) -> Move:
+        session = self.session
+        with session.cond:
+            turn = session.latest["turn"] + 1
+            session.answer = None
+        session.update(turn=turn, moves=[describe_move(view, m) for m in valid_moves],
+                       **view_to_dict(view))
+
+        index = session.wait_move(turn, self.move_timeout)
+        session.update(moves=[])
+        if index is None:
+            self.timeouts += 1
+            return valid_moves[0]
+        return valid_moves[index]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive: one socket per client across turns and games
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # small reply on a kept-alive socket waits out the client's delayed ACK
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path != "/poll":
+            self._send(404, {"error": "not found"})
+            return
+        query = parse_qs(url.query)
+        try:
+            client = query["client"][0]
+            since = int(query.get("since", ["-1"])[0])
+            timeout = min(float(query.get("timeout", [self.server.owner.poll_timeout])[0]),
+                          self.server.owner.poll_timeout)
+        except (KeyError, ValueError):
+            self._send(400, {"error": "expected client, since and optional timeout"})
+            return
+        session = self.server.owner.find_session(client)
+        if session is None:
+            self._send(404, {"error": "unknown client"})
+            return
+        self._send(200, session.poll(since, timeout))
+
+    def do_POST(self) -> None:
+        if self.path != "/move":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length))
+            client, turn, index = body["client"], int(body["turn"]), int(body["move"])
+            if not isinstance(client, str):
+                raise TypeError("client id must be a string")
+        except (ValueError, KeyError, TypeError):
+            self._send(400, {"error": "expected JSON with client, turn and move"})
+            return
+        session = self.server.owner.find_session(client)
+        if session is None:
+            self._send(404, {"error": "unknown client"})
+        elif session.post_move(turn, index):
+            self._send(200, {"ok": True})
+        else:
+            self._send(409, {"ok": False, "error": "not your turn or no such move"})
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "WebAgentServer"
+
+
+class WebAgentServer:
+    """
+    Local HTTP server hosting any number of WebAgent sessions. Start it,
+    hand out agent(client_id) to a GameController per game, and point
+    clients at `url`. Only client ids registered through agent() or
+    session() are served; requests for any other id get a 404, so clients
+    can't make the server hold sessions for them. Serves on a background
+    thread; port 0 picks a free port.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, frame_window: float = 0.02,
+                 poll_timeout: float = 25.0, move_timeout: Optional[float] = None):
+        self.frame_window = frame_window
+        self.poll_timeout = poll_timeout
+        self.move_timeout = move_timeout
+        self._sessions: Dict[str, _Session] = {}
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        host, port = self._httpd.server_address[:2]
+        return host, port
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def session(self, client_id: str) -> _Session:
+        """The client's session, registered on first use."""
+        with self._lock:
+            session = self._sessions.get(client_id)
+            if session is None:
+                session = self._sessions[client_id] = _Session(self.frame_window)
+            return session
+
+    def find_session(self, client_id: str) -> Optional[_Session]:
+        with self._lock:
+            return self._sessions.get(client_id)
+
+    def agent(self, client_id: str) -> WebAgent:
+        """A fresh agent for one game, bound to the client's long-lived session."""
+        return WebAgent(self.session(client_id), self.move_timeout)
+
+    def start(self) -> "WebAgentServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                            kwargs={"poll_interval": 0.05}, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "WebAgentServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class WebClient:
+    """
+    Minimal Python client for the protocol above (tests, bots, load
+    generators). Holds one persistent connection and the reconstructed state.
+    """
+
+    def __init__(self, url: str, client_id: str, timeout: float = 30.0):
+        parsed = urlparse(url)
+        self.conn = http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=timeout)
+        self.client_id = client_id
+        self.state: State = {}
+        self.seq = -1
+        self.bytes_received = 0
+
+    def _request(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[int, Any]:
+        payload = None if body is None else json.dumps(body).encode()
+        headers = {} if payload is None else {"Content-Type": "application/json"}
+        self.conn.request(method, path, body=payload, headers=headers)
+        response = self.conn.getresponse()
+        raw = response.read()
+        self.bytes_received += len(raw)
+        return response.status, json.loads(raw)
+
+    def poll(self, timeout: Optional[float] = None) -> State:
+        query = {"client": self.client_id, "since": self.seq}
+        if timeout is not None:
+            query["timeout"] = timeout
+        path = f"/poll?{urlencode(query)}"
+        status, message = self._request("GET", path)
+        if status != 200:
+            raise RuntimeError(f"poll failed ({status}): {message.get('error')}")
+        if "full" in message:
+            self.state = dict(message["full"])
+        else:
+            self.state = apply_diff(self.state, message["diff"])
+        self.seq = message["seq"]
+        return self.state
+
+    def send_move(self, index: int) -> bool:
+        status, _ = self._request("POST", "/move", {
+            "client": self.client_id, "turn": self.state["turn"], "move": index,
+        })
+        return status == 200
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,65 @@
+"""
+Per-turn latency vs. player count.
+
+Plays seeded random games at each table size and reports the mean cost of
+one turn (view + valid moves + agent + apply_move + end_turn). The numbers
+should stay roughly flat from 2 to 16 players.
+
+Run with: python -m benchmarks.bench_players [--turns N]
+"""
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from core.game import Game, decks_needed
+
+PLAYER_COUNTS = [2, 4, 6, 8, 12, 16]
+
+
+def time_turns(num_players: int, turns: int, seed: int = 0) -> Tuple[float, int]:
+    """Return (seconds spent in turns, turns played) over enough games to reach `turns`."""
+    rng = random.Random(seed)
+    elapsed = 0.0
+    played = 0
+
+    while played < turns:
+        game = Game(num_players=num_players, rng=rng)
+        game.start()
+
+        start = time.perf_counter()
+        while not game.is_game_over() and played < turns:
+            pid = game.current_player_index
+            game.get_view_for_player(pid)
+            moves = game.get_valid_moves(pid)
+            if not moves:
+                game.advance_turn()
+                continue
+            game.apply_move(pid, rng.choice(moves))
+            game.end_turn()
+            played += 1
+        elapsed += time.perf_counter() - start
+
+    return elapsed, played
+
+
+def run(turns: int) -> List[Tuple[int, int, float]]:
+    rows = []
+    for n in PLAYER_COUNTS:
+        elapsed, played = time_turns(n, turns)
+        rows.append((n, decks_needed(n), elapsed / played * 1e6))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=50_000, help="turns timed per table size")
+    args = parser.parse_args()
+
+    print(f"{'players':>7}  {'decks':>5}  {'us/turn':>8}")
+    for players, decks, micros in run(args.turns):
+        print(f"{players:>7}  {decks:>5}  {micros:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
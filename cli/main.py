@@ -1,10 +1,14 @@
 # cli/main.py
-from core.game import Game
-from controller.game_controller import GameController
-from agents.cli_human_agent import CliHumanAgent
-from agents.simple_ai_agent import SimpleAIAgent
+# Agent and controller imports live inside main() so importing this module
+# (or spawning a worker that unpickles something from it) stays cheap; only
+# an interactive game pulls in the full agent stack.
 
 def main():
+    from core.game import Game
+    from controller.game_controller import GameController
+    from agents.cli_human_agent import CliHumanAgent
+    from agents.simple_ai_agent import SimpleAIAgent
+
     game = Game(num_players=2)
     agents = {
         0: CliHumanAgent(),
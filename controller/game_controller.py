@@ -1,14 +1,18 @@
-from typing import Dict
+import time
+from typing import Dict, Optional
 from core.game import Game
 from core.models import Move
 from core.game_view import GameView
-from agents.player_agent import PlayerAgent  # Protocol: choose_move(view, valid_moves) -> Move
+# Protocol: choose_move(view, valid_moves) -> Move
+from agents.player_agent import DeadlineAware, PlayerAgent, ViewObserver
 
 class GameController:
-    def __init__(self, game: Game, agents: Dict[int, PlayerAgent], output_fn=print):
+    def __init__(self, game: Game, agents: Dict[int, PlayerAgent], output_fn=print,
+                 move_time: Optional[float] = None):
         self.game = game
         self.agents = agents     # dict[player_index] -> PlayerAgent
         self.output_fn = output_fn
+        self.move_time = move_time   # seconds per decision for DeadlineAware agents
 
     def run(self) -> None:
         self.game.start()
@@ -30,8 +34,11 @@ class GameController:
         if not valid_moves:
             self.output_fn(f"\n{view.player_view.name} has no valid moves. Skipping turn.")
             self.game.advance_turn()
+            self._broadcast()
             return
 
+        if self.move_time is not None and isinstance(agent, DeadlineAware):
+            agent.set_deadline(time.perf_counter() + self.move_time)
         move = agent.choose_move(view, valid_moves)
 
         self.game.apply_move(pid, move)
@@ -48,4 +55,12 @@ class GameController:
                 self.game.advance_turn()
             else:
                 # Same player goes again – optional debug output:
-                self.output_fn(f"{view.player_view.name} gets another turn!")
\ No newline at end of file
+                self.output_fn(f"{view.player_view.name} gets another turn!")
+
+        self._broadcast()
+
+    def _broadcast(self) -> None:
+        """Push the new position to every agent that watches the table."""
+        for i, agent in self.agents.items():
+            if isinstance(agent, ViewObserver):
+                agent.observe(self.game.get_view_for_player(i))
\ No newline at end of file
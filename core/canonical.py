@@ -0,0 +1,101 @@
+from typing import Hashable, List, Optional, Tuple
+
+from core.game_view import GameView
+from core.models import Move
+
+# The rules only ever compare card values, so two views that differ only in
+# suits (or in the order of cards in hand) are the same decision. The helpers
+# here reduce views and moves to suit-insensitive, hashable forms.
+
+ViewKey = Tuple[Hashable, ...]
+MoveSignature = Tuple[str, int]
+
+# Pile sizes 0, 1, 2-3, 4-7, 8-15, 16-31, 32+
+MAX_PILE_BUCKET = 6
+
+
+def pile_size_bucket(size: int) -> int:
+    """Coarse log2 bucket for the discard pile size."""
+    return min(size.bit_length(), MAX_PILE_BUCKET)
+
+
+def view_key(view: GameView) -> ViewKey:
+    """
+    Canonical key for a GameView: sorted hand values, sorted face-up values,
+    face-down count, effective top value (0 for none), reversed flag and a
+    bucketed pile size.
+    """
+    pv = view.player_view
+    top = view.discard_top_effective
+    return (
+        tuple(sorted(card.value for card in pv.hand)),
+        tuple(sorted(card.value for card in pv.face_up)),
+        pv.face_down_count,
+        top.value if top is not None else 0,
+        view.is_reversed,
+        pile_size_bucket(view.discard_pile_size),
+    )
+
+
+def move_signature(view: GameView, move: Move) -> MoveSignature:
+    """
+    Suit-insensitive description of a move: the card value played from hand
+    or face-up, the position for a blind face-down play, or pickup.
+    """
+    if move.kind == "pickup":
+        return ("pickup", 0)
+    if move.source == "hand":
+        return ("hand", view.player_view.hand[move.index].value)
+    if move.source == "face_up":
+        return ("face_up", view.player_view.face_up[move.index].value)
+    if move.source == "face_down":
+        return ("face_down", move.index)
+    raise ValueError(f"Unknown source: {move.source}")
+
+
+def resolve_move(view: GameView, valid_moves: List[Move],
+                 signature: MoveSignature) -> Optional[Move]:
+    """Find a valid move matching the signature in this view, or None."""
+    for move in valid_moves:
+        if move_signature(view, move) == signature:
+            return move
+    return None
+
+
+# ---------- full game state ----------
+
+StateKey = Tuple[Hashable, ...]
+
+
+def _values(cards) -> Tuple[int, ...]:
+    return tuple(card.value for card in cards)
+
+
+def _sorted_values(cards) -> Tuple[int, ...]:
+    return tuple(sorted(card.value for card in cards))
+
+
+def state_key(game) -> StateKey:
+    """
+    Canonical, hashable form of a full Game state with suits folded away.
+
+    Hand, face-up and face-down cards are multisets here: which position a
+    card sits in doesn't change the value of the position, only the move
+    indices. Deck and discard pile keep their order since draws and burns
+    depend on it. Any suit permutation of a state maps to the same key.
+    """
+    return (
+        game.current_player_index,
+        game.is_reversed,
+        game.current_player_gets_extra_turn,
+        _values(game.deck.cards),
+        _values(game.discard_pile),
+        tuple(
+            (
+                _sorted_values(player.hand),
+                _sorted_values(player.face_up_cards),
+                _sorted_values(player.face_down_cards),
+            )
+            for player in game.players
+        ),
+    )
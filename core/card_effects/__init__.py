@@ -1,3 +1,3 @@
-from .card_effect_factory import get_card_effect
+from .card_effect_factory import CARD_EFFECTS, SPECIAL_RANKS, get_card_effect
 
-__all__ = ["get_card_effect"]
\ No newline at end of file
+__all__ = ["CARD_EFFECTS", "SPECIAL_RANKS", "get_card_effect"]
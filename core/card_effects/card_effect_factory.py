@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from .card_effects import TenEffect, SevenEffect, ThreeEffect, TwoEffect
+from .card_effects import CardEffects, TenEffect, SevenEffect, ThreeEffect, TwoEffect
+
+# Effects carry no state, so one shared instance per rank is built at import
+# and handed out on every lookup instead of constructing one per card played.
+CARD_EFFECTS: dict[str, CardEffects] = {
+    "10": TenEffect(),
+    "7": SevenEffect(),
+    "3": ThreeEffect(),
+    "2": TwoEffect(),
+}
+
+# Ranks that can be played on anything
+SPECIAL_RANKS = frozenset(CARD_EFFECTS)
+
 
 # Top-level helper – no need for a class wrapper
-def get_card_effect(rank: str):
-    mapping = {
-        "10": TenEffect,
-        "7": SevenEffect,
-        "3": ThreeEffect,
-        "2": TwoEffect,
-    }
-    effect_class = mapping.get(rank)
-    return effect_class() if effect_class is not None else None
+def get_card_effect(rank: str) -> CardEffects | None:
+    return CARD_EFFECTS.get(rank)
@@ -41,4 +41,13 @@ class TwoEffect(CardEffects):
     def apply(self, game):
         game.is_reversed = False
     def __str__(self):
-        return "The two reset the pile! Time to play another card in ascending order!"
\ No newline at end of file
+        return "The two reset the pile! Time to play another card in ascending order!"
+
+class SkipEffect(CardEffects):
+    # House rule (core.rules.RuleSet.eight_skips): the next player loses
+    # their turn. Moving the turn on here means end_turn() lands one further.
+    def apply(self, game):
+        game.advance_turn()
+
+    def __str__(self):
+        return "The eight skips the next player!"
@@ -0,0 +1,107 @@
+from typing import List, Optional
+
+from core.game_view import GameView
+from core.models import Move
+
+# Card values run 2 (two) .. 14 (ace); value - MIN_VALUE is the rank slot.
+MIN_VALUE = 2
+NUM_RANKS = 13
+
+# ---------- fixed discrete action space ----------
+#
+# Suits never affect the rules, so hand and face-up plays are indexed by
+# rank rather than by position: the action space stays the same size no
+# matter how many cards a pickup dumps into the hand.
+#
+#   [0, 13)   play a card of that rank from hand
+#   [13, 26)  play a card of that rank from the face-up cards
+#   [26, 29)  play the face-down card at that position (blind)
+#   29        pick up the discard pile
+
+MAX_FACE_DOWN = 3
+HAND_OFFSET = 0
+FACE_UP_OFFSET = HAND_OFFSET + NUM_RANKS
+FACE_DOWN_OFFSET = FACE_UP_OFFSET + NUM_RANKS
+PICKUP_ACTION = FACE_DOWN_OFFSET + MAX_FACE_DOWN
+ACTION_SIZE = PICKUP_ACTION + 1
+
+# ---------- observation layout ----------
+#
+#   [0, 13)   hand rank counts
+#   [13, 26)  face-up rank counts
+#   26        face-down count
+#   [27, 40)  one-hot rank of the effective top card (all zero if none)
+#   40        is_reversed
+#   41        discard pile size
+#   42        deck remaining
+
+OBS_HAND = 0
+OBS_FACE_UP = OBS_HAND + NUM_RANKS
+OBS_FACE_DOWN = OBS_FACE_UP + NUM_RANKS
+OBS_TOP = OBS_FACE_DOWN + 1
+OBS_REVERSED = OBS_TOP + NUM_RANKS
+OBS_PILE_SIZE = OBS_REVERSED + 1
+OBS_DECK = OBS_PILE_SIZE + 1
+OBS_SIZE = OBS_DECK + 1
+
+
+def encode_view(view: GameView) -> List[float]:
+    """
+    Flatten a GameView into a fixed-length feature vector (see layout above).
+    Only ranks are encoded; suits carry no information for the rules.
+    """
+    obs = [0.0] * OBS_SIZE
+    pv = view.player_view
+
+    for card in pv.hand:
+        obs[OBS_HAND + card.value - MIN_VALUE] += 1.0
+    for card in pv.face_up:
+        obs[OBS_FACE_UP + card.value - MIN_VALUE] += 1.0
+    obs[OBS_FACE_DOWN] = float(pv.face_down_count)
+
+    top = view.discard_top_effective
+    if top is not None:
+        obs[OBS_TOP + top.value - MIN_VALUE] = 1.0
+
+    obs[OBS_REVERSED] = 1.0 if view.is_reversed else 0.0
+    obs[OBS_PILE_SIZE] = float(view.discard_pile_size)
+    obs[OBS_DECK] = float(view.deck_remaining)
+    return obs
+
+
+def move_to_action(view: GameView, move: Move) -> int:
+    """Return the action index for a Move, given the view it was generated from."""
+    if move.kind == "pickup":
+        return PICKUP_ACTION
+
+    if move.source is None or move.index is None:
+        raise ValueError("Play move must have source and index")
+
+    pv = view.player_view
+    if move.source == "hand":
+        return HAND_OFFSET + pv.hand[move.index].value - MIN_VALUE
+    if move.source == "face_up":
+        return FACE_UP_OFFSET + pv.face_up[move.index].value - MIN_VALUE
+    if move.source == "face_down":
+        return FACE_DOWN_OFFSET + move.index
+    raise ValueError(f"Unknown source: {move.source}")
+
+
+def action_to_move(view: GameView, valid_moves: List[Move], action: int) -> Optional[Move]:
+    """
+    Return the valid Move that the action index stands for, or None if the
+    action is not legal right now. Several hand/face-up cards can share a
+    rank; any one of them is an equivalent play, so the first is returned.
+    """
+    for move in valid_moves:
+        if move_to_action(view, move) == action:
+            return move
+    return None
+
+
+def legal_action_mask(view: GameView, valid_moves: List[Move]) -> List[bool]:
+    """Boolean mask over ACTION_SIZE marking which actions are currently legal."""
+    mask = [False] * ACTION_SIZE
+    for move in valid_moves:
+        mask[move_to_action(view, move)] = True
+    return mask
@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING, List, Protocol
+
+from core.models import Card, SourceKind
+
+if TYPE_CHECKING:
+    from core.game import Game
+
+
+class GameListener(Protocol):
+    """
+    Receives the public events of a Game (Game.add_listener): what every
+    player at the table sees happen. Events fire after the move is applied.
+    Moves made with push_move() and undone with pop_move() are search
+    lines, not play, so neither is reported; clone() does not copy
+    listeners.
+    """
+
+    def on_start(self, game: "Game") -> None:
+        """Cards have been dealt."""
+
+    def on_draw(self, player_index: int, count: int) -> None:
+        """The player drew `count` cards from the deck (which ones is private)."""
+
+    def on_play(self, player_index: int, card: Card, source: SourceKind) -> None:
+        """The player played `card` from their hand or face-up cards."""
+
+    def on_flip(self, player_index: int, card: Card) -> None:
+        """A face-down card was turned over, showing `card`."""
+
+    def on_pickup(self, player_index: int, cards: List[Card]) -> None:
+        """`cards` went into the player's hand in view of everyone."""
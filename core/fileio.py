@@ -0,0 +1,20 @@
+"""
+Crash-safe file writes shared by the agents and the simulation runners.
+"""
+import json
+import os
+from typing import Any
+
+
+def save_atomic(path: str, data: Any, compact: bool = False) -> None:
+    """
+    Write JSON so that `path` always holds either the old or the new
+    contents: write a temp file next to it, fsync, then os.replace().
+    `compact` drops the whitespace after separators.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, separators=(",", ":") if compact else None)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
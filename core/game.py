@@ -1,18 +1,80 @@
+import random
 from typing import List, Optional
-from core.models import PlayerState, Card, Deck, Move, MoveKind, SourceKind
-from core.game_view import GameView, PlayerView
-from core.card_effects import get_card_effect
+from collections import deque
+from core.models import (
+    PlayerState, Card, CardChange, Deck, DiscardPile, Move, MoveKind, MoveRecord, SourceKind,
+    canonical_card, DECK_SIZE,
+)
+from core.canonical import StateKey, state_key
+from core.game_view import GameView, PlayerView, ViewDiff
+from core.events import GameListener
+from core.card_effects import SPECIAL_RANKS
+from core.rules import RuleSet, STANDARD_RULES
+
+# 3 face-down + 3 face-up + 3 in hand
+CARDS_DEALT_PER_PLAYER = 9
+
+
+def decks_needed(num_players: int) -> int:
+    """Smallest number of 52-card decks that can deal every player in."""
+    return max(1, -(-CARDS_DEALT_PER_PLAYER * num_players // DECK_SIZE))
+
 
 class Game:
-    def __init__(self, num_players: int = 2):
-        self.deck = Deck()
+    def __init__(
+        self,
+        num_players: int = 2,
+        rng: Optional[random.Random] = None,
+        num_decks: Optional[int] = None,
+        lazy_deck: bool = False,
+        rules: Optional[RuleSet] = None,
+    ):
+        if num_players < 1:
+            raise ValueError("A game needs at least one player")
+        if num_decks is None:
+            num_decks = decks_needed(num_players)
+        self.deck = Deck(rng=rng, num_decks=num_decks, lazy=lazy_deck)
+        self.rules = rules if rules is not None else STANDARD_RULES
         self.players: List[PlayerState] = []
-        self.discard_pile: List[Card] = []
+        self.discard_pile = DiscardPile()
         self.current_player_index: int = 0
         self.is_reversed: bool = False
         self.current_player_gets_extra_turn: bool = False
+        # Only the player who just moved can run out of cards, so the winner
+        # is recorded in apply_move instead of scanning every player per turn.
+        self._winner_index: Optional[int] = None
+        self._undo_stack: List[MoveRecord] = []
+        # Bumped by every move and turn change; see diff_since()
+        self.version: int = 0
+        self._journal: Optional[deque] = None
+        self._journal_start: int = 0
+        self._listeners: List[GameListener] = []
         self._init_players(num_players)
 
+    @property
+    def discard_pile(self) -> DiscardPile:
+        return self._discard_pile
+
+    @discard_pile.setter
+    def discard_pile(self, cards: List[Card]) -> None:
+        # Plain lists (e.g. a position set up by hand) get the run-length index
+        self._discard_pile = cards if isinstance(cards, DiscardPile) else DiscardPile(cards)
+
+    @classmethod
+    def _blank(cls) -> "Game":
+        """
+        Uninitialised Game for clone()/snapshot restore: the caller fills in
+        deck, players, pile and flags; per-instance bookkeeping starts empty.
+        """
+        game = cls.__new__(cls)
+        game.rules = STANDARD_RULES
+        game._undo_stack = []
+        game.version = 0
+        game._journal = None
+        game._journal_start = 0
+        game._listeners = []
+        return game
+
     def _init_players(self, num_players: int) -> None:
         for i in range(num_players):
             self.players.append(PlayerState(name=f"Player {i+1}"))
@@ -20,6 +82,14 @@ class Game:
     def start(self) -> None:
         self.deck.shuffle()
         self._deal_initial_cards()
+        for listener in self._listeners:
+            listener.on_start(self)
+
+    def add_listener(self, listener: GameListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: GameListener) -> None:
+        self._listeners.remove(listener)
 
     def _deal_initial_cards(self) -> None:
         for player in self.players:
@@ -44,6 +114,74 @@ class Game:
                     raise RuntimeError("Deck ran out while dealing hand cards")
                 player.hand.append(card)
 
+    def clone(self, fold_suits: bool = False, rng: Optional[random.Random] = None) -> "Game":
+        """
+        Independent copy for search/simulation. Lists are copied but Card
+        objects are shared (the rules never mutate a card). With fold_suits,
+        every card is replaced by the canonical card of its rank, so the copy
+        holds no per-suit objects at all and suit-symmetric positions become
+        identical.
+        """
+        other = Game._blank()
+        other.rules = self.rules
+        other.deck = self.deck.clone(rng=rng)
+        other.players = [
+            PlayerState(
+                name=p.name,
+                face_down_cards=list(p.face_down_cards),
+                face_up_cards=list(p.face_up_cards),
+                hand=list(p.hand),
+            )
+            for p in self.players
+        ]
+        other.discard_pile = self.discard_pile.copy()
+        other.current_player_index = self.current_player_index
+        other.is_reversed = self.is_reversed
+        other.current_player_gets_extra_turn = self.current_player_gets_extra_turn
+        other._winner_index = self._winner_index
+
+        if fold_suits:
+            other.deck.fold_suits()
+            other.discard_pile = [canonical_card(c) for c in other.discard_pile]
+            for p in other.players:
+                p.hand = [canonical_card(c) for c in p.hand]
+                p.face_up_cards = [canonical_card(c) for c in p.face_up_cards]
+                p.face_down_cards = [canonical_card(c) for c in p.face_down_cards]
+        return other
+
+    def resample_hidden(self, observer_index: int, rng: Optional[random.Random] = None) -> None:
+        """
+        Determinize the game from one player's point of view: every card the
+        observer can't see (the deck, other players' hands and all face-down
+        cards, their own included) is shuffled together and dealt back into
+        the same slots, in place. Run it on a clone to sample a world for
+        information-set search; nothing visible to the observer changes.
+        """
+        rng = rng if rng is not None else self.deck.rng
+        zones: List[List[Card]] = [self.deck.cards]
+        for i, player in enumerate(self.players):
+            if i != observer_index:
+                zones.append(player.hand)
+            zones.append(player.face_down_cards)
+
+        pool: List[Card] = []
+        for zone in zones:
+            pool.extend(zone)
+        rng.shuffle(pool)
+
+        pos = 0
+        for zone in zones:
+            n = len(zone)
+            zone[:] = pool[pos:pos + n]
+            pos += n
+
+    def state_key(self) -> StateKey:
+        """Suit-insensitive key for transposition/memo tables (see core.canonical)."""
+        return state_key(self)
+
+    def state_hash(self) -> int:
+        return hash(state_key(self))
+
     def get_view_for_player(self, player_index: int) -> GameView:
         player: PlayerState = self.players[player_index]
 
@@ -65,6 +203,7 @@ class Game:
             player_view=player_view,
             discard_top_effective=top_effective,
             discard_pile_size=len(self.discard_pile),
+            is_reversed=self.is_reversed,
         )
 
     def _is_card_playable(self, card: Card) -> bool:
@@ -73,14 +212,15 @@ class Game:
         given is_reversed and special-card rules.
         """
         # Special cards are always allowed (2,3,7,10 etc.)
-        if get_card_effect(card.rank):
+        if card.rank in SPECIAL_RANKS:
             return True
 
         # If there is no discard pile yet, any non-special card can start
-        if not self.discard_pile:
+        pile = self._discard_pile
+        if not pile:
             return True
 
-        top = self.get_effective_top_card()
+        top = pile.effective_top
         if top is None:
             # All 3s or something weird – treat as no effective top
             return True
@@ -116,8 +256,16 @@ class Game:
             # No "pickup" option here – you must try a card.
             return moves
 
-        # Normal case: hand or face_up – only include cards that are actually playable
+        # Normal case: hand or face_up – only include cards that are actually playable.
+        # Cards of equal value are interchangeable plays, so each distinct value
+        # gets one move (its first index) and one playability check; a 40-card
+        # hand after a big pickup still yields at most 13 moves.
+        seen = set()
         for idx, card in enumerate(source_list):
+            value = card.value
+            if value in seen:
+                continue
+            seen.add(value)
             if self._is_card_playable(card):
                 moves.append(Move(kind="play", source=source, index=idx))
 
@@ -129,6 +277,70 @@ class Game:
 
 
     def apply_move(self, player_index: int, move: Move) -> None:
+        journal = self._journal
+        if journal is None and not self._listeners:
+            self._apply_move(player_index, move)
+            self.version += 1
+            return
+
+        player = self.players[player_index]
+        hand = player.hand
+        hand_len = len(hand)
+        face_down_len = len(player.face_down_cards)
+        pile = self._discard_pile
+        pile_len = len(pile)
+        card: Optional[Card] = None
+        if move.kind == "play" and move.source is not None and move.index is not None:
+            source_list = self._get_source_list(player, move.source)
+            if 0 <= move.index < len(source_list):
+                card = source_list[move.index]
+
+        self._apply_move(player_index, move)
+        self.version += 1
+
+        # Everything that lands in a hand is appended, so after a hand play
+        # the new cards start one slot earlier than the old length
+        if card is not None and move.source == "hand":
+            hand_len -= 1
+        if journal is not None:
+            journal.append(CardChange(
+                version=self.version,
+                player_index=player_index,
+                hand_added=hand[hand_len:],
+                hand_removed=[card] if move.source == "hand" else [],
+                face_up_removed=[card] if move.source == "face_up" else [],
+                face_down_played=face_down_len - len(player.face_down_cards),
+            ))
+        if self._listeners:
+            self._notify_move(player_index, move, card, hand_len, pile, pile_len)
+
+    def _notify_move(self, player_index: int, move: Move, card: Optional[Card],
+                     hand_len: int, pile: DiscardPile, pile_len: int) -> None:
+        """
+        Translate an applied move into listener events. `pile` is the pile
+        object from before the move: pickups and burns replace it rather
+        than emptying it, so its first pile_len cards are what was taken and
+        anything after them was played onto it.
+        """
+        hand = self.players[player_index].hand
+        for listener in self._listeners:
+            if move.kind == "pickup":
+                if pile_len:
+                    listener.on_pickup(player_index, pile[:pile_len])
+                continue
+            if move.source == "face_down":
+                listener.on_flip(player_index, card)
+                if len(pile) == pile_len:
+                    # Unplayable: it went into the hand along with the pile
+                    listener.on_pickup(player_index, [card] + pile[:pile_len])
+                    continue
+            else:
+                listener.on_play(player_index, card, move.source)
+            drawn = len(hand) - hand_len
+            if drawn:
+                listener.on_draw(player_index, drawn)
+
+    def _apply_move(self, player_index: int, move: Move) -> None:
         player = self.players[player_index]
 
         # Reset extra-turn flag by default
@@ -156,6 +368,7 @@ class Game:
                     self._refill_hand(player)
                     self._apply_effect_if_any(revealed_card)
                     self._check_four_of_a_kind_burn()
+                    self._check_player_out(player_index)
 
                     # If the revealed card is a 2 and the game is not over,
                     # give this player an extra turn.
@@ -167,7 +380,8 @@ class Game:
                     player.hand.append(revealed_card)
                     if self.discard_pile:
                         player.hand.extend(self.discard_pile)
-                        self.discard_pile.clear()
+                        # New list rather than clear(): pop_move keeps the old one
+                        self.discard_pile = DiscardPile()
                         self.is_reversed = False
 
                 return
@@ -185,6 +399,7 @@ class Game:
             self._refill_hand(player)
             self._apply_effect_if_any(played_card)
             self._check_four_of_a_kind_burn()
+            self._check_player_out(player_index)
 
             # If this was a 2 and the game isn't over, give extra turn
             if played_card.rank == "2" and not self.is_game_over():
@@ -196,23 +411,132 @@ class Game:
         raise ValueError(f"Unknown move kind: {move.kind}")
 
 
+    # ---------- in-place search: make / unmake ----------
+
+    def push_move(self, move: Move) -> None:
+        """
+        Play `move` for the current player and end their turn, remembering
+        just enough to undo it with pop_move(). Lets search walk a single
+        Game up and down the tree instead of cloning at every node.
+
+        Listeners are not told about pushed moves: they describe the game
+        actually played, so a tracker attached to a game searched in place
+        keeps describing the position the search started from.
+        """
+        pid = self.current_player_index
+        player = self.players[pid]
+
+        card: Optional[Card] = None
+        hand_len = len(player.hand)
+        if move.kind == "play" and move.source is not None and move.index is not None:
+            source_list = self._get_source_list(player, move.source)
+            if 0 <= move.index < len(source_list):
+                card = source_list[move.index]
+                if move.source == "hand":
+                    hand_len -= 1
+
+        record = MoveRecord(
+            player_index=pid,
+            move=move,
+            card=card,
+            source=move.source if card is not None else None,
+            index=move.index if card is not None else None,
+            hand_len=hand_len,
+            draws=[],
+            pile=self.discard_pile,
+            pile_len=len(self.discard_pile),
+            was_reversed=self.is_reversed,
+            had_extra_turn=self.current_player_gets_extra_turn,
+            prev_player_index=pid,
+            prev_winner_index=self._winner_index,
+        )
+
+        self.deck.draw_log = record.draws
+        listeners = self._listeners
+        if listeners:
+            self._listeners = []
+        try:
+            self.apply_move(pid, move)
+        except ValueError:
+            # Rejected moves fail before touching any cards
+            self.current_player_gets_extra_turn = record.had_extra_turn
+            raise
+        finally:
+            self.deck.draw_log = None
+            if listeners:
+                self._listeners = listeners
+
+        self.end_turn()
+        self._undo_stack.append(record)
+
+    def pop_move(self) -> Move:
+        """
+        Undo the most recent push_move() and return the move that was undone.
+        Cost is proportional to what the move changed. With a lazy deck the
+        drawn cards go back exactly, but the deck's RNG is not rewound.
+        """
+        if not self._undo_stack:
+            raise IndexError("pop_move() with no moves to undo")
+        record = self._undo_stack.pop()
+        player = self.players[record.player_index]
+
+        # Cards drawn to refill the hand sit at its end, newest last
+        for slot in reversed(record.draws):
+            self.deck.undraw(player.hand.pop(), slot)
+        # Anything else that landed in hand (pickup, failed face-down flip)
+        del player.hand[record.hand_len:]
+
+        if record.card is not None:
+            self._get_source_list(player, record.source).insert(record.index, record.card)
+
+        del record.pile[record.pile_len:]
+        self.discard_pile = record.pile
+
+        self.is_reversed = record.was_reversed
+        self.current_player_gets_extra_turn = record.had_extra_turn
+        self.current_player_index = record.prev_player_index
+        self._winner_index = record.prev_winner_index
+        self.version += 1
+        if self._journal is not None:
+            # Undo isn't journaled: anyone diffing from before this sees a full view
+            self._journal.clear()
+            self._journal_start = self.version
+        return record.move
+
+    @property
+    def undo_depth(self) -> int:
+        return len(self._undo_stack)
+
     def is_game_over(self) -> bool:
         """Return True as soon as any player has no cards at all."""
         return self.get_winner() is not None
 
     def get_winner(self) -> Optional[PlayerState]:
         """
-        Return the first player who has no hand, no face-up, and no face-down cards.
-        If no one has won yet, return None.
+        Return the first player to end up with no hand, no face-up, and no
+        face-down cards. If no one has won yet, return None.
         """
-        for player in self.players:
-            if (
-                not player.hand
-                and not player.face_up_cards
-                and not player.face_down_cards
-            ):
-                return player
-        return None
+        if self._winner_index is None:
+            return None
+        return self.players[self._winner_index]
+
+    def _check_player_out(self, player_index: int) -> None:
+        """Record player_index as the winner if they just played their last card."""
+        if self._winner_index is not None:
+            return
+        player = self.players[player_index]
+        if not player.hand and not player.face_up_cards and not player.face_down_cards:
+            self._winner_index = player_index
+
+    def refresh_winner(self) -> None:
+        """
+        Rescan every player for a winner. Only needed after editing player
+        cards directly (e.g. when setting up a position by hand); moves made
+        through apply_move keep the winner up to date on their own.
+        """
+        self._winner_index = None
+        for i in range(len(self.players)):
+            self._check_player_out(i)
 
     def _get_source_list(self, player: PlayerState, source: SourceKind) -> list[Card]:
         if source == "hand":
@@ -240,45 +564,109 @@ class Game:
         if not self.discard_pile:
             return
         player.hand.extend(self.discard_pile)
-        self.discard_pile.clear()
+        self.discard_pile = DiscardPile()
         self.is_reversed = False  # picking up resets reversed state in your old design
 
     def _apply_effect_if_any(self, card: Card) -> None:
         """
         Apply any special effect associated with this card rank.
-        No printing – just mutate Game state.
+        No printing – just mutate Game state. Called once per card that
+        lands on the pile, so a one-card reversal (RuleSet.seven_lasts_one_card)
+        expires here before the new card's own effect applies.
         """
-        effect = get_card_effect(card.rank)
+        if self.is_reversed and self.rules.seven_lasts_one_card:
+            self.is_reversed = False
+        effect = self.rules.effects.get(card.rank)
         if effect:
             effect.apply(self)  # your old code already used effect.apply(game)
 
     def _check_four_of_a_kind_burn(self) -> None:
         """If last 4 cards on pile share same rank, burn (clear) the pile."""
-        if len(self.discard_pile) < 4:
-            return
-        last_four = self.discard_pile[-4:]
-        rank = last_four[0].rank
-        if all(c.rank == rank for c in last_four):
+        if self.discard_pile.top_run_length >= 4:
             # Burn pile: remove it from play. You can track a burn_pile if you want;
             # for now we just clear it and reset reversed.
-            self.discard_pile.clear()
+            self.discard_pile = DiscardPile()
             self.is_reversed = False
-    
+
     def get_effective_top_card(self) -> Optional[Card]:
         """
         Return the top card that actually has a value for comparison.
         Skips 3s, since they inherit the previous card's value.
         """
-        for card in reversed(self.discard_pile):
-            if card.rank != "3":
-                return card
-        return None
+        return self.discard_pile.effective_top
 
     def get_current_player_index(self) -> int:
         return self.current_player_index
 
     def advance_turn(self) -> None:
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self.version += 1
+
+    # ---------- incremental views ----------
+
+    def track_changes(self, limit: int = 1024) -> None:
+        """
+        Start journaling each move's card changes so diff_since() can answer
+        with deltas. Only the last `limit` moves are kept; older versions get
+        a full view. Off by default so search and simulation pay nothing.
+        """
+        self._journal = deque(maxlen=limit)
+        self._journal_start = self.version
+
+    def diff_since(self, player_index: int, version: int) -> ViewDiff:
+        """
+        What changed in player_index's view since Game.version was `version`:
+        net cards added to and removed from their hand, face-up cards played,
+        plus the current pile top, counts and turn. Falls back to a full view
+        when the journal doesn't reach back to `version` (or isn't on).
+        """
+        player = self.players[player_index]
+        diff = ViewDiff(
+            version=self.version,
+            current_player_name=self.players[self.current_player_index].name,
+            deck_remaining=len(self.deck.cards),
+            discard_top_effective=self._discard_pile.effective_top,
+            discard_pile_size=len(self._discard_pile),
+            is_reversed=self.is_reversed,
+            face_down_count=len(player.face_down_cards),
+        )
+
+        journal = self._journal
+        oldest = self._journal_start
+        if journal is not None and len(journal) == journal.maxlen:
+            oldest = journal[0].version - 1
+        if journal is None or not oldest <= version <= self.version:
+            diff.full = self.get_view_for_player(player_index)
+            return diff
+
+        recent = []
+        for change in reversed(journal):
+            if change.version <= version:
+                break
+            if change.player_index == player_index:
+                recent.append(change)
+
+        added = diff.hand_added
+        removed = diff.hand_removed
+        for change in reversed(recent):
+            for card in change.hand_removed:
+                # A card picked up and played again inside the window nets out
+                if card in added:
+                    added.remove(card)
+                else:
+                    removed.append(card)
+            added.extend(change.hand_added)
+            diff.face_up_removed.extend(change.face_up_removed)
+        return diff
+
+    def end_turn(self) -> None:
+        """
+        Finish the current player's turn after apply_move: pass to the next
+        player unless the game is over or they earned an extra turn.
+        """
+        if self.is_game_over() or self.current_player_gets_extra_turn:
+            return
+        self.advance_turn()
 
 
     def get_actual_top_card(self) -> Optional[Card]:
@@ -288,6 +676,8 @@ class Game:
         """
         Clears the discard pile and resets any pile-related state.
         Called by effects like TenEffect to burn the pile out of the game.
+        Replaces the list instead of emptying it so undo records can keep
+        the burned cards without copying them.
         """
-        self.discard_pile.clear()
+        self.discard_pile = DiscardPile()
         self.is_reversed = False
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 from core.models import Card
 
@@ -16,3 +16,50 @@ class GameView:
     player_view: PlayerView
     discard_top_effective: Optional[Card]
     discard_pile_size: int
+    is_reversed: bool = False   # a 7 is in force: next card must be lower
+
+@dataclass
+class ViewDiff:
+    """
+    What changed in one player's GameView since an earlier Game.version
+    (Game.diff_since). Card lists are net multiset changes; the scalar
+    fields are simply current. When the game's journal no longer reaches
+    back far enough, `full` carries the whole view instead and the card
+    lists are empty.
+    """
+    version: int
+    current_player_name: str
+    deck_remaining: int
+    discard_top_effective: Optional[Card]
+    discard_pile_size: int
+    is_reversed: bool
+    face_down_count: int
+    hand_added: List[Card] = field(default_factory=list)
+    hand_removed: List[Card] = field(default_factory=list)
+    face_up_removed: List[Card] = field(default_factory=list)
+    full: Optional[GameView] = None
+
+    def apply_to(self, view: GameView) -> GameView:
+        """The view `view` becomes under this diff (a new object; hand order may differ)."""
+        if self.full is not None:
+            return self.full
+        hand = list(view.player_view.hand)
+        for card in self.hand_removed:
+            hand.remove(card)
+        hand.extend(self.hand_added)
+        face_up = list(view.player_view.face_up)
+        for card in self.face_up_removed:
+            face_up.remove(card)
+        return GameView(
+            current_player_name=self.current_player_name,
+            deck_remaining=self.deck_remaining,
+            player_view=PlayerView(
+                name=view.player_view.name,
+                hand=hand,
+                face_up=face_up,
+                face_down_count=self.face_down_count,
+            ),
+            discard_top_effective=self.discard_top_effective,
+            discard_pile_size=self.discard_pile_size,
+            is_reversed=self.is_reversed,
+        )
@@ -0,0 +1,126 @@
+import random
+from collections import Counter
+from typing import List, Optional
+
+from core.game import Game
+from core.models import Card, SourceKind
+from core.snapshot import CARD_BY_CODE, card_code
+
+
+class PublicKnowledge:
+    """
+    What the whole table knows about cards it can't see, kept up to date
+    from Game events (a core.events.GameListener):
+
+    - known[i]: the cards publicly known to be in player i's hand, because
+      everyone watched them go in (pile pickups, failed face-down flips);
+    - hand_sizes[i]: how many cards player i holds, so
+      unknown_count(i) = hand_sizes[i] - |known[i]| are private draws;
+    - unseen: every card whose whereabouts have never been shown (deck,
+      face-down cards, privately drawn hand cards), as a multiset.
+
+    Cards are kept as core.snapshot card codes in Counters, so every event
+    costs O(1) per card it moves and nothing is rebuilt from history.
+    """
+
+    def __init__(self) -> None:
+        self.known: List[Counter] = []
+        self.hand_sizes: List[int] = []
+        self.unseen: Counter = Counter()
+
+    @classmethod
+    def attach(cls, game: Game) -> "PublicKnowledge":
+        """Start tracking `game`. Attach before start(), or right after it."""
+        knowledge = cls()
+        game.add_listener(knowledge)
+        if any(p.hand or p.face_down_cards for p in game.players):
+            knowledge.on_start(game)
+        return knowledge
+
+    # ---------- GameListener ----------
+
+    def on_start(self, game: Game) -> None:
+        self.known = [Counter() for _ in game.players]
+        self.hand_sizes = [len(p.hand) for p in game.players]
+        self.unseen = Counter(card_code(c) for c in game.deck.cards)
+        for p in game.players:
+            self.unseen.update(card_code(c) for c in p.hand)
+            self.unseen.update(card_code(c) for c in p.face_down_cards)
+
+    def on_draw(self, player_index: int, count: int) -> None:
+        self.hand_sizes[player_index] += count
+
+    def on_play(self, player_index: int, card: Card, source: SourceKind) -> None:
+        if source != "hand":
+            return  # face-up cards were public from the deal
+        self.hand_sizes[player_index] -= 1
+        code = card_code(card)
+        known = self.known[player_index]
+        if known[code]:
+            _take(known, code)
+        else:
+            _take(self.unseen, code)
+
+    def on_flip(self, player_index: int, card: Card) -> None:
+        _take(self.unseen, card_code(card))
+
+    def on_pickup(self, player_index: int, cards: List[Card]) -> None:
+        self.hand_sizes[player_index] += len(cards)
+        self.known[player_index].update(card_code(c) for c in cards)
+
+    # ---------- queries ----------
+
+    def known_cards(self, player_index: int) -> List[Card]:
+        return [CARD_BY_CODE[code] for code in self.known[player_index].elements()]
+
+    def unknown_count(self, player_index: int) -> int:
+        return self.hand_sizes[player_index] - sum(self.known[player_index].values())
+
+    @property
+    def unseen_count(self) -> int:
+        return sum(self.unseen.values())
+
+    def resample(self, game: Game, observer_index: int,
+                 rng: Optional[random.Random] = None) -> None:
+        """
+        Like Game.resample_hidden, but opponents keep the cards everyone
+        knows they hold; only their privately drawn cards, the face-down
+        cards and the deck are re-dealt. Run it on a clone of the tracked
+        game, at the same position.
+        """
+        rng = rng if rng is not None else game.deck.rng
+        pool: List[Card] = list(game.deck.cards)
+        hands = []
+        for i, player in enumerate(game.players):
+            if i != observer_index:
+                wanted = Counter(self.known[i])
+                kept: List[Card] = []
+                for card in player.hand:
+                    code = card_code(card)
+                    if wanted[code]:
+                        wanted[code] -= 1
+                        kept.append(card)
+                    else:
+                        pool.append(card)
+                hands.append((player.hand, kept))
+            pool.extend(player.face_down_cards)
+        rng.shuffle(pool)
+
+        pos = 0
+        for hand, kept in hands:
+            n = len(hand) - len(kept)
+            hand[:] = kept + pool[pos:pos + n]
+            pos += n
+        for player in game.players:
+            n = len(player.face_down_cards)
+            player.face_down_cards[:] = pool[pos:pos + n]
+            pos += n
+        game.deck.cards[:] = pool[pos:]
+
+
+def _take(counter: Counter, code: int) -> None:
+    n = counter[code] - 1
+    if n:
+        counter[code] = n
+    else:
+        del counter[code]
@@ -14,6 +14,39 @@ class Move:
     source: Optional[SourceKind] = None  # for "play"
     index: Optional[int] = None          # index in that source
 
+@dataclass
+class MoveRecord:
+    """
+    Minimal diff of one move made through Game.push_move: exactly what is
+    needed to put the game back the way it was.
+    """
+    player_index: int
+    move: Move
+    card: Optional[Card]            # card taken from its source (None for pickup)
+    source: Optional[SourceKind]
+    index: Optional[int]
+    hand_len: int                   # hand length after the card left it, before any growth
+    draws: List[int]                # deck slots of the cards drawn to refill the hand
+    pile: List[Card]                # the discard pile list object before the move...
+    pile_len: int                   # ...and its length then (burned/picked-up cards stay in it)
+    was_reversed: bool
+    had_extra_turn: bool
+    prev_player_index: int
+    prev_winner_index: Optional[int]
+
+@dataclass
+class CardChange:
+    """
+    Journal entry (Game.track_changes): how one move changed the mover's
+    own cards. Other players' cards never change on someone else's move.
+    """
+    version: int                    # Game.version once the move was applied
+    player_index: int
+    hand_added: List[Card]          # drawn, picked up or a failed face-down flip
+    hand_removed: List[Card]
+    face_up_removed: List[Card]
+    face_down_played: int
+
 @dataclass
 class PlayerState:
     name: str
@@ -42,28 +75,248 @@ class Card:
         return f"{self.rank}{suit_symbols[self.suit]}"
 
 
+class DiscardPile(list):
+    """
+    The discard pile, as a list of Cards that also keeps a small run-length
+    index alongside every entry:
+
+    - how many cards of the same rank end at that position (the burn check
+      only needs the run length at the top), and
+    - the effective card at or beneath it, i.e. the nearest non-3 (3s
+      mimic whatever they sit on).
+
+    Both are maintained on append/extend/clear/truncation, which is all the
+    game does to the pile, so the top-of-pile queries are O(1). Any other
+    in-place edit falls back to rebuilding the index.
+    """
+
+    def __init__(self, cards=()):
+        super().__init__()
+        self._runs: List[int] = []
+        self._effective: List[Card | None] = []
+        if cards:
+            self.extend(cards)
+
+    # ---------- O(1) queries ----------
+
+    @property
+    def top_run_length(self) -> int:
+        """Number of same-rank cards on top of the pile (0 when empty)."""
+        return self._runs[-1] if self._runs else 0
+
+    @property
+    def effective_top(self) -> Card | None:
+        """Top card that has a value for comparison, skipping 3s."""
+        return self._effective[-1] if self._effective else None
+
+    # ---------- maintained mutations ----------
+
+    def append(self, card: Card) -> None:
+        runs = self._runs
+        effective = self._effective
+        rank = card.rank
+        if runs:
+            runs.append(runs[-1] + 1 if self[-1].rank == rank else 1)
+            effective.append(effective[-1] if rank == "3" else card)
+        else:
+            runs.append(1)
+            effective.append(None if rank == "3" else card)
+        list.append(self, card)
+
+    def extend(self, cards) -> None:
+        for card in cards:
+            self.append(card)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._runs.clear()
+        self._effective.clear()
+
+    def truncate(self, length: int) -> None:
+        """Drop everything above `length` cards."""
+        del self[length:]
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        if isinstance(key, slice) and key.step in (None, 1) and key.stop is None:
+            # Tail removal (pop_move, truncate): the index below is unchanged
+            del self._runs[len(self):]
+            del self._effective[len(self):]
+        else:
+            self._rebuild()
+
+    def pop(self, index: int = -1) -> Card:
+        card = super().pop(index)
+        if index == -1 or index == len(self):
+            self._runs.pop()
+            self._effective.pop()
+        else:
+            self._rebuild()
+        return card
+
+    def copy(self) -> DiscardPile:
+        other = DiscardPile()
+        list.extend(other, self)
+        other._runs = list(self._runs)
+        other._effective = list(self._effective)
+        return other
+
+    def __copy__(self) -> DiscardPile:
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> DiscardPile:
+        return self.copy()
+
+    def __reduce__(self):
+        # Pickle as the plain card list; unpickling re-runs __init__ and rebuilds the index
+        return (DiscardPile, (list(self),))
+
+    # ---------- anything else rebuilds ----------
+
+    def _rebuild(self) -> None:
+        cards = list(self)
+        self.clear()
+        self.extend(cards)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._rebuild()
+
+    def insert(self, index, card) -> None:
+        super().insert(index, card)
+        self._rebuild()
+
+    def remove(self, card) -> None:
+        super().remove(card)
+        self._rebuild()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._rebuild()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild()
+
+
+CANONICAL_SUIT = "Spades"
+_CANONICAL_CARDS: dict[int, Card] = {}
+
+
+def canonical_card(card: Card) -> Card:
+    """
+    Return one shared Card per rank (always in CANONICAL_SUIT). The rules
+    never read suits, so search copies can use these instead of the
+    originals and identical positions end up with identical cards.
+    """
+    canon = _CANONICAL_CARDS.get(card.value)
+    if canon is None:
+        canon = _CANONICAL_CARDS[card.value] = Card(card.rank, CANONICAL_SUIT, card.value)
+    return canon
+
+
+SUITS = ["Spades", "Clubs", "Hearts", "Diamonds"]
+RANKS = ["2", "3", "4", "5", "6", "7",
+         "8", "9", "10", "Jack", "Queen", "King",
+         "Ace"]
+VALUES = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
+DECK_SIZE = len(SUITS) * len(RANKS)
+
+# Built once at import; every Deck holds references to these. Cards are
+# never mutated by the rules, so sharing them between games is safe and a
+# new deck costs one list copy instead of 52 object constructions.
+STANDARD_CARDS: tuple[Card, ...] = tuple(
+    Card(rank, suit, value) for suit in SUITS for rank, value in zip(RANKS, VALUES)
+)
+
+
 class Deck:
-    def __init__(self) -> None:
+    """
+    Draw pile. In the default mode the deck is shuffled once up front and
+    draw() takes from the end. With lazy=True nothing is shuffled: the deck
+    is an unordered pool and each draw() picks a uniformly random remaining
+    card in O(1) (one step of Fisher-Yates), so games that end early never
+    pay for shuffling cards nobody draws.
+    """
+
+    def __init__(self, rng: random.Random | None = None, num_decks: int = 1,
+                 lazy: bool = False) -> None:
+        if num_decks < 1:
+            raise ValueError("num_decks must be at least 1")
+        # Falls back to the module-level generator so random.seed() still works
+        self.rng = rng if rng is not None else random
+        self.num_decks = num_decks
+        self.lazy = lazy
         self.cards: List[Card] = self._create()
+        # When a list, draw() appends the slot each card came from (undo support)
+        self.draw_log: Optional[List[int]] = None
 
-    def _create(self) -> List[Card]:
-        deck: List[Card] = []
-        suits = ["Spades", "Clubs", "Hearts", "Diamonds"]
-        ranks = ["2", "3", "4", "5", "6", "7",
-                 "8", "9", "10", "Jack", "Queen", "King",
-                 "Ace"]
-        values = [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
-
-        for suit in suits:
-            for rank, value in zip(ranks, values):
-                deck.append(Card(rank, suit, value))
+    @classmethod
+    def from_cards(cls, cards: List[Card], rng: random.Random | None = None,
+                   num_decks: int = 1, lazy: bool = False) -> Deck:
+        """Wrap an existing card list (taken as-is, not copied)."""
+        deck = cls.__new__(cls)
+        deck.rng = rng if rng is not None else random
+        deck.num_decks = num_decks
+        deck.lazy = lazy
+        deck.cards = cards
+        deck.draw_log = None
         return deck
 
+    def __getstate__(self) -> dict:
+        # The module-level generator can't be pickled; __setstate__ restores it
+        state = self.__dict__.copy()
+        if state["rng"] is random:
+            state["rng"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self.rng is None:
+            self.rng = random
+
+    def _create(self) -> List[Card]:
+        return list(STANDARD_CARDS) * self.num_decks
+
     def shuffle(self) -> None:
-        random.shuffle(self.cards)
+        if self.lazy:
+            return  # order is decided draw by draw
+        self.rng.shuffle(self.cards)
+
+    def clone(self, rng: random.Random | None = None) -> Deck:
+        """Copy the deck order; Card objects are shared since nothing mutates them."""
+        return Deck.from_cards(
+            list(self.cards),
+            rng=rng if rng is not None else self.rng,
+            num_decks=self.num_decks,
+            lazy=self.lazy,
+        )
+
+    def fold_suits(self) -> None:
+        """Swap every card for the shared canonical card of its rank."""
+        self.cards = [canonical_card(card) for card in self.cards]
 
     def draw(self) -> Card | None:
-        return self.cards.pop() if self.cards else None
+        cards = self.cards
+        if not cards:
+            return None
+        j = len(cards) - 1
+        if self.lazy:
+            j = self.rng.randrange(len(cards))
+            cards[j], cards[-1] = cards[-1], cards[j]
+        if self.draw_log is not None:
+            self.draw_log.append(j)
+        return cards.pop()
+
+    def undraw(self, card: Card, slot: int) -> None:
+        """Put back a card that draw() took from `slot` (reverses the swap too)."""
+        cards = self.cards
+        cards.append(card)
+        cards[slot], cards[-1] = cards[-1], cards[slot]
     # helper
     def get_card_list(self) -> list[tuple[str, str]]:
         return [(card.rank, card.suit) for card in self.cards]
\ No newline at end of file
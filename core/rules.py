@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Mapping
+
+from core.card_effects import CARD_EFFECTS
+from core.card_effects.card_effects import CardEffects, SkipEffect
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """
+    House-rule switches for a Game. The defaults are the standard rules.
+
+    seven_lasts_one_card: a 7 still forces "lower or equal", but only for
+        the single card played on it instead of until the pile resets.
+    eight_skips: an 8 skips the next player.
+
+    The effect table is built once per RuleSet, so the engine pays one dict
+    lookup per card played whatever the variant.
+    """
+
+    name: str = "standard"
+    seven_lasts_one_card: bool = False
+    eight_skips: bool = False
+    effects: Mapping[str, CardEffects] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        effects = dict(CARD_EFFECTS)
+        if self.eight_skips:
+            effects["8"] = SkipEffect()
+        object.__setattr__(self, "effects", effects)
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Any]) -> "RuleSet":
+        """Build from a JSON-style config, e.g. {"name": "skip", "eight_skips": true}."""
+        known = {f.name for f in fields(cls) if f.init}
+        unknown = set(config) - known
+        if unknown:
+            raise ValueError(f"Unknown rule options: {sorted(unknown)}")
+        return cls(**config)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+
+STANDARD_RULES = RuleSet()
@@ -0,0 +1,84 @@
+import random
+from typing import List, Optional, Sequence, Tuple
+
+from core.game import Game
+from core.rules import RuleSet, STANDARD_RULES
+from core.models import Card, Deck, PlayerState, RANKS, STANDARD_CARDS, SUITS
+
+# Compact, exact (suits included) game state: every card becomes a small int
+# code, suit_index * 13 + rank_index. Snapshots are plain tuples of ints, so
+# they compare with == and pickle small.
+
+NUM_CARD_CODES = len(SUITS) * len(RANKS)
+
+# One shared Card per code: restoring a snapshot never constructs cards.
+CARD_BY_CODE: Tuple[Card, ...] = STANDARD_CARDS
+_CODE_BY_SUIT_VALUE = {(card.suit, card.value): code for code, card in enumerate(CARD_BY_CODE)}
+
+Codes = Tuple[int, ...]
+PlayerSnapshot = Tuple[str, Codes, Codes, Codes]   # name, hand, face-up, face-down
+Snapshot = Tuple[int, bool, bool, int, int, bool, Codes, Codes, Tuple[PlayerSnapshot, ...]]
+
+
+def card_code(card: Card) -> int:
+    return _CODE_BY_SUIT_VALUE[card.suit, card.value]
+
+
+def card_codes(cards: Sequence[Card]) -> Codes:
+    lookup = _CODE_BY_SUIT_VALUE
+    return tuple([lookup[c.suit, c.value] for c in cards])
+
+
+def _cards(codes: Sequence[int]) -> List[Card]:
+    return [CARD_BY_CODE[c] for c in codes]
+
+
+def snapshot(game: Game) -> Snapshot:
+    """
+    Capture the full rules state of a game: turn, flags, winner, deck order,
+    discard pile and every player's cards. The deck's RNG is not included.
+    """
+    winner = game._winner_index
+    return (
+        game.current_player_index,
+        game.is_reversed,
+        game.current_player_gets_extra_turn,
+        -1 if winner is None else winner,
+        game.deck.num_decks,
+        game.deck.lazy,
+        card_codes(game.deck.cards),
+        card_codes(game.discard_pile),
+        tuple(
+            (p.name, card_codes(p.hand), card_codes(p.face_up_cards), card_codes(p.face_down_cards))
+            for p in game.players
+        ),
+    )
+
+
+def restore(snap: Snapshot, rng: Optional[random.Random] = None,
+            rules: RuleSet = STANDARD_RULES) -> Game:
+    """
+    Rebuild a Game from snapshot(); cards are the shared CARD_BY_CODE objects.
+    Rules are configuration, not state, so they are passed back in here.
+    """
+    (current, reversed_, extra_turn, winner, num_decks, lazy,
+     deck_codes, pile_codes, players) = snap
+
+    game = Game._blank()
+    game.rules = rules
+    game.deck = Deck.from_cards(_cards(deck_codes), rng=rng, num_decks=num_decks, lazy=lazy)
+    game.players = [
+        PlayerState(
+            name=name,
+            face_down_cards=_cards(face_down),
+            face_up_cards=_cards(face_up),
+            hand=_cards(hand),
+        )
+        for name, hand, face_up, face_down in players
+    ]
+    game.discard_pile = _cards(pile_codes)
+    game.current_player_index = current
+    game.is_reversed = reversed_
+    game.current_player_gets_extra_turn = extra_turn
+    game._winner_index = None if winner < 0 else winner
+    return game
@@ -0,0 +1,217 @@
+import random
+import struct
+from typing import Dict, Optional
+
+from core.game import Game
+from core.models import Deck, DECK_SIZE, PlayerState
+from core.rules import RuleSet, STANDARD_RULES
+from core.snapshot import CARD_BY_CODE, card_codes
+
+# Fixed binary layout for a whole game, so states can live in flat buffers
+# (bytearray, mmap, multiprocessing.shared_memory) and be read back without
+# pickling or constructing Card objects. Little-endian:
+#
+#   header   B version, B num_players, B num_decks, B flags,
+#            B current player, B winner (255 = none), H deck len, H pile len
+#   players  H hand len, B face-up len, B face-down len    (per player)
+#   cards    one byte per card code (core.snapshot), in order: deck, pile,
+#            then each player's hand, face-up, face-down
+#
+# Cards only ever leave the game (burns), so num_decks * 52 card bytes
+# always suffice and every game with the same table shape has the same
+# slot size. Player names are not stored: decoded players are "Player N".
+
+CODEC_VERSION = 1
+
+_HEADER = struct.Struct("<BBBBBBHH")
+_PLAYER = struct.Struct("<HBB")
+
+_FLAG_REVERSED = 1
+_FLAG_EXTRA_TURN = 2
+_FLAG_LAZY = 4
+_NO_WINNER = 255
+
+
+def slot_size(num_players: int, num_decks: int = 1) -> int:
+    """Bytes needed to encode any state of a game with this table shape."""
+    return _HEADER.size + _PLAYER.size * num_players + DECK_SIZE * num_decks
+
+
+def encode_into(game: Game, buf, offset: int = 0) -> int:
+    """Write `game` into a writable buffer at `offset`; returns bytes written."""
+    deck = game.deck
+    flags = (
+        (_FLAG_REVERSED if game.is_reversed else 0)
+        | (_FLAG_EXTRA_TURN if game.current_player_gets_extra_turn else 0)
+        | (_FLAG_LAZY if deck.lazy else 0)
+    )
+    winner = game._winner_index
+    _HEADER.pack_into(
+        buf, offset,
+        CODEC_VERSION, len(game.players), deck.num_decks, flags,
+        game.current_player_index, _NO_WINNER if winner is None else winner,
+        len(deck.cards), len(game.discard_pile),
+    )
+    pos = offset + _HEADER.size
+    for p in game.players:
+        _PLAYER.pack_into(buf, pos, len(p.hand), len(p.face_up_cards), len(p.face_down_cards))
+        pos += _PLAYER.size
+
+    for cards in _zones(game):
+        n = len(cards)
+        buf[pos:pos + n] = bytes(card_codes(cards))
+        pos += n
+    return pos - offset
+
+
+def encode(game: Game) -> bytes:
+    buf = bytearray(slot_size(len(game.players), game.deck.num_decks))
+    n = encode_into(game, buf)
+    return bytes(buf[:n])
+
+
+def decode(buf, offset: int = 0, rng: Optional[random.Random] = None,
+           rules: RuleSet = STANDARD_RULES) -> Game:
+    """
+    Rebuild a Game from encode_into()'s layout. Cards come straight from the
+    shared CARD_BY_CODE table; nothing per card is constructed. The layout
+    holds state only, so variant games pass their RuleSet back in.
+    """
+    (version, num_players, num_decks, flags, current, winner,
+     deck_len, pile_len) = _HEADER.unpack_from(buf, offset)
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported state encoding version {version}")
+
+    pos = offset + _HEADER.size
+    sizes = []
+    for _ in range(num_players):
+        sizes.append(_PLAYER.unpack_from(buf, pos))
+        pos += _PLAYER.size
+
+    lookup = CARD_BY_CODE.__getitem__
+    zones = []
+    with memoryview(buf) as view:
+        for n in (deck_len, pile_len, *(n for counts in sizes for n in counts)):
+            zones.append(list(map(lookup, view[pos:pos + n])))
+            pos += n
+
+    game = Game._blank()
+    game.rules = rules
+    game.deck = Deck.from_cards(zones[0], rng=rng, num_decks=num_decks,
+                                lazy=bool(flags & _FLAG_LAZY))
+    game.discard_pile = zones[1]
+    game.players = [
+        PlayerState(
+            name=f"Player {i + 1}",
+            hand=zones[2 + 3 * i],
+            face_up_cards=zones[3 + 3 * i],
+            face_down_cards=zones[4 + 3 * i],
+        )
+        for i in range(num_players)
+    ]
+    game.current_player_index = current
+    game.is_reversed = bool(flags & _FLAG_REVERSED)
+    game.current_player_gets_extra_turn = bool(flags & _FLAG_EXTRA_TURN)
+    game._winner_index = None if winner == _NO_WINNER else winner
+    return game
+
+
+def _zones(game: Game):
+    yield game.deck.cards
+    yield game.discard_pile
+    for p in game.players:
+        yield p.hand
+        yield p.face_up_cards
+        yield p.face_down_cards
+
+
+# Buffers created by this process, and ones it has attached to, by name
+_owned: Dict[str, "SharedStateBuffer"] = {}
+_attached: Dict[str, "SharedStateBuffer"] = {}
+
+
+class SharedStateBuffer:
+    """
+    A row of fixed-size game-state slots in multiprocessing shared memory.
+    The owner creates it and writes states; workers attach by name and
+    decode slots in place, so handing a position to another process costs
+    one encode and no pickling.
+    """
+
+    def __init__(self, num_slots: int, num_players: int, num_decks: int = 1,
+                 name: Optional[str] = None):
+        self.num_slots = num_slots
+        self.num_players = num_players
+        self.num_decks = num_decks
+        self.slot_size = slot_size(num_players, num_decks)
+        self.owner = name is None
+        # Imported here: encode/decode callers shouldn't pay for the
+        # multiprocessing machinery shared memory drags in
+        from multiprocessing import resource_tracker, shared_memory
+
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=num_slots * self.slot_size)
+            _owned[self.shm.name] = self
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            # The creating process owns cleanup; stop this process's resource
+            # tracker from unlinking the segment when it exits.
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+
+    @classmethod
+    def for_game(cls, game: Game, num_slots: int = 1) -> "SharedStateBuffer":
+        return cls(num_slots, len(game.players), game.deck.num_decks)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def layout(self) -> "tuple[str, int, int, int]":
+        """Everything a worker needs to attach: (name, slots, players, decks)."""
+        return (self.name, self.num_slots, self.num_players, self.num_decks)
+
+    @classmethod
+    def attach(cls, name: str, num_slots: int, num_players: int,
+               num_decks: int = 1) -> "SharedStateBuffer":
+        return cls(num_slots, num_players, num_decks, name=name)
+
+    def write(self, slot: int, game: Game) -> None:
+        self._check_slot(slot)
+        encode_into(game, self.shm.buf, slot * self.slot_size)
+
+    def read(self, slot: int, rng: Optional[random.Random] = None,
+             rules: RuleSet = STANDARD_RULES) -> Game:
+        self._check_slot(slot)
+        return decode(self.shm.buf, slot * self.slot_size, rng=rng, rules=rules)
+
+    def _check_slot(self, slot: int) -> None:
+        if not 0 <= slot < self.num_slots:
+            raise IndexError(f"slot {slot} out of range for {self.num_slots} slots")
+
+    def close(self) -> None:
+        self.shm.close()
+        if self.owner:
+            _owned.pop(self.shm.name, None)
+            self.shm.unlink()
+        elif _attached.get(self.shm.name) is self:
+            del _attached[self.shm.name]
+
+    def __enter__(self) -> "SharedStateBuffer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attached_buffer(name: str, num_slots: int, num_players: int,
+                    num_decks: int = 1) -> SharedStateBuffer:
+    """
+    The buffer called `name`, attaching on first use. Pool workers call this
+    per task, so each process maps a buffer once; in the creating process it
+    is the owner itself.
+    """
+    buffer = _owned.get(name) or _attached.get(name)
+    if buffer is None:
+        buffer = _attached[name] = SharedStateBuffer.attach(name, num_slots, num_players, num_decks)
+    return buffer
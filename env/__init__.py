@@ -0,0 +1,3 @@
+from .palace_env import PalaceEnv, VectorPalaceEnv
+
+__all__ = ["PalaceEnv", "VectorPalaceEnv"]
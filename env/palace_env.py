@@ -0,0 +1,215 @@
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.game import Game
+from core.models import Move
+from core.encoding import (
+    ACTION_SIZE,
+    OBS_SIZE,
+    encode_view,
+    move_to_action,
+)
+from agents.player_agent import PlayerAgent
+
+Observation = List[float]
+Info = Dict[str, Any]
+
+
+def _silent(message: str) -> None:
+    pass
+
+
+class PalaceEnv:
+    """
+    Gym-style single-agent environment over core.game.Game.
+
+    One seat is driven by the caller through step(action); every other seat
+    is played internally by a PlayerAgent. Actions use the fixed discrete
+    layout from core.encoding (ACTION_SIZE actions, see legal_action_mask).
+
+    Reward is +1 when the learning player wins, -1 when another player wins,
+    and 0 otherwise.
+    """
+
+    def __init__(
+        self,
+        num_players: int = 2,
+        player_index: int = 0,
+        opponents: Optional[Dict[int, PlayerAgent]] = None,
+        max_turns: int = 1000,
+        num_decks: Optional[int] = None,
+        lazy_deck: bool = False,
+    ):
+        if not 0 <= player_index < num_players:
+            raise ValueError("player_index out of range for num_players")
+
+        self.num_players = num_players
+        self.num_decks = num_decks
+        self.lazy_deck = lazy_deck
+        self.player_index = player_index
+        self.max_turns = max_turns
+        # One generator drives the deck and the default opponents, so a seed
+        # passed to reset() reproduces the whole episode.
+        self.rng = random.Random()
+
+        if opponents is None:
+            from agents.simple_ai_agent import SimpleAIAgent
+            opponents = {
+                i: SimpleAIAgent(output_fn=_silent, rng=self.rng)
+                for i in range(num_players)
+                if i != player_index
+            }
+        self.opponents = opponents
+
+        self.game: Optional[Game] = None
+        self._turns = 0
+        self._action_moves: Dict[int, Move] = {}
+
+    # ---------- gym API ----------
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Observation, Info]:
+        if seed is not None:
+            self.rng.seed(seed)
+
+        self.game = Game(
+            num_players=self.num_players,
+            rng=self.rng,
+            num_decks=self.num_decks,
+            lazy_deck=self.lazy_deck,
+        )
+        self.game.start()
+        self._turns = 0
+        self._play_opponents()
+        return self._observe(), self._info()
+
+    def step(self, action: int) -> Tuple[Observation, float, bool, bool, Info]:
+        game = self._require_game()
+        if game.is_game_over():
+            raise RuntimeError("step() called on a finished episode; call reset()")
+
+        move = self._action_moves.get(action)
+        if move is None:
+            raise ValueError(f"Action {action} is not legal in the current state")
+
+        game.apply_move(self.player_index, move)
+        game.end_turn()
+        self._turns += 1
+        self._play_opponents()
+
+        terminated = game.is_game_over()
+        truncated = not terminated and self._turns >= self.max_turns
+        return self._observe(), self._reward(), terminated, truncated, self._info()
+
+    def legal_action_mask(self) -> List[bool]:
+        mask = [False] * ACTION_SIZE
+        for action in self._action_moves:
+            mask[action] = True
+        return mask
+
+    @property
+    def action_size(self) -> int:
+        return ACTION_SIZE
+
+    @property
+    def observation_size(self) -> int:
+        return OBS_SIZE
+
+    # ---------- helpers ----------
+
+    def _require_game(self) -> Game:
+        if self.game is None:
+            raise RuntimeError("reset() must be called before step()")
+        return self.game
+
+    def _play_opponents(self) -> None:
+        """Run opponent turns until it's the learner's move or the game ends."""
+        game = self._require_game()
+        while not game.is_game_over() and game.current_player_index != self.player_index:
+            pid = game.current_player_index
+            valid_moves = game.get_valid_moves(pid)
+            if not valid_moves:
+                game.advance_turn()
+                continue
+            move = self.opponents[pid].choose_move(game.get_view_for_player(pid), valid_moves)
+            game.apply_move(pid, move)
+            game.end_turn()
+
+    def _observe(self) -> Observation:
+        game = self._require_game()
+        view = game.get_view_for_player(self.player_index)
+
+        # Cache the action -> Move table for the decision the learner now faces
+        self._action_moves = {}
+        if not game.is_game_over():
+            for move in game.get_valid_moves(self.player_index):
+                self._action_moves.setdefault(move_to_action(view, move), move)
+
+        return encode_view(view)
+
+    def _reward(self) -> float:
+        winner = self._require_game().get_winner()
+        if winner is None:
+            return 0.0
+        return 1.0 if winner is self.game.players[self.player_index] else -1.0
+
+    def _info(self) -> Info:
+        return {"action_mask": self.legal_action_mask()}
+
+
+class VectorPalaceEnv:
+    """
+    Steps N independent PalaceEnvs in lockstep. Finished episodes are reset
+    automatically; the last observation of the finished episode is returned
+    in that env's info under "final_observation".
+    """
+
+    def __init__(self, num_envs: int, env_fn: Optional[Callable[[], PalaceEnv]] = None,
+                 **env_kwargs):
+        if num_envs < 1:
+            raise ValueError("num_envs must be at least 1")
+        if env_fn is None:
+            env_fn = lambda: PalaceEnv(**env_kwargs)
+        self.envs: List[PalaceEnv] = [env_fn() for _ in range(num_envs)]
+
+    @property
+    def num_envs(self) -> int:
+        return len(self.envs)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[List[Observation], List[Info]]:
+        observations: List[Observation] = []
+        infos: List[Info] = []
+        for i, env in enumerate(self.envs):
+            obs, info = env.reset(seed=None if seed is None else seed + i)
+            observations.append(obs)
+            infos.append(info)
+        return observations, infos
+
+    def step(
+        self, actions: List[int]
+    ) -> Tuple[List[Observation], List[float], List[bool], List[bool], List[Info]]:
+        if len(actions) != len(self.envs):
+            raise ValueError("Need exactly one action per environment")
+
+        observations: List[Observation] = []
+        rewards: List[float] = []
+        terminated: List[bool] = []
+        truncated: List[bool] = []
+        infos: List[Info] = []
+
+        for env, action in zip(self.envs, actions):
+            obs, reward, term, trunc, info = env.step(action)
+            if term or trunc:
+                # Continue the env's own RNG stream so runs stay reproducible
+                info = dict(info, final_observation=obs)
+                obs, reset_info = env.reset()
+                info["action_mask"] = reset_info["action_mask"]
+            observations.append(obs)
+            rewards.append(reward)
+            terminated.append(term)
+            truncated.append(trunc)
+            infos.append(info)
+
+        return observations, rewards, terminated, truncated, infos
+
+    def legal_action_masks(self) -> List[List[bool]]:
+        return [env.legal_action_mask() for env in self.envs]
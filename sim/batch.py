@@ -0,0 +1,242 @@
+"""
+Seeded batch simulation: play many random games under one RuleSet across a
+process pool and fold each game into streaming accumulators (sim.stats) as
+it finishes. Workers return one BatchStats per chunk of seeds, so memory
+stays flat however many games are played. With a checkpoint path, finished
+seed ranges and the running aggregates are saved as the run goes, and a
+rerun with the same arguments resumes where it stopped. With a
+sim.profiling.StackProfile, each worker also samples its own stacks and the
+samples are merged into it.
+"""
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from core.game import Game
+from core.fileio import save_atomic
+from core.rules import RuleSet, STANDARD_RULES
+from sim.profiling import Sampler, StackProfile
+from sim.seeds import MOVE_SEED_OFFSET, seed_chunks
+from sim.stats import Proportion, RunningStats
+
+
+class GameResult(NamedTuple):
+    plies: int
+    pickups: int
+    winner: Optional[int]     # None if the game hit max_plies
+
+
+def play_game(seed: int, rules: RuleSet = STANDARD_RULES, num_players: int = 2,
+              max_plies: int = 5000, lazy_deck: bool = False) -> GameResult:
+    """Play one game of uniformly random moves; the same seed replays it exactly."""
+    game = Game(num_players=num_players, rng=random.Random(seed), lazy_deck=lazy_deck, rules=rules)
+    game.start()
+    move_rng = random.Random(seed + MOVE_SEED_OFFSET)
+
+    pickups = 0
+    for ply in range(max_plies):
+        if game._winner_index is not None:
+            return GameResult(ply, pickups, game._winner_index)
+        pid = game.current_player_index
+        moves = game.get_valid_moves(pid)
+        if not moves:
+            game.advance_turn()
+            continue
+        move = move_rng.choice(moves)
+        if move.kind == "pickup":
+            pickups += 1
+        game.apply_move(pid, move)
+        game.end_turn()
+    return GameResult(max_plies, pickups, game._winner_index)
+
+
+@dataclass
+class BatchStats:
+    num_players: int = 2
+    games: int = 0
+    unfinished: int = 0
+    seconds: float = 0.0
+    plies: RunningStats = field(default_factory=RunningStats)          # finished games only
+    pickups: RunningStats = field(default_factory=RunningStats)        # per game
+    pickup_rate: Proportion = field(default_factory=Proportion)        # pickups per move
+    first_player_wins: Proportion = field(default_factory=Proportion)  # over finished games
+    seat_wins: List[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.seat_wins:
+            self.seat_wins = [0] * self.num_players
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.pickups.push(result.pickups)
+        self.pickup_rate.hits += result.pickups
+        self.pickup_rate.trials += result.plies
+        if result.winner is None:
+            self.unfinished += 1
+            return
+        self.plies.push(result.plies)
+        self.first_player_wins.push(result.winner == 0)
+        self.seat_wins[result.winner] += 1
+
+    def merge(self, other: "BatchStats") -> None:
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.plies.merge(other.plies)
+        self.pickups.merge(other.pickups)
+        self.pickup_rate.merge(other.pickup_rate)
+        self.first_player_wins.merge(other.first_player_wins)
+        for seat, wins in enumerate(other.seat_wins):
+            self.seat_wins[seat] += wins
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BatchStats":
+        return cls(
+            num_players=data["num_players"],
+            games=data["games"],
+            unfinished=data["unfinished"],
+            seconds=data["seconds"],
+            plies=RunningStats(**data["plies"]),
+            pickups=RunningStats(**data["pickups"]),
+            pickup_rate=Proportion(**data["pickup_rate"]),
+            first_player_wins=Proportion(**data["first_player_wins"]),
+            seat_wins=list(data["seat_wins"]),
+        )
+
+    @property
+    def first_player_advantage(self) -> float:
+        """Seat 0's win rate above the fair 1/num_players share."""
+        return self.first_player_wins.rate - 1.0 / self.num_players
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+_Chunk = Tuple[int, int, RuleSet, int, int, bool, float]
+
+
+def _batch_range(args: _Chunk) -> Tuple[int, int, BatchStats, Optional[StackProfile]]:
+    start, stop, rules, num_players, max_plies, lazy_deck, profile_interval = args
+    stats = BatchStats(num_players=num_players)
+    sampler = Sampler(StackProfile(profile_interval)) if profile_interval else None
+    if sampler:
+        sampler.start()
+    try:
+        for seed in range(start, stop):
+            stats.add(play_game(seed, rules, num_players, max_plies, lazy_deck))
+    finally:
+        if sampler:
+            sampler.stop()
+    return start, stop, stats, sampler.profile if sampler else None
+
+
+def _merge_ranges(ranges: List[List[int]]) -> List[List[int]]:
+    merged: List[List[int]] = []
+    for lo, hi in sorted(ranges):
+        if merged and lo <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return merged
+
+
+def _covered(ranges: List[List[int]], lo: int, hi: int) -> bool:
+    return any(a <= lo and hi <= b for a, b in ranges)
+
+
+def run_batch(
+    games: int,
+    rules: RuleSet = STANDARD_RULES,
+    workers: int = 1,
+    first_seed: int = 0,
+    num_players: int = 2,
+    max_plies: int = 5000,
+    lazy_deck: bool = False,
+    chunk_size: int = 500,
+    progress: Optional[Callable[[BatchStats], None]] = None,
+    pool=None,
+    checkpoint: Optional[str] = None,
+    checkpoint_every: float = 30.0,
+    profile: Optional[StackProfile] = None,
+) -> BatchStats:
+    """
+    Play seeds [first_seed, first_seed + games) under `rules` and return the
+    merged statistics. Chunks are merged as they arrive (in any order; the
+    accumulators are order-independent). Pass an open multiprocessing Pool
+    to share one across several batches; otherwise one is started for
+    `workers` > 1.
+
+    With `checkpoint`, the finished seed ranges and aggregates are written
+    there (atomically) at most every `checkpoint_every` seconds and at the
+    end. If the file exists, its chunks are skipped and its aggregates
+    carried on; it must come from a run with the same arguments. Every game
+    derives its deck and move RNGs from its seed, so there is no RNG state
+    to carry over and a resumed run gives the same totals as an unbroken one.
+
+    With `profile`, every chunk played in this call is stack-sampled at
+    `profile.interval` and merged into it (chunks resumed from a checkpoint
+    were not, so the profile covers only this call's share).
+    """
+    config = {
+        "games": games, "rules": rules.to_dict(), "first_seed": first_seed,
+        "num_players": num_players, "max_plies": max_plies, "lazy_deck": lazy_deck,
+        "chunk_size": chunk_size,
+    }
+    stats = BatchStats(num_players=num_players)
+    done: List[List[int]] = []
+    if checkpoint is not None and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            saved = json.load(f)
+        if saved["config"] != config:
+            raise ValueError(f"Checkpoint {checkpoint} is from a different run: {saved['config']}")
+        stats = BatchStats.from_dict(saved["stats"])
+        done = saved["done"]
+
+    tasks = [
+        (lo, hi, rules, num_players, max_plies, lazy_deck, profile.interval if profile else 0.0)
+        for lo, hi in seed_chunks(first_seed, first_seed + games, chunk_size)
+        if not _covered(done, lo, hi)
+    ]
+    started = time.perf_counter()
+    prior_seconds = stats.seconds
+    last_saved = started
+
+    def save() -> None:
+        save_atomic(checkpoint, {"config": config, "done": done, "stats": stats.to_dict()})
+
+    def consume(chunks) -> None:
+        nonlocal done, last_saved
+        for lo, hi, chunk, sampled in chunks:
+            stats.merge(chunk)
+            if sampled is not None:
+                profile.merge(sampled)
+            now = time.perf_counter()
+            stats.seconds = prior_seconds + now - started
+            if checkpoint is not None:
+                done = _merge_ranges(done + [[lo, hi]])
+                if now - last_saved >= checkpoint_every:
+                    save()
+                    last_saved = now
+            if progress:
+                progress(stats)
+
+    if pool is not None:
+        consume(pool.imap_unordered(_batch_range, tasks))
+    elif workers <= 1 or not tasks:
+        consume(map(_batch_range, tasks))
+    else:
+        from multiprocessing import Pool
+
+        with Pool(workers) as own_pool:
+            consume(own_pool.imap_unordered(_batch_range, tasks))
+
+    stats.seconds = prior_seconds + time.perf_counter() - started
+    if checkpoint is not None:
+        save()
+    return stats
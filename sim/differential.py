@@ -0,0 +1,379 @@
+"""
+Differential fuzzing: play random seeded move sequences on the reference
+core.game.Game and on alternate engines side by side, and compare the full
+state (core.snapshot) after every step.
+
+Run with: python -m sim.differential --games 1000000 --workers 8
+Add --rules eight-skip (any sim.variants preset) to fuzz a rule variant.
+"""
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core import state_codec
+from core.game import Game
+from core.models import Card, Move
+from core.rules import RuleSet, STANDARD_RULES
+from core.snapshot import Snapshot, restore, snapshot
+from sim.seeds import MOVE_SEED_OFFSET, seed_chunks
+
+
+class Engine:
+    """
+    Adapter the harness drives. The base class simply forwards to a Game,
+    which makes it the reference engine; alternates override what they
+    implement differently.
+    """
+
+    name = "reference"
+
+    def __init__(self, game: Game):
+        self.game = game
+
+    def valid_moves(self, player_index: int) -> List[Move]:
+        return self.game.get_valid_moves(player_index)
+
+    def apply(self, player_index: int, move: Move) -> None:
+        self.game.apply_move(player_index, move)
+        self.game.end_turn()
+
+    def advance_turn(self) -> None:
+        self.game.advance_turn()
+
+    def state(self) -> Snapshot:
+        return snapshot(self.game)
+
+
+class CloneEngine(Engine):
+    """Clones the game before every move and continues on the copy."""
+
+    name = "clone"
+
+    def apply(self, player_index: int, move: Move) -> None:
+        self.game = self.game.clone(rng=self.game.deck.rng)
+        super().apply(player_index, move)
+
+
+class FoldedCloneEngine(Engine):
+    """Continues on a suit-folded clone; compared on the suit-free state key."""
+
+    name = "folded-clone"
+
+    def apply(self, player_index: int, move: Move) -> None:
+        self.game = self.game.clone(fold_suits=True, rng=self.game.deck.rng)
+        super().apply(player_index, move)
+
+    def state(self):
+        return self.game.state_key()
+
+
+class SnapshotEngine(Engine):
+    """Round-trips the game through snapshot()/restore() before every move."""
+
+    name = "snapshot"
+
+    def apply(self, player_index: int, move: Move) -> None:
+        self.game = restore(snapshot(self.game), rng=self.game.deck.rng, rules=self.game.rules)
+        super().apply(player_index, move)
+
+
+class CodecEngine(Engine):
+    """Round-trips the game through the fixed binary layout before every move."""
+
+    name = "codec"
+
+    def __init__(self, game: Game):
+        super().__init__(game)
+        self.buf = bytearray(state_codec.slot_size(len(game.players), game.deck.num_decks))
+
+    def apply(self, player_index: int, move: Move) -> None:
+        state_codec.encode_into(self.game, self.buf)
+        self.game = state_codec.decode(self.buf, rng=self.game.deck.rng, rules=self.game.rules)
+        super().apply(player_index, move)
+
+
+class UndoEngine(Engine):
+    """
+    Plays through push_move(), and after every move also checks that
+    pop_move() restores the previous state exactly before re-pushing.
+    """
+
+    name = "undo"
+
+    def __init__(self, game: Game):
+        super().__init__(game)
+        self.undo_failed_at: Optional[int] = None
+
+    def apply(self, player_index: int, move: Move) -> None:
+        game = self.game
+        if game.current_player_index != player_index:
+            raise ValueError("push_move always plays for the current player")
+
+        before = snapshot(game)
+        rng_state = game.deck.rng.getstate()
+        game.push_move(move)
+        game.pop_move()
+        if snapshot(game) != before and self.undo_failed_at is None:
+            self.undo_failed_at = game.undo_depth
+
+        # Rewind the RNG so a lazy deck draws the same cards again
+        game.deck.rng.setstate(rng_state)
+        game.push_move(move)
+
+    def state(self):
+        if self.undo_failed_at is not None:
+            return ("pop_move did not restore state", self.undo_failed_at)
+        return super().state()
+
+
+def _scan_effective_top(pile: Sequence[Card]) -> Optional[Card]:
+    for card in reversed(pile):
+        if card.rank != "3":
+            return card
+    return None
+
+
+def _scan_top_run(pile: Sequence[Card]) -> int:
+    run = 0
+    for card in reversed(pile):
+        if card.rank != pile[-1].rank:
+            break
+        run += 1
+    return run
+
+
+class PileIndexEngine(Engine):
+    """
+    Checks the discard pile's run-length index against a plain backwards
+    scan of the pile after every move.
+    """
+
+    name = "pile-index"
+
+    def __init__(self, game: Game):
+        super().__init__(game)
+        self.index_wrong = False
+
+    def apply(self, player_index: int, move: Move) -> None:
+        super().apply(player_index, move)
+        pile = self.game.discard_pile
+        if (pile.effective_top is not _scan_effective_top(pile)
+                or pile.top_run_length != _scan_top_run(pile)):
+            self.index_wrong = True
+
+    def state(self):
+        if self.index_wrong:
+            return ("pile index out of sync with pile",)
+        return super().state()
+
+
+# name -> factory(game, rng) building an engine that starts from `game`'s state
+ENGINES: Dict[str, Callable[[Game, random.Random], Engine]] = {
+    CloneEngine.name: lambda game, rng: CloneEngine(game.clone(rng=rng)),
+    FoldedCloneEngine.name: lambda game, rng: FoldedCloneEngine(game.clone(rng=rng)),
+    SnapshotEngine.name: lambda game, rng: SnapshotEngine(game.clone(rng=rng)),
+    CodecEngine.name: lambda game, rng: CodecEngine(game.clone(rng=rng)),
+    UndoEngine.name: lambda game, rng: UndoEngine(game.clone(rng=rng)),
+    PileIndexEngine.name: lambda game, rng: PileIndexEngine(game.clone(rng=rng)),
+}
+
+# Engines whose state() is the suit-free key rather than a full snapshot
+_KEYED_ENGINES = {FoldedCloneEngine.name}
+
+
+@dataclass
+class Divergence:
+    seed: int
+    step: int
+    engine: str
+    detail: str
+
+
+@dataclass
+class FuzzReport:
+    games: int = 0
+    steps: int = 0
+    seconds: float = 0.0
+    divergences: List[Divergence] = field(default_factory=list)
+
+    def merge(self, other: "FuzzReport") -> None:
+        self.games += other.games
+        self.steps += other.steps
+        self.divergences.extend(other.divergences)
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.seconds if self.seconds else 0.0
+
+
+def _copied_rng(rng: random.Random) -> random.Random:
+    copy = random.Random()
+    copy.setstate(rng.getstate())
+    return copy
+
+
+def fuzz_game(seed: int, engine_names: Sequence[str], max_plies: int = 2000,
+              num_players: int = 2, lazy_deck: bool = False,
+              rules: RuleSet = STANDARD_RULES) -> Tuple[int, Optional[Divergence]]:
+    """
+    Play one random game from `seed` under `rules` on the reference and every
+    named engine. Returns (steps played, first divergence or None). With
+    lazy_deck, every engine draws from its own copy of the same RNG stream.
+    """
+    deck_rng = random.Random(seed)
+    reference = Engine(Game(num_players=num_players, rng=deck_rng, lazy_deck=lazy_deck,
+                            rules=rules))
+    reference.game.start()
+
+    alternates = [
+        (name, ENGINES[name](reference.game, _copied_rng(deck_rng))) for name in engine_names
+    ]
+    move_rng = random.Random(seed + MOVE_SEED_OFFSET)
+
+    for step in range(max_plies):
+        game = reference.game
+        if game.is_game_over():
+            return step, None
+
+        pid = game.current_player_index
+        moves = reference.valid_moves(pid)
+        for name, engine in alternates:
+            other_moves = engine.valid_moves(pid)
+            if other_moves != moves:
+                return step, Divergence(seed, step, name, f"valid moves {other_moves} != {moves}")
+
+        if not moves:
+            reference.advance_turn()
+            for _, engine in alternates:
+                engine.advance_turn()
+            continue
+
+        move = move_rng.choice(moves)
+        reference.apply(pid, move)
+        expected = reference.state()
+        expected_key = None
+        for name, engine in alternates:
+            engine.apply(pid, move)
+            if name in _KEYED_ENGINES:
+                if expected_key is None:
+                    expected_key = reference.game.state_key()
+                ok = engine.state() == expected_key
+            else:
+                ok = engine.state() == expected
+            if not ok:
+                return step + 1, Divergence(seed, step + 1, name, f"state differs after {move}")
+
+    return max_plies, None
+
+
+def _fuzz_range(args: Tuple[int, int, Tuple[str, ...], int, int, bool, RuleSet]) -> FuzzReport:
+    start, stop, engine_names, max_plies, num_players, lazy_deck, rules = args
+    report = FuzzReport()
+    for seed in range(start, stop):
+        steps, divergence = fuzz_game(seed, engine_names, max_plies, num_players, lazy_deck,
+                                      rules)
+        report.games += 1
+        report.steps += steps
+        if divergence is not None:
+            report.divergences.append(divergence)
+    return report
+
+
+def run_fuzz(
+    games: int,
+    engine_names: Sequence[str] = tuple(ENGINES),
+    workers: int = 1,
+    first_seed: int = 0,
+    max_plies: int = 2000,
+    num_players: int = 2,
+    lazy_deck: bool = False,
+    chunk_size: int = 500,
+    progress: Optional[Callable[[FuzzReport], None]] = None,
+    rules: RuleSet = STANDARD_RULES,
+) -> FuzzReport:
+    """Fuzz seeds [first_seed, first_seed + games) across `workers` processes."""
+    unknown = set(engine_names) - set(ENGINES)
+    if unknown:
+        raise ValueError(f"Unknown engines: {sorted(unknown)}")
+
+    tasks = [
+        (lo, hi, tuple(engine_names), max_plies, num_players, lazy_deck, rules)
+        for lo, hi in seed_chunks(first_seed, first_seed + games, chunk_size)
+    ]
+    report = FuzzReport()
+    started = time.perf_counter()
+
+    if workers <= 1:
+        results = map(_fuzz_range, tasks)
+        for chunk in results:
+            report.merge(chunk)
+            report.seconds = time.perf_counter() - started
+            if progress:
+                progress(report)
+    else:
+        from multiprocessing import Pool
+
+        with Pool(workers) as pool:
+            for chunk in pool.imap_unordered(_fuzz_range, tasks):
+                report.merge(chunk)
+                report.seconds = time.perf_counter() - started
+                if progress:
+                    progress(report)
+
+    report.seconds = time.perf_counter() - started
+    report.divergences.sort(key=lambda d: (d.seed, d.engine))
+    return report
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Differential fuzzing of Game engines")
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--max-plies", type=int, default=2000)
+    parser.add_argument("--lazy-deck", action="store_true",
+                        help="draw lazily instead of pre-shuffling")
+    parser.add_argument("--engines", default=",".join(ENGINES),
+                        help=f"comma-separated subset of: {', '.join(ENGINES)}")
+    parser.add_argument("--rules", default=STANDARD_RULES.name,
+                        help="rule variant: a sim.variants preset name or a RuleSet JSON file")
+    args = parser.parse_args()
+
+    from sim.variants import PRESETS, load_variants
+
+    if args.rules in PRESETS:
+        rules = PRESETS[args.rules]
+    elif os.path.exists(args.rules):
+        rules, = load_variants(args.rules)
+    else:
+        parser.error(f"unknown rules {args.rules!r}; presets: {', '.join(PRESETS)}")
+
+    def progress(report: FuzzReport) -> None:
+        print(f"\r{report.games} games, {report.steps} steps, "
+              f"{report.steps_per_second:,.0f} steps/s, "
+              f"{len(report.divergences)} divergences", end="", flush=True)
+
+    report = run_fuzz(
+        args.games,
+        engine_names=[e for e in args.engines.split(",") if e],
+        workers=args.workers,
+        first_seed=args.seed,
+        max_plies=args.max_plies,
+        num_players=args.players,
+        lazy_deck=args.lazy_deck,
+        progress=progress,
+        rules=rules,
+    )
+    print()
+    for d in report.divergences[:20]:
+        print(f"seed {d.seed} step {d.step} [{d.engine}]: {d.detail}")
+    raise SystemExit(1 if report.divergences else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Opening-book builder: deal many seeded games, score every legal move of the
+first few decisions with determinized random playouts (RootSearch), and
+keep the best move per opening class. A class is core.canonical.view_key,
+i.e. the rank multisets of hand and face-up plus the pile state, so every
+suit permutation of a deal shares one entry.
+
+Run with: python -m sim.opening_book --games 100000 --workers 8 --out book.json
+and play from it with agents.book_agent.BookAgent. --profile stacks.txt
+samples where the search time goes (see sim.profiling).
+"""
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.canonical import MoveSignature, ViewKey, move_signature, view_key
+from core.game import Game
+from agents.book_agent import Book, save_book
+from agents.monte_carlo_agent import RootSearch
+from sim.profiling import Sampler, StackProfile
+from sim.seeds import MOVE_SEED_OFFSET, seed_chunks
+
+# view key -> move signature -> [reward sum, playouts]
+Table = Dict[ViewKey, Dict[MoveSignature, List[float]]]
+
+
+@dataclass
+class BookBuild:
+    games: int = 0
+    positions: int = 0
+    playouts: int = 0
+    seconds: float = 0.0
+    table: Table = field(default_factory=dict)
+
+    def merge(self, other: "BookBuild") -> None:
+        self.games += other.games
+        self.positions += other.positions
+        self.playouts += other.playouts
+        for key, moves in other.table.items():
+            mine = self.table.setdefault(key, {})
+            for sig, (reward, visits) in moves.items():
+                entry = mine.setdefault(sig, [0.0, 0])
+                entry[0] += reward
+                entry[1] += visits
+
+
+def score_openings(seed: int, book_plies: int = 2, playouts_per_move: int = 32,
+                   rollout_limit: int = 200, num_players: int = 2) -> BookBuild:
+    """
+    Play the first `book_plies` decisions of the deal from `seed`. Each one
+    with a real choice is scored by RootSearch over resampled hidden cards;
+    the game then continues with a random move so later plies see varied
+    positions.
+    """
+    build = BookBuild(games=1)
+    game = Game(num_players=num_players, rng=random.Random(seed))
+    game.start()
+    rng = random.Random(seed + MOVE_SEED_OFFSET)
+
+    for _ in range(book_plies):
+        if game.is_game_over():
+            break
+        pid = game.current_player_index
+        moves = game.get_valid_moves(pid)
+        if not moves:
+            game.advance_turn()
+            continue
+        if len(moves) > 1:
+            view = game.get_view_for_player(pid)
+            search = RootSearch(game.clone(rng=rng), pid, moves, rng, rollout_limit=rollout_limit)
+            for _ in range(playouts_per_move * len(moves)):
+                search.iterate()
+            scores = build.table.setdefault(view_key(view), {})
+            for move, reward, visits in zip(moves, search.rewards, search.visits):
+                entry = scores.setdefault(move_signature(view, move), [0.0, 0])
+                entry[0] += reward
+                entry[1] += visits
+            build.positions += 1
+            build.playouts += search.total_visits
+        game.apply_move(pid, rng.choice(moves))
+        game.end_turn()
+    return build
+
+
+def distill(table: Table, min_playouts: int = 64) -> Book:
+    """Best move (highest mean playout reward) per class with enough playouts behind it."""
+    book: Book = {}
+    for key, moves in table.items():
+        if sum(visits for _, visits in moves.values()) < min_playouts:
+            continue
+        best = max(moves.items(), key=lambda item: item[1][0] / item[1][1] if item[1][1] else 0.0)
+        book[key] = best[0]
+    return book
+
+
+_Chunk = Tuple[int, int, int, int, int, int, float]
+
+
+def _score_range(args: _Chunk) -> Tuple[BookBuild, Optional[StackProfile]]:
+    start, stop, book_plies, playouts_per_move, rollout_limit, num_players, profile_interval = args
+    build = BookBuild()
+    sampler = Sampler(StackProfile(profile_interval)) if profile_interval else None
+    if sampler:
+        sampler.start()
+    try:
+        for seed in range(start, stop):
+            build.merge(score_openings(seed, book_plies, playouts_per_move, rollout_limit,
+                                       num_players))
+    finally:
+        if sampler:
+            sampler.stop()
+    return build, sampler.profile if sampler else None
+
+
+def build_book(
+    games: int,
+    workers: int = 1,
+    first_seed: int = 0,
+    book_plies: int = 2,
+    playouts_per_move: int = 32,
+    rollout_limit: int = 200,
+    num_players: int = 2,
+    chunk_size: int = 50,
+    progress: Optional[Callable[[BookBuild], None]] = None,
+    profile: Optional[StackProfile] = None,
+) -> BookBuild:
+    """
+    Score the openings of seeds [first_seed, first_seed + games) across
+    `workers` processes. With `profile`, every worker's stack samples are
+    merged into it.
+    """
+    tasks = [
+        (lo, hi, book_plies, playouts_per_move, rollout_limit, num_players,
+         profile.interval if profile else 0.0)
+        for lo, hi in seed_chunks(first_seed, first_seed + games, chunk_size)
+    ]
+    build = BookBuild()
+    started = time.perf_counter()
+
+    def consume(chunks) -> None:
+        for chunk, sampled in chunks:
+            build.merge(chunk)
+            if sampled is not None:
+                profile.merge(sampled)
+            build.seconds = time.perf_counter() - started
+            if progress:
+                progress(build)
+
+    if workers <= 1:
+        consume(map(_score_range, tasks))
+    else:
+        from multiprocessing import Pool
+
+        with Pool(workers) as pool:
+            consume(pool.imap_unordered(_score_range, tasks))
+
+    build.seconds = time.perf_counter() - started
+    return build
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build an opening book from simulated playouts")
+    parser.add_argument("--games", type=int, default=10_000, help="deals to sample")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--plies", type=int, default=2, help="decisions per deal to book")
+    parser.add_argument("--playouts", type=int, default=32, help="playouts per legal move")
+    parser.add_argument("--rollout-limit", type=int, default=200)
+    parser.add_argument("--min-playouts", type=int, default=64,
+                        help="playouts a class needs before it gets a book move")
+    parser.add_argument("--out", default="book.json")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample stacks in every worker; write collapsed stacks here")
+    parser.add_argument("--profile-interval", type=float, default=1.0, help="milliseconds")
+    parser.add_argument("--profile-top", type=int, default=20, help="functions in the summary")
+    args = parser.parse_args()
+
+    def progress(build: BookBuild) -> None:
+        print(f"\r{build.games} deals, {len(build.table)} classes, "
+              f"{build.playouts / build.seconds if build.seconds else 0:,.0f} playouts/s",
+              end="", flush=True)
+
+    profile = StackProfile(args.profile_interval / 1e3) if args.profile else None
+    build = build_book(
+        args.games,
+        workers=args.workers,
+        first_seed=args.seed,
+        book_plies=args.plies,
+        playouts_per_move=args.playouts,
+        rollout_limit=args.rollout_limit,
+        num_players=args.players,
+        progress=progress,
+        profile=profile,
+    )
+    book = distill(build.table, args.min_playouts)
+    save_book(args.out, book)
+    print(f"\n{len(book)} of {len(build.table)} classes booked -> {args.out}")
+    if profile is not None:
+        profile.write_collapsed(args.profile)
+        print()
+        print(profile.summary(args.profile_top))
+
+
+if __name__ == "__main__":
+    main()
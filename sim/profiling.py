@@ -0,0 +1,155 @@
+"""
+Sampling profiler for simulation runs. A Sampler arms a SIGPROF interval
+timer (CPU time, so idle pool workers cost nothing) and records the Python
+stack at every tick into a StackProfile: collapsed stacks, ready for
+flamegraph.pl or speedscope, plus per-layer sample counts. Workers profile
+their own chunks and ship the StackProfile back with the results; profiles
+merge by adding counts, so a whole pool reduces to one report.
+
+A sample is charged to the layer of its innermost repository frame:
+core/ is the engine, controller/ the controller, agents/ the agents and
+sim/ the runner itself. Library frames (random.choice, say) stay in the
+stacks but are charged to whoever called them.
+
+The timer fires on the kernel's tick, so the effective interval can be
+coarser than the one asked for; shares are unaffected, and the report
+states the interval actually achieved from measured CPU time.
+
+Unix only (SIGPROF), and a Sampler must run in the process's main thread.
+"""
+import os
+import signal
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAYERS: Dict[str, str] = {
+    "core": "engine",
+    "controller": "controller",
+    "agents": "agent",
+    "sim": "runner",
+}
+
+# code object -> (frame label, layer or None for frames outside the repo)
+_labels: Dict[object, Tuple[str, Optional[str]]] = {}
+
+
+def _label(code) -> Tuple[str, Optional[str]]:
+    cached = _labels.get(code)
+    if cached is None:
+        path = code.co_filename
+        name = getattr(code, "co_qualname", code.co_name)
+        if not path.startswith("<") and os.path.abspath(path).startswith(ROOT + os.sep):
+            path = os.path.abspath(path)
+            rel = os.path.relpath(path, ROOT).replace(os.sep, "/")
+            cached = (f"{rel}:{name}", LAYERS.get(rel.split("/", 1)[0], "other"))
+        else:
+            cached = (f"{os.path.basename(path)}:{name}", None)
+        _labels[code] = cached
+    return cached
+
+
+@dataclass
+class StackProfile:
+    interval: float = 0.001
+    stacks: Counter = field(default_factory=Counter)    # "outer;...;inner" -> samples
+    layers: Counter = field(default_factory=Counter)    # layer -> samples
+    cpu_seconds: float = 0.0                             # process CPU time while sampling
+
+    @property
+    def samples(self) -> int:
+        return sum(self.layers.values())
+
+    def merge(self, other: "StackProfile") -> None:
+        self.stacks.update(other.stacks)
+        self.layers.update(other.layers)
+        self.cpu_seconds += other.cpu_seconds
+
+    def top(self, n: int = 20) -> List[Tuple[str, int, int]]:
+        """The n functions with the most self samples, as (function, self, total)."""
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+        return [(name, samples, total[name]) for name, samples in own.most_common(n)]
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+    def summary(self, n: int = 20) -> str:
+        samples = self.samples
+        if not samples:
+            return "profile: no samples"
+        lines = [f"profile: {samples:,} samples over {self.cpu_seconds:,.2f}s CPU "
+                 f"(one per {self.cpu_seconds / samples * 1e3:.2g} ms)", "",
+                 f"{'layer':<12}{'samples':>10}{'share':>8}"]
+        for layer, count in self.layers.most_common():
+            lines.append(f"{layer:<12}{count:>10,}{count / samples:>8.1%}")
+        lines += ["", f"{'self':>7}{'total':>8}  function"]
+        for name, own, total in self.top(n):
+            lines.append(f"{own / samples:>7.1%}{total / samples:>8.1%}  {name}")
+        return "\n".join(lines)
+
+
+class Sampler:
+    """
+    Records the interrupted stack every `profile.interval` seconds of CPU
+    time between start() and stop(). Stacks are rooted at the function that
+    started the sampler, so whatever ran above it (the interpreter, a pool
+    worker loop, frames inherited through fork) is left out.
+    """
+
+    def __init__(self, profile: Optional[StackProfile] = None):
+        self.profile = profile if profile is not None else StackProfile()
+        self._previous = None
+        self._base = None
+        self._started = 0.0
+
+    def _sample(self, signum, frame) -> None:
+        frames = []
+        layer = None
+        while frame is not None:
+            label, frame_layer = _label(frame.f_code)
+            frames.append(label)
+            if layer is None:
+                layer = frame_layer
+            if frame is self._base:
+                break
+            frame = frame.f_back
+        self.profile.stacks[";".join(reversed(frames))] += 1
+        self.profile.layers[layer or "other"] += 1
+
+    def _start(self, base) -> None:
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("Sampling profiler needs SIGPROF (Unix only)")
+        self._base = base
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        self._started = time.process_time()
+        signal.setitimer(signal.ITIMER_PROF, self.profile.interval, self.profile.interval)
+
+    def start(self) -> None:
+        self._start(sys._getframe(1))
+
+    def stop(self) -> StackProfile:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        self.profile.cpu_seconds += time.process_time() - self._started
+        signal.signal(signal.SIGPROF, self._previous or signal.SIG_DFL)
+        self._base = None
+        return self.profile
+
+    def __enter__(self) -> "Sampler":
+        self._start(sys._getframe(1))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
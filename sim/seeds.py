@@ -0,0 +1,17 @@
+"""
+Seed bookkeeping shared by the seeded simulation runners. A game is fully
+determined by its seed: the deck is shuffled from Random(seed) and the
+moves drawn from Random(seed + MOVE_SEED_OFFSET), so work can be split into
+seed ranges and replayed or resumed anywhere.
+"""
+from typing import Iterator, Tuple
+
+# Golden-ratio constant: keeps a game's move stream well clear of the deck
+# streams of nearby seeds
+MOVE_SEED_OFFSET = 0x9E3779B9
+
+
+def seed_chunks(start: int, stop: int, size: int) -> Iterator[Tuple[int, int]]:
+    """Split seeds [start, stop) into consecutive (lo, hi) ranges of at most `size`."""
+    for lo in range(start, stop, size):
+        yield lo, min(lo + size, stop)
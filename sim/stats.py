@@ -0,0 +1,83 @@
+"""
+Streaming accumulators for simulation metrics. Each one takes samples one
+at a time in O(1) memory, and two accumulators built in different worker
+processes merge exactly, so batch runs never hold per-game results.
+"""
+import math
+from dataclasses import dataclass
+
+
+@dataclass
+class RunningStats:
+    """Count, mean and variance by Welford's update; merge() is Chan's parallel form."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0          # sum of squared deviations from the mean
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def push(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.minimum:
+            self.minimum = x
+        if x > self.maximum:
+            self.maximum = x
+
+    def merge(self, other: "RunningStats") -> None:
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        return self.stdev / math.sqrt(self.count) if self.count else 0.0
+
+
+@dataclass
+class Proportion:
+    """Successes out of trials, e.g. wins per game or pickups per move."""
+
+    hits: int = 0
+    trials: int = 0
+
+    def push(self, hit: bool) -> None:
+        self.trials += 1
+        self.hits += bool(hit)
+
+    def merge(self, other: "Proportion") -> None:
+        self.hits += other.hits
+        self.trials += other.trials
+
+    @property
+    def rate(self) -> float:
+        return self.hits / self.trials if self.trials else 0.0
+
+    @property
+    def stderr(self) -> float:
+        if not self.trials:
+            return 0.0
+        p = self.rate
+        return math.sqrt(p * (1.0 - p) / self.trials)
@@ -0,0 +1,159 @@
+"""
+Rule-variant balancing: run the same seeded batch of random games under
+several RuleSets and compare game length, first-player advantage and
+pickup rate. Every variant plays the same seeds, so differences between
+variants are not swamped by deal-to-deal noise.
+
+Run with: python -m sim.variants --games 100000 --variants standard,eight-skip
+      or: python -m sim.variants --config variants.json
+Add --checkpoint-dir DIR to make a long run resumable, and
+--profile stacks.txt to sample where the time goes (see sim.profiling).
+
+A config file is a JSON list of RuleSet options, e.g.
+    [{"name": "short-seven", "seven_lasts_one_card": true},
+     {"name": "skip", "eight_skips": true}]
+"""
+import json
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+from core.rules import RuleSet, STANDARD_RULES
+from sim.batch import BatchStats, run_batch
+from sim.profiling import StackProfile
+
+PRESETS: Dict[str, RuleSet] = {
+    rules.name: rules
+    for rules in (
+        STANDARD_RULES,
+        RuleSet(name="seven-one-card", seven_lasts_one_card=True),
+        RuleSet(name="eight-skip", eight_skips=True),
+        RuleSet(name="seven-one-card+eight-skip", seven_lasts_one_card=True, eight_skips=True),
+    )
+}
+
+
+def load_variants(path: str) -> List[RuleSet]:
+    with open(path) as f:
+        configs = json.load(f)
+    if isinstance(configs, dict):
+        configs = [configs]
+    return [RuleSet.from_dict(config) for config in configs]
+
+
+def compare_variants(
+    variants: Sequence[RuleSet],
+    games: int,
+    workers: int = 1,
+    first_seed: int = 0,
+    progress: Optional[Callable[[str, BatchStats], None]] = None,
+    checkpoint_dir: Optional[str] = None,
+    **batch_kwargs,
+) -> Dict[str, BatchStats]:
+    """
+    Run one batch per variant over the same seeds, sharing a single pool.
+    With `checkpoint_dir`, each variant checkpoints to <dir>/<name>.json
+    (see run_batch), so an interrupted comparison resumes variant by variant.
+    """
+    names = [rules.name for rules in variants]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Variant names must be unique: {names}")
+
+    def run_all(pool) -> Dict[str, BatchStats]:
+        results = {}
+        for rules in variants:
+            on_chunk = (lambda stats, name=rules.name: progress(name, stats)) if progress else None
+            checkpoint = None
+            if checkpoint_dir is not None:
+                checkpoint = os.path.join(checkpoint_dir, f"{rules.name}.json")
+            results[rules.name] = run_batch(games, rules, first_seed=first_seed, pool=pool,
+                                            progress=on_chunk, checkpoint=checkpoint,
+                                            **batch_kwargs)
+        return results
+
+    if checkpoint_dir is not None:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    if workers <= 1:
+        return run_all(None)
+    from multiprocessing import Pool
+
+    with Pool(workers) as pool:
+        return run_all(pool)
+
+
+def format_table(results: Dict[str, BatchStats]) -> str:
+    header = (f"{'variant':<28}{'games':>9}{'plies':>16}{'1st-player win':>18}"
+              f"{'advantage':>11}{'pickup rate':>16}{'unfinished':>12}")
+    lines = [header, "-" * len(header)]
+    for name, s in results.items():
+        lines.append(
+            f"{name:<28}{s.games:>9}"
+            f"{s.plies.mean:>9.1f} ±{s.plies.stderr:<5.1f}"
+            f"{s.first_player_wins.rate:>11.3f} ±{s.first_player_wins.stderr:.3f}"
+            f"{s.first_player_advantage:>+11.3f}"
+            f"{s.pickup_rate.rate:>9.3f} ±{s.pickup_rate.stderr:.3f}"
+            f"{s.unfinished:>12}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare rule variants over seeded random games")
+    parser.add_argument("--variants", default=",".join(PRESETS),
+                        help=f"comma-separated presets: {', '.join(PRESETS)}")
+    parser.add_argument("--config", help="JSON file of RuleSet configs (overrides --variants)")
+    parser.add_argument("--games", type=int, default=10_000, help="games per variant")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--max-plies", type=int, default=5000)
+    parser.add_argument("--lazy-deck", action="store_true",
+                        help="draw lazily instead of pre-shuffling")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--checkpoint-dir",
+                        help="save progress here; rerunning the same command resumes it")
+    parser.add_argument("--checkpoint-every", type=float, default=30.0, help="seconds")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample stacks in every worker; write collapsed stacks here")
+    parser.add_argument("--profile-interval", type=float, default=1.0, help="milliseconds")
+    parser.add_argument("--profile-top", type=int, default=20, help="functions in the summary")
+    args = parser.parse_args()
+
+    if args.config:
+        variants = load_variants(args.config)
+    else:
+        unknown = [v for v in args.variants.split(",") if v and v not in PRESETS]
+        if unknown:
+            parser.error(f"unknown variants: {unknown}")
+        variants = [PRESETS[v] for v in args.variants.split(",") if v]
+
+    def progress(name: str, stats: BatchStats) -> None:
+        print(f"\r{name}: {stats.games} games, {stats.games_per_second:,.0f} games/s",
+              end="", flush=True)
+
+    profile = StackProfile(args.profile_interval / 1e3) if args.profile else None
+    results = compare_variants(
+        variants,
+        args.games,
+        workers=args.workers,
+        first_seed=args.seed,
+        progress=progress,
+        num_players=args.players,
+        max_plies=args.max_plies,
+        lazy_deck=args.lazy_deck,
+        chunk_size=args.chunk_size,
+        checkpoint_dir=args.checkpoint_dir,
+        checkpoint_every=args.checkpoint_every,
+        profile=profile,
+    )
+    print()
+    print(format_table(results))
+    if profile is not None:
+        profile.write_collapsed(args.profile)
+        print()
+        print(profile.summary(args.profile_top))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
+import random
+
+from core.game import Game
+
+
 def fake_input_sequence(responses):
     responses_iter = iter(responses)
     def inner(prompt):
@@ -5,4 +10,24 @@ def fake_input_sequence(responses):
     return inner
 
 def fake_output(message):
-    pass
\ No newline at end of file
+    pass
+
+
+def started_game(seed=0, **kwargs):
+    game = Game(rng=random.Random(seed), **kwargs)
+    game.start()
+    return game
+
+
+def play_random(game, rng, plies):
+    """Play up to `plies` uniformly random moves, skipping players who have none."""
+    for _ in range(plies):
+        if game.is_game_over():
+            return
+        pid = game.current_player_index
+        moves = game.get_valid_moves(pid)
+        if not moves:
+            game.advance_turn()
+            continue
+        game.apply_move(pid, rng.choice(moves))
+        game.end_turn()
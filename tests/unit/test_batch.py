@@ -0,0 +1,128 @@
+import json
+import math
+import random
+import statistics
+
+import pytest
+
+from core.rules import RuleSet
+from sim.batch import BatchStats, GameResult, play_game, run_batch
+from sim.stats import Proportion, RunningStats
+from sim.variants import PRESETS, compare_variants, format_table, load_variants
+
+
+def test_running_stats_match_statistics_module():
+    rng = random.Random(0)
+    xs = [rng.gauss(10, 3) for _ in range(500)]
+    whole = RunningStats()
+    for x in xs:
+        whole.push(x)
+    assert whole.mean == pytest.approx(statistics.fmean(xs))
+    assert whole.variance == pytest.approx(statistics.variance(xs))
+    assert (whole.minimum, whole.maximum) == (min(xs), max(xs))
+
+    merged = RunningStats()
+    for lo in range(0, 500, 170):
+        part = RunningStats()
+        for x in xs[lo:lo + 170]:
+            part.push(x)
+        merged.merge(part)
+    assert merged.count == 500
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance == pytest.approx(whole.variance)
+
+
+def test_proportion():
+    p = Proportion()
+    for hit in (True, False, False, True):
+        p.push(hit)
+    p.merge(Proportion(hits=2, trials=4))
+    assert p.rate == 0.5
+    assert p.stderr == pytest.approx(math.sqrt(0.25 / 8))
+
+
+def test_batch_stats_add():
+    stats = BatchStats(num_players=2)
+    stats.add(GameResult(plies=100, pickups=10, winner=0))
+    stats.add(GameResult(plies=300, pickups=20, winner=1))
+    stats.add(GameResult(plies=500, pickups=30, winner=None))
+    assert (stats.games, stats.unfinished, stats.seat_wins) == (3, 1, [1, 1])
+    assert stats.plies.mean == 200
+    assert stats.pickup_rate.rate == 60 / 900
+    assert stats.first_player_advantage == 0.0
+
+
+def test_games_replay_from_seed():
+    assert play_game(7, max_plies=400) == play_game(7, max_plies=400)
+
+
+def test_chunking_and_workers_do_not_change_results():
+    serial = run_batch(40, max_plies=400, chunk_size=40)
+    chunked = run_batch(40, max_plies=400, chunk_size=7, workers=2)
+    for stats in (serial, chunked):
+        assert stats.games == 40
+    assert serial.seat_wins == chunked.seat_wins
+    assert serial.plies.mean == pytest.approx(chunked.plies.mean)
+    assert serial.plies.variance == pytest.approx(chunked.plies.variance)
+    assert serial.pickup_rate == chunked.pickup_rate
+
+
+def test_compare_variants(tmp_path):
+    path = tmp_path / "variants.json"
+    path.write_text(json.dumps([{"name": "plain"}, {"name": "skip", "eight_skips": True}]))
+    variants = load_variants(str(path))
+    seen = []
+    results = compare_variants(variants, 20, workers=2, max_plies=300, chunk_size=5,
+                               progress=lambda name, stats: seen.append((name, stats.games)))
+    assert list(results) == ["plain", "skip"]
+    assert results["plain"].games == results["skip"].games == 20
+    assert seen[-1] == ("skip", 20)
+    assert "skip" in format_table(results)
+    with pytest.raises(ValueError):
+        compare_variants([RuleSet(), RuleSet()], 1)
+
+
+def test_presets_are_named_by_key():
+    assert all(rules.name == name for name, rules in PRESETS.items())
+
+
+class Interrupted(Exception):
+    pass
+
+
+def test_checkpoint_resume_matches_an_unbroken_run(tmp_path):
+    path = str(tmp_path / "run.json")
+    kwargs = dict(max_plies=300, chunk_size=5, checkpoint_every=0)
+    unbroken = run_batch(40, **kwargs)
+
+    def crash_after_three(stats):
+        if stats.games >= 15:
+            raise Interrupted
+
+    with pytest.raises(Interrupted):
+        run_batch(40, checkpoint=path, progress=crash_after_three, **kwargs)
+    with open(path) as f:
+        saved = json.load(f)
+    assert saved["done"] == [[0, 15]] and saved["stats"]["games"] == 15
+
+    chunks_played = []
+    resumed = run_batch(40, checkpoint=path, progress=lambda s: chunks_played.append(s.games),
+                        **kwargs)
+    assert chunks_played == [20, 25, 30, 35, 40]
+    assert resumed.games == 40
+    assert resumed.seat_wins == unbroken.seat_wins
+    assert resumed.plies.mean == pytest.approx(unbroken.plies.mean)
+    assert resumed.plies.variance == pytest.approx(unbroken.plies.variance)
+    assert resumed.pickup_rate == unbroken.pickup_rate
+
+    # A finished checkpoint replays nothing; a different run refuses it
+    assert run_batch(40, checkpoint=path, **kwargs).games == 40
+    with pytest.raises(ValueError):
+        run_batch(40, checkpoint=path, rules=RuleSet(eight_skips=True), **kwargs)
+
+
+def test_variant_checkpoints(tmp_path):
+    results = compare_variants([PRESETS["standard"]], 10, max_plies=200, chunk_size=5,
+                               checkpoint_dir=str(tmp_path / "ckpt"))
+    assert (tmp_path / "ckpt" / "standard.json").exists()
+    assert results["standard"].games == 10
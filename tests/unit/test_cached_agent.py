@@ -0,0 +1,103 @@
+import threading
+
+from agents.cached_agent import CachedAgent
+from core.canonical import pile_size_bucket, view_key
+from core.game_view import GameView, PlayerView
+from core.models import Card, Move
+
+
+class LowestCardAgent:
+    """Deterministic test agent: plays the lowest-value card in hand."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def choose_move(self, view, valid_moves):
+        self.calls += 1
+        hand = view.player_view.hand
+        return min(valid_moves, key=lambda m: hand[m.index].value)
+
+
+def make_view(hand, pile_size=0):
+    return GameView(
+        current_player_name="Player 1",
+        deck_remaining=10,
+        player_view=PlayerView(name="Player 1", hand=hand, face_up=[], face_down_count=3),
+        discard_top_effective=None,
+        discard_pile_size=pile_size,
+    )
+
+
+def hand_moves(hand):
+    return [Move("play", "hand", i) for i in range(len(hand))]
+
+
+def test_view_key_ignores_suits_and_order():
+    a = make_view([Card("4", "Clubs", 4), Card("9", "Hearts", 9)])
+    b = make_view([Card("9", "Spades", 9), Card("4", "Diamonds", 4)])
+    assert view_key(a) == view_key(b)
+
+
+def test_pile_size_bucket():
+    assert [pile_size_bucket(n) for n in (0, 1, 2, 3, 4, 7, 8, 100)] == [0, 1, 2, 2, 3, 3, 4, 6]
+
+
+def test_hit_replays_decision_onto_equivalent_card():
+    inner = LowestCardAgent()
+    agent = CachedAgent(inner)
+
+    first = [Card("4", "Clubs", 4), Card("9", "Hearts", 9)]
+    assert agent.choose_move(make_view(first), hand_moves(first)) == Move("play", "hand", 0)
+
+    # Same ranks, different suits and order: the 4 is now at index 1
+    second = [Card("9", "Spades", 9), Card("4", "Diamonds", 4)]
+    assert agent.choose_move(make_view(second), hand_moves(second)) == Move("play", "hand", 1)
+
+    assert inner.calls == 1
+    info = agent.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.hit_rate == 0.5
+
+
+def test_lru_eviction_respects_maxsize():
+    agent = CachedAgent(LowestCardAgent(), maxsize=2)
+    for value in (4, 5, 6):
+        hand = [Card(str(value), "Clubs", value)]
+        agent.choose_move(make_view(hand), hand_moves(hand))
+    assert agent.cache_info().currsize == 2
+
+    # The oldest entry (4) was evicted
+    hand = [Card("4", "Hearts", 4)]
+    agent.choose_move(make_view(hand), hand_moves(hand))
+    assert agent.cache_info().misses == 4
+
+
+def test_cached_move_not_valid_falls_back_to_agent():
+    inner = LowestCardAgent()
+    agent = CachedAgent(inner)
+    hand = [Card("4", "Clubs", 4), Card("9", "Hearts", 9)]
+    agent.choose_move(make_view(hand), hand_moves(hand))
+
+    # Same key, but only the 9 is offered this time
+    assert agent.choose_move(make_view(hand), [Move("play", "hand", 1)]) == Move("play", "hand", 1)
+    assert inner.calls == 2
+
+
+def test_shared_across_threads():
+    agent = CachedAgent(LowestCardAgent(), maxsize=8)
+
+    def worker(offset):
+        for i in range(200):
+            value = 2 + (i + offset) % 12
+            hand = [Card(str(value), "Clubs", value), Card("Ace", "Spades", 14)]
+            assert agent.choose_move(make_view(hand), hand_moves(hand)) == Move("play", "hand", 0)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    info = agent.cache_info()
+    assert info.hits + info.misses == 8 * 200
+    assert info.currsize <= 8
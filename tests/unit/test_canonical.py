@@ -0,0 +1,58 @@
+import random
+
+from core.models import CANONICAL_SUIT, Card
+from tests.helpers import play_random, started_game
+
+SUIT_SWAP = {"Spades": "Hearts", "Hearts": "Clubs", "Clubs": "Diamonds", "Diamonds": "Spades"}
+
+
+def permute_suits(game):
+    swap = lambda cards: [Card(c.rank, SUIT_SWAP[c.suit], c.value) for c in cards]
+    other = game.clone()
+    other.deck.cards = swap(other.deck.cards)
+    other.discard_pile = swap(other.discard_pile)
+    for p in other.players:
+        p.hand = swap(p.hand)
+        p.face_up_cards = swap(p.face_up_cards)
+        p.face_down_cards = swap(p.face_down_cards)
+    return other
+
+
+def test_suit_permutation_has_same_state_key():
+    game = started_game(1)
+    assert permute_suits(game).state_key() == game.state_key()
+    assert permute_suits(game).state_hash() == game.state_hash()
+
+
+def test_hand_order_does_not_change_state_key():
+    game = started_game(2)
+    other = game.clone()
+    other.players[0].hand.reverse()
+    assert other.state_key() == game.state_key()
+
+
+def test_different_ranks_have_different_keys():
+    game = started_game(3)
+    other = game.clone()
+    other.players[0].hand[0] = Card("Ace", "Spades", 14) if game.players[0].hand[0].value != 14 else Card("4", "Spades", 4)
+    assert other.state_key() != game.state_key()
+
+
+def test_clone_is_independent():
+    game = started_game(4)
+    before = game.state_key()
+    copy = game.clone()
+    play_random(copy, random.Random(0), 20)
+    assert game.state_key() == before
+    assert copy.state_key() != before
+
+
+def test_folded_clone_uses_canonical_cards_and_plays_identically():
+    game = started_game(5)
+    folded = game.clone(fold_suits=True)
+    assert folded.state_key() == game.state_key()
+    assert all(c.suit == CANONICAL_SUIT for p in folded.players for c in p.hand)
+
+    play_random(game, random.Random(9), 40)
+    play_random(folded, random.Random(9), 40)
+    assert folded.state_key() == game.state_key()
@@ -0,0 +1,60 @@
+import random
+
+from core.snapshot import CARD_BY_CODE, card_code, restore, snapshot
+from core.game import Game
+from core.rules import RuleSet
+from sim import differential
+from sim.differential import ENGINES, Engine, fuzz_game, run_fuzz
+
+
+def test_snapshot_round_trip_is_exact():
+    game = Game(num_players=3, rng=random.Random(4))
+    game.start()
+    copy = restore(snapshot(game))
+    assert snapshot(copy) == snapshot(game)
+    assert [str(c) for c in copy.players[1].hand] == [str(c) for c in game.players[1].hand]
+
+
+def test_card_codes_cover_the_deck():
+    assert sorted(card_code(c) for c in CARD_BY_CODE) == list(range(52))
+
+
+def test_all_engines_agree_with_reference():
+    report = run_fuzz(50, engine_names=list(ENGINES), max_plies=300)
+    assert report.games == 50
+    assert report.steps > 0
+    assert report.divergences == []
+
+
+def test_rule_variants_survive_every_engine():
+    rules = RuleSet(name="both", seven_lasts_one_card=True, eight_skips=True)
+    report = run_fuzz(15, engine_names=list(ENGINES), max_plies=200, rules=rules)
+    assert report.steps > 0
+    assert report.divergences == []
+
+
+def test_parallel_run_matches_serial():
+    serial = run_fuzz(12, workers=1, chunk_size=3, max_plies=100)
+    parallel = run_fuzz(12, workers=2, chunk_size=3, max_plies=100)
+    assert (parallel.games, parallel.steps) == (serial.games, serial.steps)
+
+
+class DroppedFlagEngine(Engine):
+    """Deliberately broken: forgets the reversed flag after every move."""
+
+    name = "broken"
+
+    def apply(self, player_index, move):
+        super().apply(player_index, move)
+        self.game.is_reversed = False
+
+
+def test_broken_engine_is_caught(monkeypatch):
+    monkeypatch.setitem(
+        differential.ENGINES, "broken", lambda game, rng: DroppedFlagEngine(game.clone(rng=rng))
+    )
+    report = run_fuzz(100, engine_names=["broken"], max_plies=500)
+    assert report.divergences
+    d = report.divergences[0]
+    steps, divergence = fuzz_game(d.seed, ["broken"], max_plies=500)
+    assert divergence == d
@@ -0,0 +1,84 @@
+import copy
+import pickle
+import random
+
+from core.game import Game
+from core.models import Card, DiscardPile, Move
+from sim.differential import run_fuzz
+
+
+def c(rank, value, suit="Spades"):
+    return Card(rank, suit, value)
+
+
+def test_effective_top_skips_threes():
+    pile = DiscardPile([c("9", 9), c("3", 3), c("3", 3, "Hearts")])
+    assert pile.effective_top.rank == "9"
+    assert pile.top_run_length == 2
+
+
+def test_only_threes_have_no_effective_top():
+    pile = DiscardPile([c("3", 3), c("3", 3, "Clubs")])
+    assert pile.effective_top is None
+
+
+def test_truncate_restores_index_below():
+    pile = DiscardPile([c("5", 5), c("8", 8), c("8", 8, "Clubs"), c("3", 3)])
+    pile.truncate(2)
+    assert pile.effective_top.rank == "8"
+    assert pile.top_run_length == 1
+    del pile[1:]
+    assert pile.effective_top.rank == "5"
+
+
+def test_arbitrary_edits_rebuild_index():
+    pile = DiscardPile([c("5", 5), c("8", 8)])
+    pile.insert(2, c("8", 8, "Hearts"))
+    assert pile.top_run_length == 2
+    pile[0] = c("8", 8, "Clubs")
+    assert pile.top_run_length == 3
+    pile.pop(0)
+    assert pile.top_run_length == 2
+
+
+def test_copy_is_independent():
+    pile = DiscardPile([c("5", 5)])
+    other = pile.copy()
+    other.append(c("5", 5, "Hearts"))
+    assert isinstance(other, DiscardPile)
+    assert (pile.top_run_length, other.top_run_length) == (1, 2)
+
+
+def test_pickle_and_copy_keep_the_index():
+    game = Game(rng=random.Random(0))
+    game.discard_pile = [c("5", 5), c("8", 8), c("8", 8, "Clubs"), c("3", 3)]
+    for clone in (pickle.loads(pickle.dumps(game)), copy.deepcopy(game)):
+        pile = clone.discard_pile
+        assert isinstance(pile, DiscardPile)
+        assert pile == game.discard_pile
+        assert (pile.effective_top.rank, pile.top_run_length) == ("8", 1)
+        pile.truncate(2)
+        assert (pile.effective_top.rank, pile.top_run_length) == ("8", 1)
+    shallow = copy.copy(game.discard_pile)
+    shallow.append(c("3", 3, "Hearts"))
+    assert (shallow.top_run_length, game.discard_pile.top_run_length) == (2, 1)
+
+
+def test_plain_list_assignment_is_indexed():
+    game = Game()
+    game.discard_pile = [c("9", 9), c("3", 3)]
+    assert isinstance(game.discard_pile, DiscardPile)
+    assert game.get_effective_top_card().rank == "9"
+
+
+def test_four_of_a_kind_through_threes_burns():
+    game = Game()
+    game.deck.cards = []
+    game.discard_pile = [c("3", 3, s) for s in ("Spades", "Hearts", "Clubs")]
+    game.players[0].hand = [c("3", 3, "Diamonds"), c("9", 9)]
+    game.apply_move(0, Move("play", "hand", 0))
+    assert game.discard_pile == []
+
+
+def test_index_matches_scan_during_random_play():
+    assert run_fuzz(40, engine_names=["pile-index"], max_plies=400).divergences == []
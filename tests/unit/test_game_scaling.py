@@ -0,0 +1,66 @@
+import random
+from collections import Counter
+
+import pytest
+
+from core.game import Game, decks_needed
+from core.models import Card, Deck
+from tests.helpers import play_random, started_game
+
+
+def test_multi_deck_holds_every_card_num_decks_times():
+    deck = Deck(num_decks=3)
+    assert len(deck.cards) == 156
+    counts = Counter((c.rank, c.suit) for c in deck.cards)
+    assert set(counts.values()) == {3}
+
+
+def test_decks_needed():
+    assert decks_needed(2) == 1
+    assert decks_needed(5) == 1
+    assert decks_needed(6) == 2
+    assert decks_needed(16) == 3
+
+
+@pytest.mark.parametrize("num_players", [8, 16])
+def test_large_tables_deal_and_finish(num_players):
+    game = started_game(num_players, num_players=num_players)
+    for player in game.players:
+        assert len(player.hand) == len(player.face_up_cards) == len(player.face_down_cards) == 3
+
+    play_random(game, random.Random(1), 200_000)
+    winner = game.get_winner()
+    assert winner is not None
+    assert not winner.hand and not winner.face_up_cards and not winner.face_down_cards
+
+
+def test_explicit_deck_count_too_small_raises():
+    game = Game(num_players=8, num_decks=1)
+    with pytest.raises(RuntimeError):
+        game.start()
+
+
+def test_no_winner_until_someone_runs_out():
+    game = started_game(0)
+    assert game.get_winner() is None
+    assert not game.is_game_over()
+
+
+def test_last_card_two_gives_no_extra_turn():
+    game = Game()
+    player = game.players[0]
+    player.hand = [Card("2", "Spades", 2)]
+    game.players[1].hand = [Card("5", "Clubs", 5)]
+    game.deck.cards = []
+
+    game.apply_move(0, game.get_valid_moves(0)[0])
+    assert game.get_winner() is player
+    assert game.current_player_gets_extra_turn is False
+
+
+def test_refresh_winner_after_manual_setup():
+    game = Game()
+    game.players[1].hand = [Card("5", "Clubs", 5)]
+    assert game.get_winner() is None
+    game.refresh_winner()
+    assert game.get_winner() is game.players[0]
@@ -0,0 +1,119 @@
+import random
+from collections import Counter
+
+import pytest
+
+from agents.monte_carlo_agent import MonteCarloAgent
+from agents.search import AnytimeSearch
+from core.game import Game
+from core.knowledge import PublicKnowledge
+from core.models import Card, Move
+from core.snapshot import card_code, snapshot
+from tests.helpers import play_random
+
+
+def codes(cards):
+    return Counter(card_code(c) for c in cards)
+
+
+def check_consistent(knowledge, game):
+    hidden = codes(game.deck.cards)
+    for i, p in enumerate(game.players):
+        assert knowledge.hand_sizes[i] == len(p.hand)
+        assert not knowledge.known[i] - codes(p.hand)   # known cards really are there
+        hidden += codes(p.hand) + codes(p.face_down_cards)
+        hidden -= knowledge.known[i]
+    assert knowledge.unseen == hidden
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_tracker_matches_the_game(seed):
+    rng = random.Random(seed)
+    game = Game(num_players=2 + seed % 3, rng=random.Random(seed), lazy_deck=seed % 2 == 1)
+    knowledge = PublicKnowledge.attach(game)
+    game.start()
+    check_consistent(knowledge, game)
+    for _ in range(400):
+        if game.is_game_over():
+            break
+        pid = game.current_player_index
+        moves = game.get_valid_moves(pid)
+        if not moves:
+            game.advance_turn()
+            continue
+        game.apply_move(pid, rng.choice(moves))
+        game.end_turn()
+        check_consistent(knowledge, game)
+
+
+def test_search_in_place_is_not_reported():
+    rng = random.Random(7)
+    game = Game(rng=random.Random(7))
+    knowledge = PublicKnowledge.attach(game)
+    game.start()
+    play_random(game, rng, 30)
+    seen = (list(knowledge.known), list(knowledge.hand_sizes), Counter(knowledge.unseen))
+
+    for _ in range(50):
+        if game.is_game_over() or not game.get_valid_moves(game.current_player_index):
+            break
+        game.push_move(rng.choice(game.get_valid_moves(game.current_player_index)))
+        assert (knowledge.known, knowledge.hand_sizes, knowledge.unseen) == seen
+    while game.undo_depth:
+        game.pop_move()
+    assert game._listeners == [knowledge]
+    check_consistent(knowledge, game)
+
+
+def test_pickups_become_known_and_failed_flips_too():
+    game = Game()
+    game.deck.cards = []
+    knowledge = PublicKnowledge.attach(game)
+    game.players[0].hand = []
+    game.players[0].face_up_cards = []
+    game.players[0].face_down_cards = [Card("4", "Clubs", 4)]
+    game.discard_pile = [Card("9", "Hearts", 9)]
+    knowledge.on_start(game)
+
+    game.apply_move(0, Move("play", "face_down", 0))
+    assert sorted(c.value for c in knowledge.known_cards(0)) == [4, 9]
+    assert knowledge.unknown_count(0) == 0
+
+    game.apply_move(0, Move("play", "hand", 0))   # the 4
+    assert knowledge.known_cards(0) == [Card("9", "Hearts", 9)]
+
+
+def test_resample_keeps_known_cards_in_place():
+    game = Game(rng=random.Random(3))
+    knowledge = PublicKnowledge.attach(game)
+    game.start()
+    # Player 1 publicly picks up a pile
+    game.discard_pile = [Card("King", "Spades", 13), Card("Ace", "Hearts", 14)]
+    game.apply_move(1, Move("pickup"))
+    known = codes(knowledge.known_cards(1))
+    assert known == codes([Card("King", "Spades", 13), Card("Ace", "Hearts", 14)])
+
+    before = snapshot(game)
+    rng = random.Random(0)
+    for _ in range(20):
+        copy = game.clone()
+        knowledge.resample(copy, 0, rng)
+        assert not known - codes(copy.players[1].hand)
+        assert len(copy.players[1].hand) == len(game.players[1].hand)
+        assert copy.players[0].hand == game.players[0].hand
+        assert copy.players[1].face_up_cards == game.players[1].face_up_cards
+        all_cards = lambda g: codes(g.deck.cards) + sum(
+            (codes(p.hand) + codes(p.face_down_cards) for p in g.players), Counter())
+        assert all_cards(copy) == all_cards(game)
+    assert snapshot(game) == before
+
+
+def test_monte_carlo_agent_uses_tracker():
+    game = Game(rng=random.Random(4))
+    knowledge = PublicKnowledge.attach(game)
+    game.start()
+    agent = MonteCarloAgent(game, 0, move_time=10, rng=random.Random(0), knowledge=knowledge,
+                            search=AnytimeSearch(max_iterations=20))
+    moves = game.get_valid_moves(0)
+    assert agent.choose_move(game.get_view_for_player(0), moves) in moves
+    assert game.clone()._listeners == []
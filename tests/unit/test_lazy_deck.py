@@ -0,0 +1,70 @@
+import random
+from collections import Counter
+
+from core.game import Game
+from core.models import Deck, STANDARD_CARDS
+from sim.differential import run_fuzz
+
+
+def test_lazy_draws_every_card_exactly_once():
+    deck = Deck(rng=random.Random(0), lazy=True)
+    deck.shuffle()
+    assert deck.cards == list(STANDARD_CARDS)  # nothing shuffled up front
+
+    drawn = [deck.draw() for _ in range(52)]
+    assert deck.draw() is None
+    assert sorted(map(id, drawn)) == sorted(map(id, STANDARD_CARDS))
+
+
+def test_lazy_draw_is_roughly_uniform():
+    rng = random.Random(1)
+    firsts = Counter()
+    for _ in range(5200):
+        firsts[Deck(rng=rng, lazy=True).draw().value] += 1
+    # 13 ranks x 4 suits: every rank should come first about 400 times
+    assert all(300 < n < 500 for n in firsts.values())
+
+
+def test_lazy_deck_is_reproducible_from_seed():
+    a = Deck(rng=random.Random(7), lazy=True)
+    b = Deck(rng=random.Random(7), lazy=True)
+    assert [str(a.draw()) for _ in range(20)] == [str(b.draw()) for _ in range(20)]
+
+
+def test_lazy_game_deals_and_clones():
+    game = Game(rng=random.Random(3), lazy_deck=True)
+    game.start()
+    assert len(game.deck.cards) == 52 - 18
+    assert game.clone().deck.lazy
+
+
+def test_resample_hidden_keeps_what_the_observer_sees():
+    game = Game(num_players=3, rng=random.Random(5))
+    game.start()
+    before = game.clone()
+    game.resample_hidden(0, random.Random(9))
+
+    me = game.players[0]
+    assert me.hand == before.players[0].hand
+    assert me.face_up_cards == before.players[0].face_up_cards
+    for p, q in zip(game.players, before.players):
+        assert p.face_up_cards == q.face_up_cards
+        assert len(p.hand) == len(q.hand)
+        assert len(p.face_down_cards) == len(q.face_down_cards)
+    assert len(game.deck.cards) == len(before.deck.cards)
+
+    def hidden(g):
+        cards = list(g.deck.cards)
+        for i, p in enumerate(g.players):
+            if i != 0:
+                cards += p.hand
+            cards += p.face_down_cards
+        return Counter(map(str, cards))
+
+    assert hidden(game) == hidden(before)
+    assert game.state_key() != before.state_key()
+
+
+def test_lazy_engines_agree_with_reference():
+    report = run_fuzz(30, max_plies=200, lazy_deck=True)
+    assert report.divergences == []
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from agents.mlp_agent import MlpAgent, save_mlp
+from core.encoding import ACTION_SIZE, OBS_SIZE, HAND_OFFSET, MIN_VALUE, PICKUP_ACTION
+from core.game_view import GameView, PlayerView
+from core.models import Card, Move
+
+
+def make_view(hand, top=None):
+    return GameView(
+        current_player_name="Player 1",
+        deck_remaining=0,
+        player_view=PlayerView(name="Player 1", hand=hand, face_up=[], face_down_count=0),
+        discard_top_effective=top,
+        discard_pile_size=0 if top is None else 1,
+    )
+
+
+def linear_agent(preferred_action, **kwargs):
+    # One layer, zero weights: the bias alone ranks the actions
+    w = np.zeros((OBS_SIZE, ACTION_SIZE), dtype=np.float32)
+    b = np.zeros(ACTION_SIZE, dtype=np.float32)
+    b[preferred_action] = 1.0
+    return MlpAgent([w], [b], **kwargs)
+
+
+def test_picks_highest_valued_legal_action():
+    agent = linear_agent(HAND_OFFSET + 9 - MIN_VALUE)
+    hand = [Card("5", "Clubs", 5), Card("9", "Hearts", 9)]
+    moves = [Move("play", "hand", 0), Move("play", "hand", 1)]
+    assert agent.choose_move(make_view(hand), moves) == Move("play", "hand", 1)
+
+
+def test_illegal_best_action_is_ignored():
+    agent = linear_agent(PICKUP_ACTION)
+    hand = [Card("5", "Clubs", 5)]
+    moves = [Move("play", "hand", 0)]
+    assert agent.choose_move(make_view(hand), moves) == moves[0]
+
+
+def test_load_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    weights = [rng.normal(size=(OBS_SIZE, 16)), rng.normal(size=(16, ACTION_SIZE))]
+    biases = [rng.normal(size=16), rng.normal(size=ACTION_SIZE)]
+    path = tmp_path / "policy.npz"
+    save_mlp(str(path), weights, biases)
+
+    agent = MlpAgent.load(str(path))
+    assert len(agent.weights) == 2
+    x = rng.normal(size=(3, OBS_SIZE)).astype(np.float32)
+    expected = np.maximum(x @ weights[0] + biases[0], 0) @ weights[1] + biases[1]
+    assert np.allclose(agent.action_values(x), expected, atol=1e-4)
+
+
+def test_rejects_mismatched_layer_shapes():
+    with pytest.raises(ValueError):
+        MlpAgent([np.zeros((5, ACTION_SIZE))], [np.zeros(ACTION_SIZE)])
+
+
+def test_batch_matches_single_decisions():
+    rng = np.random.default_rng(1)
+    agent = MlpAgent([rng.normal(size=(OBS_SIZE, ACTION_SIZE))], [rng.normal(size=ACTION_SIZE)])
+    views, moves = [], []
+    for value in range(2, 12):
+        hand = [Card("x", "Clubs", value), Card("y", "Spades", value + 3)]
+        views.append(make_view(hand))
+        moves.append([Move("play", "hand", 0), Move("play", "hand", 1)])
+
+    batched = agent.choose_moves(views, moves)
+    assert batched == [agent.choose_move(v, m) for v, m in zip(views, moves)]
+
+
+def test_concurrent_calls_are_coalesced():
+    agent = linear_agent(HAND_OFFSET + 9 - MIN_VALUE, max_batch=4, batch_timeout=0.5)
+    batch_sizes = []
+    original = agent.choose_moves
+
+    def recording_choose_moves(views, valid_moves_list):
+        batch_sizes.append(len(views))
+        return original(views, valid_moves_list)
+
+    agent.choose_moves = recording_choose_moves
+    hand = [Card("5", "Clubs", 5), Card("9", "Hearts", 9)]
+    moves = [Move("play", "hand", 0), Move("play", "hand", 1)]
+    results = []
+
+    def worker():
+        results.append(agent.choose_move(make_view(hand), moves))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert results == [Move("play", "hand", 1)] * 4
+    assert batch_sizes == [4]
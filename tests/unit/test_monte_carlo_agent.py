@@ -0,0 +1,121 @@
+import random
+import time
+
+from agents.monte_carlo_agent import MonteCarloAgent, RootSearch
+from agents.player_agent import DeadlineAware
+from agents.search import AnytimeSearch, SearchStats
+from controller.game_controller import GameController
+from core.game import Game
+from core.models import Card, Move
+from core.snapshot import snapshot
+from tests.helpers import started_game
+
+
+class CountingProblem:
+    """Fake SearchProblem whose iterations take a fixed time."""
+
+    def __init__(self, cost):
+        self.cost = cost
+        self.iterations = 0
+        self.depth = 0
+
+    def iterate(self):
+        time.sleep(self.cost)
+        self.iterations += 1
+        self.depth = self.iterations
+        return 10
+
+    def best_move(self):
+        return Move("pickup")
+
+
+def test_driver_stops_before_deadline():
+    problem = CountingProblem(0.002)
+    move, stats = AnytimeSearch().run(problem, time.perf_counter() + 0.05)
+    assert move == Move("pickup")
+    assert 5 <= stats.iterations <= 25
+    assert stats.nodes == stats.iterations * 10
+    assert stats.deadline_misses == 0
+    assert stats.max_depth == problem.iterations
+
+
+def test_driver_always_runs_min_iterations_and_counts_miss():
+    problem = CountingProblem(0.001)
+    _, stats = AnytimeSearch(min_iterations=3).run(problem, time.perf_counter() - 1.0)
+    assert stats.iterations == 3
+    assert stats.deadline_misses == 1
+    assert stats.worst_overrun > 1.0
+
+
+def test_stats_accumulate():
+    total = SearchStats()
+    total.add(SearchStats(decisions=1, nodes=100, seconds=0.5, max_depth=3))
+    total.add(SearchStats(decisions=1, nodes=300, seconds=0.5, max_depth=7, deadline_misses=1))
+    assert (total.decisions, total.nodes, total.max_depth, total.deadline_misses) == (2, 400, 7, 1)
+    assert total.nodes_per_second == 400.0
+
+
+def test_root_search_leaves_its_game_at_the_root():
+    game = started_game(2)
+    copy = game.clone(rng=random.Random(0))
+    search = RootSearch(copy, 0, game.get_valid_moves(0), random.Random(0))
+    for _ in range(20):
+        search.iterate()
+    assert copy.undo_depth == 0
+    # Only hidden cards may have been re-dealt
+    assert copy.players[0].hand == game.players[0].hand
+    assert copy.discard_pile == game.discard_pile
+    assert sum(search.visits) == 20
+
+
+def test_agent_returns_a_valid_move_without_touching_the_game():
+    game = started_game(3)
+    before = snapshot(game)
+    agent = MonteCarloAgent(game, 0, move_time=10, rng=random.Random(1),
+                            search=AnytimeSearch(max_iterations=30))
+    moves = game.get_valid_moves(0)
+    assert agent.choose_move(game.get_view_for_player(0), moves) in moves
+    assert snapshot(game) == before
+    assert agent.last_stats.iterations == 30
+    assert agent.stats.decisions == 1
+
+
+def test_forced_move_resets_last_stats():
+    game = started_game(3)
+    agent = MonteCarloAgent(game, 0, move_time=10, rng=random.Random(1),
+                            search=AnytimeSearch(max_iterations=30))
+    view = game.get_view_for_player(0)
+    agent.choose_move(view, game.get_valid_moves(0))
+    assert agent.choose_move(view, [Move("pickup")]) == Move("pickup")
+    assert agent.last_stats == SearchStats(decisions=1)
+
+
+def test_agent_finds_the_winning_move():
+    game = Game()
+    game.deck.cards = []
+    game.discard_pile = [Card("King", "Spades", 13)]
+    # Playing the Ace empties player 0's cards and wins at once
+    game.players[0].hand = [Card("Ace", "Hearts", 14)]
+    game.players[0].face_up_cards = []
+    game.players[1].hand = [Card("5", "Clubs", 5), Card("6", "Clubs", 6)]
+    game.players[1].face_down_cards = [Card("9", "Clubs", 9)]
+    moves = [Move("play", "hand", 0), Move("pickup")]
+
+    agent = MonteCarloAgent(game, 0, move_time=10, rng=random.Random(0),
+                            search=AnytimeSearch(max_iterations=20))
+    assert agent.choose_move(game.get_view_for_player(0), moves) == Move("play", "hand", 0)
+
+
+def test_controller_passes_deadline():
+    game = Game(rng=random.Random(5))
+    agents = {i: MonteCarloAgent(game, i, rng=random.Random(i), rollout_limit=30) for i in (0, 1)}
+    assert isinstance(agents[0], DeadlineAware)
+
+    controller = GameController(game, agents, output_fn=lambda m: None, move_time=0.01)
+    game.start()
+    for _ in range(6):
+        controller.play_turn()
+    stats = agents[0].stats
+    assert stats.decisions >= 1
+    # Decisions stay close to the 10ms budget (default move_time is 50ms)
+    assert stats.seconds / stats.decisions < 0.03
@@ -0,0 +1,76 @@
+import random
+
+from agents.book_agent import BookAgent, load_book, save_book
+from core.canonical import move_signature, view_key
+from core.game import Game
+from sim.opening_book import build_book, distill, score_openings
+
+
+class Recording:
+    def __init__(self):
+        self.calls = 0
+
+    def choose_move(self, view, valid_moves):
+        self.calls += 1
+        return valid_moves[-1]
+
+
+def opening(seed):
+    game = Game(num_players=2, rng=random.Random(seed))
+    game.start()
+    pid = game.current_player_index
+    return game.get_view_for_player(pid), game.get_valid_moves(pid)
+
+
+def test_scoring_is_reproducible():
+    a = score_openings(3, book_plies=2, playouts_per_move=4)
+    b = score_openings(3, book_plies=2, playouts_per_move=4)
+    assert a.table == b.table
+    assert a.positions >= 1
+    assert a.playouts == sum(v for moves in a.table.values() for _, v in moves.values())
+
+
+def test_parallel_build_matches_serial():
+    kwargs = dict(book_plies=1, playouts_per_move=4, rollout_limit=60, chunk_size=3)
+    serial = build_book(8, workers=1, **kwargs)
+    parallel = build_book(8, workers=2, **kwargs)
+    assert serial.games == parallel.games == 8
+    assert distill(serial.table, 1) == distill(parallel.table, 1)
+
+
+def test_distill_picks_best_mean_and_skips_thin_classes():
+    table = {
+        "a": {"x": [3.0, 10], "y": [4.0, 5]},
+        "b": {"x": [1.0, 1]},
+    }
+    assert distill(table, min_playouts=10) == {"a": "y"}
+
+
+def test_book_round_trips_through_disk(tmp_path):
+    book = distill(build_book(4, book_plies=1, playouts_per_move=2, rollout_limit=40).table, 1)
+    assert book
+    path = str(tmp_path / "book.json")
+    save_book(path, book)
+    assert load_book(path) == book
+
+
+def test_book_agent_plays_book_move_and_falls_back():
+    view, moves = opening(11)
+    book_move = next(m for m in moves if m != moves[-1])
+    fallback = Recording()
+    agent = BookAgent({view_key(view): move_signature(view, book_move)}, fallback)
+
+    assert agent.choose_move(view, moves) == book_move
+    assert (agent.hits, agent.misses, fallback.calls) == (1, 0, 0)
+
+    other_view, other_moves = opening(12)
+    assert agent.choose_move(other_view, other_moves) == other_moves[-1]
+    assert (agent.hits, agent.misses, fallback.calls) == (1, 1, 1)
+
+
+def test_book_move_that_does_not_fit_goes_to_fallback():
+    view, moves = opening(11)
+    fallback = Recording()
+    agent = BookAgent({view_key(view): ("hand", 99)}, fallback)
+    assert agent.choose_move(view, moves) == moves[-1]
+    assert (agent.hits, agent.misses, fallback.calls) == (0, 1, 1)
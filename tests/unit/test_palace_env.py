@@ -0,0 +1,102 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from agents.simple_ai_agent import SimpleAIAgent
+from core.encoding import ACTION_SIZE, OBS_SIZE, PICKUP_ACTION
+from core.game import Game
+from env import PalaceEnv, VectorPalaceEnv
+
+
+def play_random_episode(env, seed):
+    rng = random.Random(seed)
+    obs, info = env.reset(seed=seed)
+    trace = [tuple(obs)]
+    while True:
+        legal = [a for a, ok in enumerate(info["action_mask"]) if ok]
+        obs, reward, terminated, truncated, info = env.step(rng.choice(legal))
+        trace.append(tuple(obs))
+        if terminated or truncated:
+            return trace, reward, terminated
+
+
+def test_reset_returns_observation_and_mask():
+    env = PalaceEnv()
+    obs, info = env.reset(seed=1)
+    assert len(obs) == OBS_SIZE
+    assert len(info["action_mask"]) == ACTION_SIZE
+    assert any(info["action_mask"])
+    # Empty pile at the start: pickup is never offered
+    assert info["action_mask"][PICKUP_ACTION] is False
+
+
+def test_episode_terminates_with_win_or_loss_reward():
+    env = PalaceEnv(max_turns=100_000)
+    _, reward, terminated = play_random_episode(env, seed=3)
+    assert terminated
+    assert reward in (1.0, -1.0)
+
+
+def test_same_seed_reproduces_episode():
+    first, _, _ = play_random_episode(PalaceEnv(), seed=11)
+    second, _, _ = play_random_episode(PalaceEnv(), seed=11)
+    assert first == second
+
+
+def test_episode_truncates_at_max_turns():
+    env = PalaceEnv(max_turns=1)
+    _, reward, terminated = play_random_episode(env, seed=3)
+    assert not terminated
+    assert reward == 0.0
+
+
+def test_illegal_action_raises():
+    env = PalaceEnv()
+    _, info = env.reset(seed=5)
+    illegal = info["action_mask"].index(False)
+    with pytest.raises(ValueError):
+        env.step(illegal)
+
+
+def test_learner_can_sit_in_second_seat():
+    env = PalaceEnv(num_players=3, player_index=1)
+    env.reset(seed=2)
+    assert env.game.current_player_index == 1
+
+
+def test_vector_env_auto_resets():
+    venv = VectorPalaceEnv(4, max_turns=50)
+    observations, infos = venv.reset(seed=0)
+    assert len(observations) == 4
+
+    rng = random.Random(0)
+    finished = 0
+    for _ in range(2000):
+        actions = [
+            rng.choice([a for a, ok in enumerate(info["action_mask"]) if ok])
+            for info in infos
+        ]
+        observations, rewards, terminated, truncated, infos = venv.step(actions)
+        for i in range(venv.num_envs):
+            if terminated[i] or truncated[i]:
+                finished += 1
+                assert "final_observation" in infos[i]
+        if finished >= 4:
+            break
+    assert finished >= 4
+
+
+def test_default_rng_objects_pickle_and_copy():
+    game = Game()
+    game.start()
+    for clone in (pickle.loads(pickle.dumps(game)), copy.deepcopy(game)):
+        assert clone.deck.rng is random
+        assert clone.deck.cards == game.deck.cards
+        assert clone.players[0].hand == game.players[0].hand
+    agent = pickle.loads(pickle.dumps(SimpleAIAgent(output_fn=None)))
+    assert agent.rng is random
+
+    seeded = pickle.loads(pickle.dumps(Game(rng=random.Random(3))))
+    assert isinstance(seeded.deck.rng, random.Random)
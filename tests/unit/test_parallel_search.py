@@ -0,0 +1,57 @@
+import random
+
+from agents.parallel_search import RootParallelMonteCarloAgent, _search_worker
+from core.state_codec import SharedStateBuffer
+from tests.helpers import started_game
+
+
+def test_worker_searches_from_shared_state():
+    game = started_game(1)
+    moves = game.get_valid_moves(0)
+    with SharedStateBuffer.for_game(game, num_slots=2) as states:
+        states.write(1, game)
+        visits, rewards, stats = _search_worker((states.layout, 1, game.rules, None, 0, moves, 7, 10.0, 1.4, 50, 25))
+    assert sum(visits) == 25 == stats.iterations
+    assert len(rewards) == len(moves)
+
+
+def test_visit_counts_are_merged_across_workers():
+    game = started_game(2)
+    moves = game.get_valid_moves(0)
+    with RootParallelMonteCarloAgent(game, 0, workers=2, move_time=10, max_iterations=15,
+                                     rollout_limit=40, rng=random.Random(0)) as agent:
+        move = agent.choose_move(game.get_view_for_player(0), moves)
+        assert move in moves
+        assert sum(agent.last_visits) == 30
+        assert agent.last_stats.iterations == 30
+
+
+def test_pool_is_reused_between_decisions():
+    game = started_game(3)
+    moves = game.get_valid_moves(0)
+    agent = RootParallelMonteCarloAgent(game, 0, workers=2, move_time=10, max_iterations=5,
+                                        rollout_limit=20, rng=random.Random(0))
+    try:
+        agent.choose_move(game.get_view_for_player(0), moves)
+        pool = agent._pool
+        pids = sorted(p.pid for p in pool._pool)
+        agent.choose_move(game.get_view_for_player(0), moves)
+        assert agent._pool is pool
+        assert sorted(p.pid for p in pool._pool) == pids
+        assert agent.stats.decisions == 2
+    finally:
+        agent.close()
+    assert agent._pool is None
+    assert agent._states is None
+
+
+def test_deadline_is_respected_from_the_first_decision():
+    game = started_game(4)
+    moves = game.get_valid_moves(0)
+    with RootParallelMonteCarloAgent(game, 0, workers=2, move_time=0.1,
+                                     rng=random.Random(0)) as agent:
+        assert agent.last_visits == []
+        agent.choose_move(game.get_view_for_player(0), moves)
+        assert agent.last_stats.seconds < 0.3
+        agent.choose_move(game.get_view_for_player(0), moves)
+        assert agent.last_stats.seconds < 0.3
@@ -0,0 +1,67 @@
+import random
+import time
+from collections import Counter
+
+from agents.simple_ai_agent import SimpleAIAgent
+from controller.game_controller import GameController
+from core.game import Game
+from sim.batch import run_batch
+from sim.profiling import Sampler, StackProfile
+
+
+def quiet(*args):
+    pass
+
+
+def play_until_sampled(sampler, layers, seconds=5.0):
+    deadline = time.process_time() + seconds
+    seed = 0
+    while time.process_time() < deadline and not layers <= set(sampler.profile.layers):
+        agents = {i: SimpleAIAgent(output_fn=quiet, rng=random.Random(seed + i)) for i in range(2)}
+        GameController(Game(num_players=2, rng=random.Random(seed)), agents, output_fn=quiet).run()
+        seed += 1
+
+
+def test_samples_are_split_by_engine_controller_and_agent():
+    with Sampler(StackProfile(0.0005)) as sampler:
+        play_until_sampled(sampler, {"engine", "controller", "agent"})
+    profile = sampler.profile
+    assert {"engine", "controller", "agent"} <= set(profile.layers)
+    assert profile.samples == sum(profile.stacks.values())
+    assert profile.cpu_seconds > 0
+    root = "tests/unit/test_profiling.py:test_samples_are_split_by_engine_controller_and_agent"
+    assert all(stack.split(";")[0] == root for stack in profile.stacks)
+
+
+def test_profiles_merge_by_adding_counts():
+    a = StackProfile(stacks=Counter({"x;y": 2}), layers=Counter({"engine": 2}), cpu_seconds=0.5)
+    b = StackProfile(stacks=Counter({"x;y": 1, "x": 3}), layers=Counter({"engine": 1, "runner": 3}),
+                     cpu_seconds=0.25)
+    a.merge(b)
+    assert a.stacks == {"x;y": 3, "x": 3}
+    assert a.layers == {"engine": 3, "runner": 3}
+    assert (a.samples, a.cpu_seconds) == (6, 0.75)
+
+
+def test_top_and_collapsed_output(tmp_path):
+    profile = StackProfile(stacks=Counter({"main;play;moves": 5, "main;play": 2, "main;draw": 3}),
+                           layers=Counter({"engine": 10}), cpu_seconds=0.01)
+    assert profile.top(2) == [("moves", 5, 5), ("draw", 3, 3)]
+    assert ("play", 2, 7) in profile.top()
+
+    path = tmp_path / "stacks.txt"
+    profile.write_collapsed(str(path))
+    assert path.read_text().splitlines() == ["main;draw 3", "main;play 2", "main;play;moves 5"]
+    summary = profile.summary(3)
+    assert "engine" in summary and "main;" not in summary
+
+
+def test_batch_profile_is_merged_across_workers():
+    plain = run_batch(40, workers=2, chunk_size=10, max_plies=300)
+    profile = StackProfile(0.0005)
+    profiled = run_batch(40, workers=2, chunk_size=10, max_plies=300, profile=profile)
+    assert profiled.plies == plain.plies and profiled.seat_wins == plain.seat_wins
+
+    assert profile.samples > 0 and profile.layers["engine"] > 0
+    assert all(stack.startswith("sim/batch.py:_batch_range") for stack in profile.stacks)
+    assert profile.cpu_seconds > 0
@@ -0,0 +1,73 @@
+import pickle
+import random
+
+import pytest
+
+from core.game import Game
+from core.models import Card, Move
+from core.rules import RuleSet, STANDARD_RULES
+from core.snapshot import restore, snapshot
+from core.state_codec import decode, encode
+
+
+def game_on(pile, hand, rules=STANDARD_RULES, num_players=3):
+    game = Game(num_players=num_players, rules=rules)
+    game.deck.cards = []
+    game.discard_pile = pile
+    game.players[0].hand = hand
+    for p in game.players[1:]:
+        p.hand = [Card("4", "Clubs", 4)]
+    return game
+
+
+def test_standard_seven_reverses_until_reset():
+    game = game_on([Card("7", "Spades", 7)], [Card("5", "Hearts", 5), Card("6", "Hearts", 6)])
+    game.is_reversed = True
+    game.apply_move(0, Move("play", "hand", 0))
+    assert game.is_reversed
+    assert game.get_valid_moves(0) == [Move("pickup")]  # a 6 on a 5 is still not allowed
+
+
+def test_seven_lasts_one_card():
+    rules = RuleSet(seven_lasts_one_card=True)
+    game = game_on([Card("9", "Spades", 9)], [Card("7", "Hearts", 7), Card("5", "Hearts", 5),
+                                              Card("6", "Hearts", 6)], rules)
+    game.apply_move(0, Move("play", "hand", 0))
+    assert game.is_reversed
+    assert game.get_valid_moves(0) == [Move("play", "hand", 0), Move("play", "hand", 1)]
+    game.apply_move(0, Move("play", "hand", 0))
+    assert not game.is_reversed
+    assert game.get_valid_moves(0) == [Move("play", "hand", 0)]
+
+
+def test_eight_skips_next_player():
+    hand = [Card("8", "Hearts", 8), Card("9", "Hearts", 9)]
+    standard = game_on([], list(hand))
+    standard.apply_move(0, Move("play", "hand", 0))
+    standard.end_turn()
+    assert standard.current_player_index == 1
+
+    skipping = game_on([], list(hand), RuleSet(eight_skips=True))
+    skipping.push_move(Move("play", "hand", 0))
+    assert skipping.current_player_index == 2
+    skipping.pop_move()
+    assert skipping.current_player_index == 0
+
+
+def test_rules_survive_copies():
+    rules = RuleSet(name="skip", eight_skips=True)
+    game = Game(rng=random.Random(0), rules=rules)
+    game.start()
+    assert game.clone().rules is rules
+    assert restore(snapshot(game), rules=rules).rules is rules
+    assert decode(encode(game), rules=rules).rules is rules
+    assert restore(snapshot(game)).rules == STANDARD_RULES
+
+
+def test_from_dict_and_pickle():
+    rules = RuleSet.from_dict({"name": "both", "seven_lasts_one_card": True, "eight_skips": True})
+    assert rules.to_dict() == {"name": "both", "seven_lasts_one_card": True, "eight_skips": True}
+    copy = pickle.loads(pickle.dumps(rules))
+    assert copy == rules and "8" in copy.effects
+    with pytest.raises(ValueError):
+        RuleSet.from_dict({"nine_wild": True})
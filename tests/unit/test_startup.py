@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from core.card_effects import CARD_EFFECTS, SPECIAL_RANKS, get_card_effect
+from core.game import Game
+from core.models import Card
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEAVY = ("agents", "controller", "env", "argparse", "multiprocessing.shared_memory")
+
+
+def loaded_after_import(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in sys.modules if m.split('.')[0] in {HEAVY!r} or m in {HEAVY!r}))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                         text=True, check=True).stdout
+    return out.split()
+
+
+@pytest.mark.parametrize("module", ["core.game", "core.state_codec", "sim.differential", "cli.main"])
+def test_headless_entry_points_import_only_the_engine(module):
+    assert loaded_after_import(module) == []
+
+
+def test_effects_are_shared_singletons():
+    assert get_card_effect("10") is get_card_effect("10") is CARD_EFFECTS["10"]
+    assert get_card_effect("King") is None
+    assert SPECIAL_RANKS == {"2", "3", "7", "10"}
+
+
+def test_special_ranks_play_on_anything():
+    game = Game()
+    game.discard_pile = [Card("Ace", "Spades", 14)]
+    for rank in SPECIAL_RANKS:
+        assert game._is_card_playable(Card(rank, "Hearts", 0))
+    assert not game._is_card_playable(Card("King", "Hearts", 13))
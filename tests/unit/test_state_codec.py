@@ -0,0 +1,112 @@
+import pickle
+import random
+from multiprocessing import Pool
+
+import pytest
+
+from core import state_codec
+from core.game import Game
+from core.models import Card
+from core.snapshot import CARD_BY_CODE, snapshot
+from core.state_codec import SharedStateBuffer, attached_buffer, decode, encode, encode_into, slot_size
+
+
+def played_game(seed, plies=40, num_players=2, **kwargs):
+    rng = random.Random(seed)
+    game = Game(num_players=num_players, rng=random.Random(seed), **kwargs)
+    game.start()
+    for _ in range(plies):
+        if game.is_game_over():
+            break
+        game.push_move(rng.choice(game.get_valid_moves(game.current_player_index)))
+    game._undo_stack.clear()
+    return game
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_trip_matches_snapshot(seed):
+    game = played_game(seed, plies=10 * seed, num_players=2 + seed, lazy_deck=seed % 2 == 1)
+    assert snapshot(decode(encode(game))) == snapshot(game)
+
+
+def test_flags_and_winner_round_trip():
+    game = played_game(1)
+    game.is_reversed = True
+    game.current_player_gets_extra_turn = True
+    game._winner_index = 1
+    copy = decode(encode(game))
+    assert copy.is_reversed and copy.current_player_gets_extra_turn
+    assert copy.get_winner() is copy.players[1]
+
+
+def test_decode_reuses_shared_cards():
+    game = played_game(2)
+    copy = decode(encode(game))
+    for card in copy.players[0].hand + copy.deck.cards:
+        assert any(card is c for c in CARD_BY_CODE)
+
+
+def test_slot_size_fits_a_full_table():
+    game = Game(num_players=4)
+    assert slot_size(4) == len(encode(game))
+    assert len(encode(played_game(3))) <= slot_size(2)
+    assert slot_size(4, num_decks=2) - slot_size(4) == 52
+
+
+def test_encode_into_offset_and_bad_version():
+    game = played_game(4)
+    buf = bytearray(10 + slot_size(2))
+    written = encode_into(game, buf, 10)
+    assert snapshot(decode(buf, 10)) == snapshot(game)
+    assert written == len(encode(game))
+    buf[10] = 99
+    with pytest.raises(ValueError):
+        decode(buf, 10)
+
+
+def test_is_smaller_than_pickle():
+    game = played_game(5)
+    assert len(encode(game)) * 5 < len(pickle.dumps(game))
+
+
+def test_decoded_game_plays_on():
+    game = played_game(6, plies=5)
+    copy = decode(encode(game), rng=random.Random(0))
+    move = copy.get_valid_moves(copy.current_player_index)[0]
+    copy.push_move(move)
+    copy.pop_move()
+    assert snapshot(copy) == snapshot(decode(encode(game)))
+
+
+def test_shared_buffer_slots():
+    games = [played_game(seed) for seed in range(3)]
+    with SharedStateBuffer.for_game(games[0], num_slots=3) as states:
+        for i, game in enumerate(games):
+            states.write(i, game)
+        assert [snapshot(states.read(i)) for i in range(3)] == [snapshot(g) for g in games]
+        assert attached_buffer(*states.layout) is states
+        with pytest.raises(IndexError):
+            states.read(3)
+    assert states.name not in state_codec._owned
+
+
+def _read_in_worker(args):
+    layout, slot = args
+    return snapshot(attached_buffer(*layout).read(slot))
+
+
+def test_workers_read_without_pickling_games():
+    games = [played_game(seed, plies=seed * 7) for seed in range(4)]
+    with SharedStateBuffer.for_game(games[0], num_slots=4) as states:
+        for i, game in enumerate(games):
+            states.write(i, game)
+        with Pool(2) as pool:
+            results = pool.map(_read_in_worker, [(states.layout, i) for i in range(4)])
+    assert results == [snapshot(g) for g in games]
+
+
+def test_big_hands_fit():
+    game = Game()
+    game.deck.cards = []
+    game.players[0].hand = [Card("2", "Hearts", 2)] * 40
+    assert len(decode(encode(game)).players[0].hand) == 40
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from core.game import Game
+from core.models import Card, Move
+from core.snapshot import snapshot
+from sim.differential import run_fuzz
+
+
+def play_and_unwind(seed, lazy_deck=False, plies=300):
+    game = Game(rng=random.Random(seed), lazy_deck=lazy_deck)
+    game.start()
+    rng = random.Random(seed + 1)
+    history = [snapshot(game)]
+
+    for _ in range(plies):
+        if game.is_game_over():
+            break
+        moves = game.get_valid_moves(game.current_player_index)
+        game.push_move(rng.choice(moves))
+        history.append(snapshot(game))
+
+    assert game.undo_depth == len(history) - 1
+    while game.undo_depth:
+        history.pop()
+        game.pop_move()
+        assert snapshot(game) == history[-1]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_unwinding_restores_every_intermediate_state(seed):
+    play_and_unwind(seed)
+
+
+def test_unwinding_with_lazy_deck():
+    play_and_unwind(42, lazy_deck=True)
+
+
+def test_undo_four_of_a_kind_burn():
+    game = Game()
+    game.deck.cards = []
+    sixes = [Card("6", s, 6) for s in ("Spades", "Hearts", "Clubs")]
+    game.discard_pile = list(sixes)
+    game.players[0].hand = [Card("6", "Diamonds", 6), Card("9", "Clubs", 9)]
+    game.players[1].hand = [Card("4", "Clubs", 4)]
+    before = snapshot(game)
+
+    game.push_move(Move("play", "hand", 0))
+    assert game.discard_pile == []
+    game.pop_move()
+    assert snapshot(game) == before
+
+
+def test_undo_pickup_and_failed_face_down():
+    game = Game()
+    game.deck.cards = []
+    game.discard_pile = [Card("King", "Spades", 13)]
+    game.players[0].face_down_cards = [Card("4", "Clubs", 4), Card("Ace", "Hearts", 14)]
+    game.players[1].hand = [Card("5", "Clubs", 5)]
+    before = snapshot(game)
+
+    game.push_move(Move("play", "face_down", 0))
+    assert [c.rank for c in game.players[0].hand] == ["4", "King"]
+    game.pop_move()
+    assert snapshot(game) == before
+
+
+def test_rejected_move_leaves_no_record():
+    game = Game()
+    game.discard_pile = [Card("King", "Spades", 13)]
+    game.players[0].hand = [Card("4", "Clubs", 4)]
+    before = snapshot(game)
+    with pytest.raises(ValueError):
+        game.push_move(Move("play", "hand", 0))
+    assert game.undo_depth == 0
+    assert snapshot(game) == before
+
+
+def test_pop_without_push_raises():
+    with pytest.raises(IndexError):
+        Game().pop_move()
+
+
+def test_undo_engine_agrees_with_reference():
+    assert run_fuzz(30, engine_names=["undo"], max_plies=300).divergences == []
+    assert run_fuzz(15, engine_names=["undo"], max_plies=300, lazy_deck=True).divergences == []
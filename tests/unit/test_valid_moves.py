@@ -0,0 +1,40 @@
+from core.game import Game
+from core.models import Card, Move, STANDARD_CARDS
+
+
+def game_with_hand(hand, top):
+    game = Game()
+    game.deck.cards = []
+    game.players[0].hand = hand
+    game.discard_pile = [top]
+    return game
+
+
+def test_one_move_per_playable_value():
+    hand = [Card("9", s, 9) for s in ("Spades", "Clubs", "Hearts")] + [
+        Card("4", "Spades", 4), Card("Ace", "Clubs", 14), Card("9", "Diamonds", 9),
+    ]
+    game = game_with_hand(hand, Card("8", "Spades", 8))
+    assert game.get_valid_moves(0) == [Move("play", "hand", 0), Move("play", "hand", 4)]
+
+
+def test_big_pickup_hand_is_bounded_by_distinct_values():
+    game = game_with_hand(list(STANDARD_CARDS) * 2, Card("5", "Spades", 5))
+    moves = game.get_valid_moves(0)
+    values = [game.players[0].hand[m.index].value for m in moves]
+    assert len(values) == len(set(values)) == 12  # 5 to Ace, plus the 2 and 3
+    assert all(m.kind == "play" for m in moves)
+
+
+def test_representative_move_still_applies():
+    hand = [Card("King", "Spades", 13), Card("King", "Hearts", 13)]
+    game = game_with_hand(hand, Card("Queen", "Spades", 12))
+    (move,) = game.get_valid_moves(0)
+    game.apply_move(0, move)
+    assert game.players[0].hand == [Card("King", "Hearts", 13)]
+    assert game.discard_pile[-1] == Card("King", "Spades", 13)
+
+
+def test_pickup_when_no_value_is_playable():
+    game = game_with_hand([Card("4", "Spades", 4)] * 20, Card("Ace", "Spades", 14))
+    assert game.get_valid_moves(0) == [Move("pickup")]
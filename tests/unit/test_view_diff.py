@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from core.game import Game
+from core.models import Card, Move
+from tests.helpers import play_random, started_game
+
+
+def card_key(card):
+    return (card.value, card.suit)
+
+
+def same_view(a, b):
+    assert sorted(a.player_view.hand, key=card_key) == sorted(b.player_view.hand, key=card_key)
+    assert sorted(a.player_view.face_up, key=card_key) == sorted(b.player_view.face_up, key=card_key)
+    assert a.player_view.face_down_count == b.player_view.face_down_count
+    for field in ("current_player_name", "deck_remaining", "discard_top_effective",
+                  "discard_pile_size", "is_reversed"):
+        assert getattr(a, field) == getattr(b, field)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_diffs_rebuild_every_view(seed):
+    rng = random.Random(seed)
+    game = started_game(seed, num_players=3)
+    game.track_changes()
+    views = {i: (game.version, game.get_view_for_player(i)) for i in range(3)}
+
+    for _ in range(60):
+        play_random(game, rng, rng.randint(1, 8))
+        i = rng.randrange(3)
+        version, view = views[i]
+        diff = game.diff_since(i, version)
+        assert diff.full is None
+        view = diff.apply_to(view)
+        same_view(view, game.get_view_for_player(i))
+        views[i] = (diff.version, view)
+
+
+def test_diff_is_small_after_a_pickup_and_replay():
+    game = Game()
+    game.deck.cards = []
+    game.players[0].hand = [Card("4", "Spades", 4)]
+    game.discard_pile = [Card("9", "Hearts", 9), Card("Jack", "Clubs", 11)]
+    game.track_changes()
+    start = game.version
+    game.apply_move(0, Move("pickup"))
+    game.apply_move(0, Move("play", "hand", 2))   # the Jack goes straight back
+    diff = game.diff_since(0, start)
+    assert diff.hand_added == [Card("9", "Hearts", 9)]
+    assert diff.hand_removed == []
+    assert diff.discard_pile_size == 1
+
+
+def test_full_view_when_history_is_missing():
+    game = started_game(1)
+    assert game.diff_since(0, 0).full is not None   # not tracking
+
+    game.track_changes(limit=4)
+    start = game.version
+    play_random(game, random.Random(0), 20)
+    diff = game.diff_since(0, start)
+    assert diff.full is not None
+    same_view(diff.apply_to(None), game.get_view_for_player(0))
+    assert game.diff_since(0, game.version + 1).full is not None
+
+
+def test_undo_forces_a_resync():
+    game = started_game(2)
+    game.track_changes()
+    before = game.version
+    game.push_move(game.get_valid_moves(0)[0])
+    after = game.version
+    game.pop_move()
+    assert game.diff_since(0, before).full is not None
+    assert game.diff_since(0, after).full is not None
+    assert game.diff_since(0, game.version).full is None
@@ -0,0 +1,172 @@
+import json
+import random
+import threading
+import time
+
+from agents.web_agent import (
+    WebAgentServer, WebClient, apply_diff, view_diff, view_to_dict,
+)
+from controller.game_controller import GameController
+from core.models import Card
+from tests.helpers import started_game
+
+
+def test_diff_round_trip():
+    game = started_game(0)
+    before = view_to_dict(game.get_view_for_player(0))
+    game.players[0].hand.append(Card("Ace", "Spades", 14))
+    game.players[0].hand.pop(0)
+    game.discard_pile = [Card("9", "Hearts", 9)]
+    after = view_to_dict(game.get_view_for_player(0))
+
+    diff = view_diff(before, after)
+    assert set(diff) == {"hand", "pile", "top"}
+    assert diff["hand"]["add"] == [["Ace", "Spades"]] and len(diff["hand"]["remove"]) == 1
+    assert sorted(apply_diff(before, diff)["hand"]) == sorted(after["hand"])
+    assert view_diff(after, after) == {}
+
+
+def test_updates_within_a_frame_are_coalesced():
+    with WebAgentServer(frame_window=0.05) as server:
+        session = server.session("a")
+        client = WebClient(server.url, "a")
+        client.poll(timeout=0.1)  # full sync
+        for pile in range(1, 6):
+            session.update(pile=pile)
+        state = client.poll(timeout=1)
+        assert state["pile"] == 5
+        assert client.seq == 2
+        # Nothing new: the poll times out with an empty diff
+        assert client.poll(timeout=0.05) == state
+        client.close()
+
+
+def test_lost_messages_trigger_full_resync():
+    with WebAgentServer(frame_window=0) as server:
+        server.session("a").update(deck=10)
+        client = WebClient(server.url, "a")
+        client.poll(timeout=0.1)
+        server.session("a").update(deck=9)
+        client.seq -= 1   # pretend the last reply never arrived
+        client.state = {}
+        assert client.poll(timeout=0.1)["deck"] == 9
+        client.close()
+
+
+def run_bot(client, stop, rng):
+    answered = None
+    while not stop.is_set():
+        state = client.poll(timeout=0.1)
+        if state.get("moves") and state["turn"] != answered:
+            answered = state["turn"]
+            assert client.send_move(rng.randrange(len(state["moves"])))
+
+
+def test_remote_players_across_games_on_one_connection():
+    with WebAgentServer(frame_window=0.001) as server:
+        clients = [WebClient(server.url, f"p{i}") for i in range(2)]
+        for client in clients:
+            server.session(client.client_id)
+        stop = threading.Event()
+        bots = [threading.Thread(target=run_bot, args=(c, stop, random.Random(i)), daemon=True)
+                for i, c in enumerate(clients)]
+        for bot in bots:
+            bot.start()
+        try:
+            sockets = None
+            for game_no in (1, 2):
+                game = started_game(game_no)
+                agents = {i: server.agent(f"p{i}") for i in range(2)}
+                controller = GameController(game, agents, output_fn=lambda m: None)
+                for _ in range(30):
+                    if game.is_game_over():
+                        break
+                    controller.play_turn()
+                time.sleep(0.3)  # let the last observe() reach the clients
+
+                for i, client in enumerate(clients):
+                    expected = view_to_dict(game.get_view_for_player(i))
+                    state = {k: client.state[k] for k in expected}
+                    assert sorted(state.pop("hand")) == sorted(expected.pop("hand"))
+                    assert sorted(state.pop("face_up")) == sorted(expected.pop("face_up"))
+                    assert state == expected
+                    assert client.state["game"] == game_no
+                    assert agents[i].timeouts == 0
+                current = [id(c.conn.sock) for c in clients]
+                assert sockets is None or current == sockets
+                sockets = current
+        finally:
+            stop.set()
+            for bot in bots:
+                bot.join()
+
+        full = len(json.dumps(view_to_dict(game.get_view_for_player(0)), separators=(",", ":")))
+        polls = clients[0].seq
+        assert clients[0].bytes_received / polls < full
+        for client in clients:
+            client.close()
+
+
+def test_bad_moves_are_rejected_and_timeouts_fall_back():
+    with WebAgentServer(frame_window=0, move_timeout=0.1) as server:
+        game = started_game(3)
+        agent = server.agent("a")
+        client = WebClient(server.url, "a")
+        moves = game.get_valid_moves(0)
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(agent.choose_move(game.get_view_for_player(0), moves)))
+        thread.start()
+        state = client.poll(timeout=1)
+        while not state["moves"]:
+            state = client.poll(timeout=1)
+        assert not client.send_move(len(state["moves"]))
+        thread.join()
+        assert result == [moves[0]] and agent.timeouts == 1
+        assert not client.send_move(0)  # that turn is over
+        client.close()
+
+
+def test_client_ids_with_reserved_characters():
+    with WebAgentServer(frame_window=0) as server:
+        for client_id in ("alice bob", "a&b=c", "tom/jerry?#", "zoë"):
+            server.session(client_id).update(deck=len(client_id))
+            client = WebClient(server.url, client_id)
+            assert client.poll(timeout=0.1)["deck"] == len(client_id)
+            client.close()
+
+
+def test_unknown_and_malformed_client_ids_are_refused():
+    with WebAgentServer(frame_window=0) as server:
+        client = WebClient(server.url, "stranger")
+        status, _ = client._request("GET", "/poll?client=stranger&since=-1&timeout=0")
+        assert status == 404
+        assert client._request("POST", "/move", {"client": "stranger", "turn": 1, "move": 0})[0] == 404
+        for bad in (["a"], {"a": 1}, 7):
+            assert client._request("POST", "/move", {"client": bad, "turn": 1, "move": 0})[0] == 400
+        assert server._sessions == {}
+        client.close()
+
+
+class Watcher:
+    def __init__(self):
+        self.views = []
+
+    def choose_move(self, view, valid_moves):
+        return valid_moves[0]
+
+    def observe(self, view):
+        self.views.append(view)
+
+
+def test_skipped_turns_are_broadcast():
+    game = started_game(5)
+    watchers = {0: Watcher(), 1: Watcher()}
+    controller = GameController(game, watchers, output_fn=lambda m: None)
+    player = game.players[game.current_player_index]
+    player.hand, player.face_up_cards, player.face_down_cards = [], [], []
+    before = game.current_player_index
+    controller.play_turn()
+    assert game.current_player_index != before
+    for watcher in watchers.values():
+        assert len(watcher.views) == 1